@@ -0,0 +1,80 @@
+"""Benchmark AzureSpeechManager._process_voices_from_sdk before and after locale memoization.
+
+"before" reproduces the original per-voice BabelLocale.parse; "after" uses the memoized
+lookup (cold = empty memo, warm = memo already filled).
+
+    python benchmarks/bench_process_voices.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from babel import Locale as BabelLocale
+from babel.core import UnknownLocaleError
+from babel.localedata import locale_identifiers
+
+from managers import locale_names
+from managers.azure_speech_manager import AzureSpeechManager
+
+VOICE_COUNT = 500
+LOCALE_COUNT = 150
+ROUNDS = 5
+
+class FakeGender:
+    def __init__(self, name):
+        self.name = name
+
+class FakeVoice:
+    """Stand-in for speechsdk.VoiceInfo"""
+    def __init__(self, index, locale):
+        self.locale = locale
+        self.short_name = f"{locale}-Voice{index}Neural"
+        self.local_name = f"Voice {index}"
+        self.gender = FakeGender("Female" if index % 2 else "Male")
+
+def make_voices():
+    locales = [
+        identifier.replace('_', '-') for identifier in sorted(locale_identifiers())
+        if '_' in identifier and identifier.count('_') == 1
+    ][:LOCALE_COUNT]
+    return [FakeVoice(i, locales[i % len(locales)]) for i in range(VOICE_COUNT)]
+
+def babel_display_name(voice, locale):
+    """Original implementation: parse the locale with Babel for every voice"""
+    try:
+        loc = BabelLocale.parse(locale.replace('-', '_'))
+        return loc.display_name or locale
+    except (UnknownLocaleError, ValueError):
+        return str(locale)
+
+def time_process(manager, voices, reset_memo):
+    best = float("inf")
+    for _ in range(ROUNDS):
+        if reset_memo:
+            locale_names.get_locale_display_name.cache_clear()
+        start = time.perf_counter()
+        manager._process_voices_from_sdk(voices)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def main():
+    voices = make_voices()
+    print(f"{len(voices)} voices, {len({v.locale for v in voices})} locales, "
+          f"prebuilt table: {len(locale_names.LOCALE_DISPLAY_NAMES)} entries")
+
+    before = AzureSpeechManager()
+    before._get_dynamic_language_name = babel_display_name
+    after = AzureSpeechManager()
+
+    results = [
+        ("before (Babel per voice)", time_process(before, voices, reset_memo=False)),
+        ("after, cold memo", time_process(after, voices, reset_memo=True)),
+        ("after, warm memo", time_process(after, voices, reset_memo=False)),
+    ]
+    for name, ms in results:
+        print(f"{name:<26} {ms:9.2f} ms")
+
+if __name__ == "__main__":
+    main()
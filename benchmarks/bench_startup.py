@@ -0,0 +1,77 @@
+"""Measure app startup and fail if it exceeds the budget in startup_budget.json.
+
+Each sample runs in a fresh interpreter and records:
+  import_ms       time to import controllers.main_controller
+  first_frame_ms  time from interpreter start to the navigation view being drawn
+It also checks that provider SDKs are not imported before the first frame.
+
+    python benchmarks/bench_startup.py [--samples N] [--budget PATH]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCH_DIR, "..", "src")
+
+PROBE = r'''
+import json, os, sys, time
+start = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+from controllers.main_controller import MainController
+import_ms = (time.perf_counter() - start) * 1000
+first_frame_ms = None
+if os.environ.get("DISPLAY") or sys.platform in ("darwin", "win32"):
+    import tkinter as tk
+    root = tk.Tk()
+    MainController(root)
+    root.update()
+    first_frame_ms = (time.perf_counter() - start) * 1000
+    root.destroy()
+print(json.dumps({"import_ms": import_ms, "first_frame_ms": first_frame_ms, "modules": sorted(sys.modules)}))
+'''
+
+def run_sample():
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE, os.path.normpath(SRC_DIR)],
+        check=True, capture_output=True, text=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--budget", default=os.path.join(BENCH_DIR, "startup_budget.json"))
+    args = parser.parse_args()
+
+    with open(args.budget, encoding="utf-8") as f:
+        budget = json.load(f)
+
+    samples = [run_sample() for _ in range(args.samples)]
+    failures = []
+
+    for metric in ("import_ms", "first_frame_ms"):
+        values = [s[metric] for s in samples if s[metric] is not None]
+        if not values:
+            print(f"{metric:<16} skipped (no display)")
+            continue
+        median = statistics.median(values)
+        limit = budget[metric]
+        status = "ok" if median <= limit else "OVER BUDGET"
+        print(f"{metric:<16} median {median:8.1f} ms  budget {limit:8.1f} ms  {status}")
+        if median > limit:
+            failures.append(metric)
+
+    loaded = set(samples[0]["modules"])
+    eager = [m for m in budget.get("forbidden_modules", []) if m in loaded]
+    if eager:
+        print(f"modules loaded before first frame: {', '.join(eager)}")
+        failures.append("forbidden_modules")
+
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""Offline benchmark suite for catalog loading, the Polly dropdown cascade, synthesis and startup.
+
+Polly is served by a local HTTP stand-in and Azure by a fake Speech SDK (see fake_providers.py),
+so no credentials or network access are needed. Every benchmark prints one line in a fixed
+order with min/median/max milliseconds; save runs with --json and diff two commits with
+--compare.
+
+    python benchmarks/bench_suite.py [--rounds N] [--latency-ms MS] [--only PREFIX]
+                                     [--json PATH] [--compare PATH]
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, "..", "src"))
+
+from fake_providers import FakePollyServer, install_fake_speechsdk
+
+REGION = 'us-east-1'
+ENGINE = 'neural'
+POLLY_VOICE = 'Voice007'
+AZURE_VOICE = 'en-US-Voice007Neural'
+AZURE_KEY = 'bench-key'
+AZURE_ENDPOINT = 'https://bench.invalid/'
+SHORT_TEXT = "The quick brown fox jumps over the lazy dog."
+# Long enough to be split into several requests
+LONG_TEXT = " ".join(f"Sentence number {i} of the long benchmark text." for i in range(400))
+
+class FakeWidget(dict):
+    """Dropdown stand-in supporting widget['values'] = ..."""
+
+class FakeMainView:
+    def __init__(self):
+        for name in ('region_dropdown', 'engine_dropdown', 'language_dropdown', 'voice_dropdown',
+                     'format_dropdown', 'sample_rate_dropdown'):
+            setattr(self, name, FakeWidget(values=()))
+
+class FakeStatusBar:
+    def update_status(self, message, is_error=False):
+        self.message = message
+
+def measure(func, rounds, setup=None):
+    """Run func rounds times after one warm-up call; returns milliseconds per round"""
+    if setup:
+        setup()
+    func()
+    samples = []
+    for _ in range(rounds):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+class BenchmarkSuite:
+    """Builds the app's managers and controllers against the fakes and times them"""
+    def __init__(self, rounds, latency):
+        self.rounds = rounds
+        self.latency = latency
+        self.results = {}
+
+        # Keep snapshots and caches out of the user's real cache directory
+        self.cache_dir = tempfile.mkdtemp(prefix="tts-bench-")
+        os.environ['XDG_CACHE_HOME'] = self.cache_dir
+        os.environ['PYTHON_KEYRING_BACKEND'] = 'keyring.backends.null.Keyring'
+
+        self.polly_server = FakePollyServer(latency=latency).start()
+        os.environ['AWS_ENDPOINT_URL_POLLY'] = self.polly_server.endpoint_url
+        install_fake_speechsdk(latency=latency)
+
+    def close(self):
+        self.polly_server.stop()
+
+    def run(self, name, func, setup=None):
+        self.results[name] = measure(func, self.rounds, setup)
+
+    def run_startup(self):
+        from bench_startup import run_sample
+        samples = [run_sample()['import_ms'] for _ in range(self.rounds)]
+        self.results['startup.import'] = samples
+
+    def _polly_manager(self):
+        from managers.aws_polly_manager import AWSPollyManager
+        from managers.credentials import AWSCredentials
+        return AWSPollyManager(AWSCredentials('AKIABENCHMARK', 'bench-secret'))
+
+    def run_polly(self):
+        manager = self._polly_manager()
+
+        self.run('polly.catalog.describe_voices',
+                 lambda: manager.get_languages(REGION, ENGINE),
+                 setup=manager.invalidate_voice_catalog)
+        self.run('polly.synthesize.single',
+                 lambda: manager.synthesize_speech_bytes(REGION, SHORT_TEXT, POLLY_VOICE, ENGINE, 'mp3', '24000'))
+        self.run('polly.synthesize.chunked',
+                 lambda: manager.synthesize_speech_bytes(REGION, LONG_TEXT, POLLY_VOICE, ENGINE, 'mp3', '24000'))
+
+    def _polly_controller(self):
+        import tkinter as tk
+        from controllers.polly_controller import PollyController
+        from managers.credentials import AWSCredentials
+        from managers.synthesis_job_queue import SynthesisJobQueue
+
+        # A Tcl interpreter is enough for Tk variables and after(); no display needed
+        root = tk.Tcl()
+        tk._default_root = root
+        controller = PollyController(root, FakeStatusBar(), job_queue=SynthesisJobQueue(root))
+        controller.polly_manager.set_credentials(AWSCredentials('AKIABENCHMARK', 'bench-secret'))
+        controller.main_ui = FakeMainView()
+        controller.region_var.set(REGION)
+        return controller
+
+    def run_polly_cascade(self):
+        controller = self._polly_controller()
+        manager = controller.polly_manager
+        section = controller._voices_section(REGION, ENGINE)
+        snapshot_path = controller.catalog_store._path('polly', controller._catalog_account_id())
+
+        def from_network():
+            # Nothing in memory and nothing on disk, as on the very first launch
+            manager.invalidate_voice_catalog()
+            controller._catalog_ages.clear()
+            controller._revalidated_sections.discard(section)
+            if os.path.exists(snapshot_path):
+                os.unlink(snapshot_path)
+
+        def from_snapshot():
+            # Served from disk; the background revalidation is suppressed so it cannot skew timings
+            manager.invalidate_voice_catalog()
+            controller._catalog_ages.clear()
+            controller._revalidated_sections.add(section)
+
+        self.run('polly.cascade.network', controller.update_engines_for_region, setup=from_network)
+        controller.update_engines_for_region()
+        self.run('polly.cascade.snapshot', controller.update_engines_for_region, setup=from_snapshot)
+        self.run('polly.cascade.memory', controller.update_engines_for_region)
+        controller.job_queue.cancel_all()
+
+    def run_azure(self):
+        from managers.azure_speech_manager import AzureSpeechManager
+        manager = AzureSpeechManager()
+
+        def load_catalog():
+            manager.load_voice_records(manager.fetch_voice_records(AZURE_KEY, AZURE_ENDPOINT))
+
+        def stream_first_chunk():
+            stream = manager.synthesize_to_stream(SHORT_TEXT, AZURE_KEY, AZURE_ENDPOINT, AZURE_VOICE)
+            chunks = stream.iter_chunks()
+            next(chunks)
+            chunks.close()
+
+        self.run('azure.catalog.voices', load_catalog)
+        self.run('azure.synthesize.single',
+                 lambda: manager.synthesize_to_bytes(SHORT_TEXT, AZURE_KEY, AZURE_ENDPOINT, AZURE_VOICE))
+        self.run('azure.synthesize.chunked',
+                 lambda: manager.synthesize_long_text(LONG_TEXT, AZURE_KEY, AZURE_ENDPOINT, AZURE_VOICE))
+        self.run('azure.stream.first_chunk', stream_first_chunk)
+
+    def run_all(self, only=None):
+        # Each group with the name prefixes of the benchmarks it produces
+        groups = [
+            (('startup.',), self.run_startup),
+            (('polly.catalog.', 'polly.synthesize.'), self.run_polly),
+            (('polly.cascade.',), self.run_polly_cascade),
+            (('azure.',), self.run_azure),
+        ]
+        for prefixes, func in groups:
+            if not only or any(p.startswith(only) or only.startswith(p) for p in prefixes):
+                func()
+        if only:
+            self.results = {k: v for k, v in self.results.items() if k.startswith(only)}
+
+def summarize(results):
+    return {
+        name: {
+            'rounds': len(samples),
+            'min_ms': round(min(samples), 3),
+            'median_ms': round(statistics.median(samples), 3),
+            'max_ms': round(max(samples), 3)
+        }
+        for name, samples in sorted(results.items())
+    }
+
+def print_summary(summary, baseline=None):
+    header = f"{'benchmark':<32} {'rounds':>6} {'min ms':>10} {'median ms':>10} {'max ms':>10}"
+    if baseline is not None:
+        header += f" {'baseline':>10} {'change':>8}"
+    print(header)
+    for name, row in summary.items():
+        line = f"{name:<32} {row['rounds']:>6} {row['min_ms']:>10.2f} {row['median_ms']:>10.2f} {row['max_ms']:>10.2f}"
+        if baseline is not None:
+            previous = baseline.get(name)
+            if previous and previous['median_ms']:
+                change = (row['median_ms'] - previous['median_ms']) / previous['median_ms'] * 100
+                line += f" {previous['median_ms']:>10.2f} {change:>+7.1f}%"
+            else:
+                line += f" {'-':>10} {'-':>8}"
+        print(line)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="Fake service latency before the first byte")
+    parser.add_argument("--only", help="Run only benchmarks whose name starts with this prefix")
+    parser.add_argument("--json", help="Write the summary to this file")
+    parser.add_argument("--compare", help="Summary JSON from an earlier run to compare medians against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)['results']
+
+    suite = BenchmarkSuite(args.rounds, args.latency_ms / 1000)
+    try:
+        suite.run_all(args.only)
+    finally:
+        suite.close()
+
+    summary = summarize(suite.results)
+    print(f"# rounds={args.rounds} latency_ms={args.latency_ms:g}")
+    print_summary(summary, baseline)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({'rounds': args.rounds, 'latency_ms': args.latency_ms, 'results': summary},
+                      f, indent=2, sort_keys=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+"""Local stand-ins for Amazon Polly and the Azure Speech SDK used by the benchmarks.
+
+FakePollyServer speaks the subset of the Polly REST API the app uses (DescribeVoices and
+SynthesizeSpeech), so boto3, botocore and the connection pool run unchanged; point boto3 at
+it with AWS_ENDPOINT_URL_POLLY. install_fake_speechsdk() registers a module under
+azure.cognitiveservices.speech that returns canned audio, and must run before any
+managers.azure_* import.
+
+Both fakes add a fixed latency before the first byte so network-bound code paths can be
+compared without a real service. All generated data is deterministic.
+"""
+import ctypes
+import enum
+import json
+import os
+import sys
+import threading
+import time
+import types
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from managers.audio_assembler import build_wav_header
+
+# Roughly what a 24 kHz MP3 needs for one character of speech
+AUDIO_BYTES_PER_CHAR = 400
+
+LANGUAGES = [
+    ("arb", "Arabic"), ("cmn-CN", "Chinese Mandarin"), ("da-DK", "Danish"), ("nl-NL", "Dutch"),
+    ("en-AU", "Australian English"), ("en-GB", "British English"), ("en-IN", "Indian English"),
+    ("en-US", "US English"), ("fr-CA", "Canadian French"), ("fr-FR", "French"), ("de-DE", "German"),
+    ("hi-IN", "Hindi"), ("it-IT", "Italian"), ("ja-JP", "Japanese"), ("ko-KR", "Korean"),
+    ("nb-NO", "Norwegian"), ("pl-PL", "Polish"), ("pt-BR", "Brazilian Portuguese"),
+    ("pt-PT", "Portuguese"), ("es-ES", "Castilian Spanish"), ("es-MX", "Mexican Spanish"),
+    ("es-US", "US Spanish"), ("sv-SE", "Swedish"), ("tr-TR", "Turkish")
+]
+
+def make_polly_voices(count=100):
+    """Polly DescribeVoices entries spread over LANGUAGES"""
+    voices = []
+    for i in range(count):
+        code, name = LANGUAGES[i % len(LANGUAGES)]
+        voices.append({
+            'Gender': "Female" if i % 2 else "Male",
+            'Id': f"Voice{i:03d}",
+            'LanguageCode': code,
+            'LanguageName': name,
+            'Name': f"Voice{i:03d}",
+            'SupportedEngines': ['standard', 'neural', 'long-form', 'generative']
+        })
+    return voices
+
+class _PollyRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; without this Nagle adds ~40 ms per response
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path != '/v1/voices':
+            self._send(404, b'{}', 'application/json')
+            return
+        time.sleep(self.server.latency)
+        voices = self.server.voices
+        page_size = self.server.page_size
+        start = int(parse_qs(url.query).get('NextToken', ['0'])[0])
+        payload = {'Voices': voices[start:start + page_size]}
+        if start + page_size < len(voices):
+            payload['NextToken'] = str(start + page_size)
+        self._send(200, json.dumps(payload).encode('utf-8'), 'application/json')
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        request = json.loads(self.rfile.read(length).decode('utf-8') or '{}')
+        if self.path != '/v1/speech':
+            self._send(404, b'{}', 'application/json')
+            return
+        time.sleep(self.server.latency)
+        text = request.get('Text', '')
+        self.server.record_request(len(text))
+        self._send(200, bytes(len(text) * AUDIO_BYTES_PER_CHAR), 'audio/mpeg',
+                   {'x-amzn-RequestCharacters': str(len(text))})
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class FakePollyServer(ThreadingHTTPServer):
+    """Polly REST endpoint on 127.0.0.1 with canned voices and silent audio"""
+    daemon_threads = True
+
+    def __init__(self, latency=0.02, voice_count=100, page_size=50):
+        super().__init__(('127.0.0.1', 0), _PollyRequestHandler)
+        self.latency = latency
+        self.voices = make_polly_voices(voice_count)
+        self.page_size = page_size
+        self.synthesize_requests = 0
+        self.synthesized_characters = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def endpoint_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def record_request(self, characters):
+        with self._lock:
+            self.synthesize_requests += 1
+            self.synthesized_characters += characters
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+# --- Azure Speech SDK ---
+
+class ResultReason(enum.Enum):
+    SynthesizingAudioStarted = 1
+    SynthesizingAudioCompleted = 2
+    VoicesListRetrieved = 3
+    Canceled = 4
+
+class StreamStatus(enum.Enum):
+    NoData = 0
+    PartialData = 1
+    AllData = 2
+    Canceled = 3
+
+class SynthesisVoiceGender(enum.Enum):
+    Unknown = 0
+    Female = 1
+    Male = 2
+
+class _OutputFormats:
+    """Any SpeechSynthesisOutputFormat member resolves to its own name"""
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return name
+
+class _Future:
+    def __init__(self, func):
+        self._func = func
+
+    def get(self):
+        return self._func()
+
+class _StartedFuture:
+    """Runs func on its own thread right away, like the SDK's ResultFuture"""
+    def __init__(self, func):
+        self._result = None
+        self._thread = threading.Thread(target=self._run, args=(func,), daemon=True)
+        self._thread.start()
+
+    def _run(self, func):
+        self._result = func()
+
+    def get(self):
+        self._thread.join()
+        return self._result
+
+class _EventSignal:
+    def __init__(self):
+        self._callbacks = []
+
+    def connect(self, callback):
+        self._callbacks.append(callback)
+
+    def signal(self, result):
+        event = types.SimpleNamespace(result=result)
+        for callback in list(self._callbacks):
+            callback(event)
+
+class SpeechConfig:
+    def __init__(self, subscription=None, endpoint=None, region=None):
+        self.subscription = subscription
+        self.endpoint = endpoint
+        self.speech_synthesis_voice_name = None
+        self.output_format = "Riff24Khz16BitMonoPcm"
+
+    def set_speech_synthesis_output_format(self, output_format):
+        self.output_format = output_format
+
+class _VoiceInfo:
+    def __init__(self, index, locale):
+        self.locale = locale
+        self.short_name = f"{locale}-Voice{index:03d}Neural"
+        self.local_name = f"Voice {index:03d}"
+        self.gender = SynthesisVoiceGender.Female if index % 2 else SynthesisVoiceGender.Male
+
+class _Result:
+    def __init__(self, reason, audio_data=b'', voices=None):
+        self.reason = reason
+        self.audio_data = audio_data
+        self.voices = voices or []
+        self.error_details = None
+        self.cancellation_details = None
+
+class SpeechSynthesizer:
+    latency = 0.02
+    voice_count = 500
+
+    def __init__(self, speech_config=None, audio_config=None):
+        self.speech_config = speech_config
+        self.synthesis_completed = _EventSignal()
+        self.synthesis_canceled = _EventSignal()
+
+    def _audio_for(self, text):
+        output_format = self.speech_config.output_format
+        pcm = bytes(len(text) * AUDIO_BYTES_PER_CHAR)
+        if output_format.startswith('Riff'):
+            return build_wav_header(len(pcm), 24000) + pcm
+        return pcm
+
+    def _synthesize(self, text):
+        time.sleep(self.latency)
+        return _Result(ResultReason.SynthesizingAudioCompleted, self._audio_for(text))
+
+    def speak_text_async(self, text):
+        def run():
+            result = self._synthesize(text)
+            self.synthesis_completed.signal(result)
+            return result
+        return _StartedFuture(run)
+
+    def start_speaking_text_async(self, text):
+        return _Future(lambda: self._synthesize(text))
+
+    def get_voices_async(self, locale=""):
+        def fetch():
+            time.sleep(self.latency)
+            locales = [code for code, _ in LANGUAGES if '-' in code]
+            voices = [_VoiceInfo(i, locales[i % len(locales)]) for i in range(self.voice_count)]
+            return _Result(ResultReason.VoicesListRetrieved, voices=voices)
+        return _Future(fetch)
+
+class Connection:
+    @classmethod
+    def from_speech_synthesizer(cls, synthesizer):
+        return cls()
+
+    def open(self, for_continuous_recognition):
+        pass
+
+    def close(self):
+        pass
+
+class AudioDataStream:
+    def __init__(self, result):
+        self._data = result.audio_data
+        self._offset = 0
+        self.status = StreamStatus.PartialData
+
+    def read_data(self, buffer):
+        filled = min(len(buffer), len(self._data) - self._offset)
+        # Like the real SDK, write straight into the caller's (immutable) bytes buffer
+        address = ctypes.cast(ctypes.c_char_p(buffer), ctypes.c_void_p).value
+        ctypes.memmove(address, self._data[self._offset:self._offset + filled], filled)
+        self._offset += filled
+        if not filled:
+            self.status = StreamStatus.AllData
+        return filled
+
+def install_fake_speechsdk(latency=0.02, voice_count=500):
+    """Register the fake SDK as azure.cognitiveservices.speech and return it"""
+    if 'managers.azure_speech_manager' in sys.modules:
+        raise RuntimeError("install_fake_speechsdk() must run before the Azure managers are imported")
+    SpeechSynthesizer.latency = latency
+    SpeechSynthesizer.voice_count = voice_count
+
+    module = types.ModuleType('azure.cognitiveservices.speech')
+    for name in ('ResultReason', 'StreamStatus', 'SynthesisVoiceGender', 'SpeechConfig',
+                 'SpeechSynthesizer', 'Connection', 'AudioDataStream'):
+        setattr(module, name, globals()[name])
+    module.SpeechSynthesisOutputFormat = _OutputFormats()
+
+    parent = types.ModuleType('azure.cognitiveservices')
+    parent.speech = module
+    sys.modules['azure.cognitiveservices'] = parent
+    sys.modules['azure.cognitiveservices.speech'] = module
+    return module
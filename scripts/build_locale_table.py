@@ -0,0 +1,37 @@
+"""Generate src/managers/locale_table.py with display names for every Babel locale.
+
+Run before packaging so the app only imports Babel for locales missing from the table:
+
+    python scripts/build_locale_table.py
+"""
+import os
+import pprint
+
+from babel import Locale
+from babel.localedata import locale_identifiers
+
+OUTPUT_PATH = os.path.join(os.path.dirname(__file__), "..", "src", "managers", "locale_table.py")
+
+def build_table():
+    """Map Azure-style locale codes (en-US) to Babel display names"""
+    table = {}
+    for identifier in locale_identifiers():
+        try:
+            display_name = Locale.parse(identifier).display_name
+        except (ValueError, LookupError):
+            continue
+        if display_name:
+            table[identifier.replace('_', '-')] = display_name
+    return table
+
+def main():
+    table = build_table()
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        f.write("# Generated by scripts/build_locale_table.py - do not edit\n")
+        f.write("LOCALE_DISPLAY_NAMES = ")
+        f.write(pprint.pformat(table, width=100))
+        f.write("\n")
+    print(f"Wrote {len(table)} locales to {os.path.normpath(OUTPUT_PATH)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,261 @@
+"""Headless batch synthesis through the same managers the Tk app uses.
+
+Examples:
+    python src/cli.py --provider polly --voice Joanna --input texts/ --output-dir out/
+    python src/cli.py --provider azure --voice en-US-AvaNeural --input prompts.jsonl --workers 8
+    python src/cli.py --provider azure --voice en-US-AvaNeural --input prompts.jsonl --async --workers 200
+
+Input is either a directory of .txt files (one request per file, named after the file)
+or a JSONL file with one {"id": ..., "text": ...} object per line.
+
+With --async, requests run on one asyncio event loop through managers.async_providers,
+with --workers as the number of requests in flight, instead of one thread per worker.
+
+Credentials come from AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY or
+AZURE_SPEECH_KEY / AZURE_SPEECH_ENDPOINT, falling back to the credentials saved by the app.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+POLLY_EXTENSIONS = {'mp3': 'mp3', 'ogg_vorbis': 'ogg', 'pcm': 'pcm'}
+
+def _safe_name(value):
+    """Filesystem-safe version of a request id"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', str(value)).strip('._') or "item"
+
+def load_requests(input_path):
+    """Return [(request_id, text)] from a directory of .txt files or a JSONL file"""
+    requests = []
+    if os.path.isdir(input_path):
+        for name in sorted(os.listdir(input_path)):
+            if name.lower().endswith('.txt'):
+                with open(os.path.join(input_path, name), encoding='utf-8') as f:
+                    requests.append((os.path.splitext(name)[0], f.read().strip()))
+    else:
+        with open(input_path, encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                request_id = record.get('id', f"{line_number:05d}")
+                requests.append((str(request_id), record['text'].strip()))
+
+    # Deterministic, collision-free output names; a suffixed name may itself be another request's id,
+    # and names are compared case-insensitively for Windows and macOS filesystems
+    used = set()
+    unique = []
+    for request_id, text in requests:
+        base = name = _safe_name(request_id)
+        suffix = 1
+        while name.lower() in used:
+            suffix += 1
+            name = f"{base}_{suffix}"
+        used.add(name.lower())
+        unique.append((name, text))
+    return [(name, text) for name, text in unique if text]
+
+def build_polly_synthesizer(args):
+    from managers.aws_auth_manager import AWSAuthenticationManager
+    from managers.aws_client_pool import AWSClientPool
+    from managers.aws_polly_manager import AWSPollyManager
+    from managers.credentials import AWSCredentials
+
+    credentials = AWSCredentials.from_environment() or AWSAuthenticationManager().load_credentials()
+    if not credentials:
+        raise SystemExit("AWS credentials not found in the environment or keyring")
+
+    # Each worker may fan out chunked requests, so size the HTTP pool accordingly
+    client_pool = AWSClientPool(max_pool_connections=max(args.workers * 4, 10))
+    polly_manager = AWSPollyManager(credentials, client_pool)
+    output_format = args.format or 'mp3'
+    if output_format not in polly_manager.OUTPUT_FORMATS:
+        raise SystemExit(f"Unsupported Polly format: {output_format}")
+    sample_rate = args.sample_rate or polly_manager.get_sample_rates(output_format)[-1]
+
+    if args.use_async:
+        from managers.async_providers import AsyncPollyProvider
+        provider = AsyncPollyProvider(polly_manager, args.region, args.engine, max_concurrency=args.workers)
+
+        async def synthesize(text):
+            return await provider.synthesize(text, args.voice, output_format, sample_rate=sample_rate)
+    else:
+        def synthesize(text):
+            return polly_manager.synthesize_speech_bytes(
+                args.region, text, args.voice, args.engine, output_format, sample_rate
+            )
+
+    return synthesize, POLLY_EXTENSIONS.get(output_format, output_format)
+
+def build_azure_synthesizer(args):
+    from managers.azure_auth_manager import AzureAuthenticationManager
+    from managers.azure_speech_manager import AzureSpeechManager
+    from managers.credentials import AzureCredentials
+
+    credentials = AzureCredentials.from_environment() or AzureAuthenticationManager().load_credentials()
+    if not credentials:
+        raise SystemExit("Azure credentials not found in the environment or keyring")
+
+    tts_manager = AzureSpeechManager()
+    output_format = args.format or 'mp3'
+    try:
+        sdk_output_format = tts_manager.get_sdk_output_format(output_format, args.sample_rate or "24000")
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if args.use_async:
+        from managers.async_providers import AsyncAzureProvider
+        provider = AsyncAzureProvider(tts_manager, credentials, max_concurrency=args.workers)
+
+        async def synthesize(text):
+            return await provider.synthesize(text, args.voice, sdk_output_format)
+    else:
+        def synthesize(text):
+            return tts_manager.synthesize_long_text(
+                text, credentials.api_key, credentials.endpoint, args.voice, output_format=sdk_output_format
+            )
+
+    return synthesize, tts_manager.OUTPUT_EXTENSIONS[output_format]
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def _write_output(output_path, audio_data):
+    tmp_path = output_path + ".part"
+    with open(tmp_path, 'wb') as f:
+        f.write(audio_data)
+    os.replace(tmp_path, output_path)
+
+def _report_result(name, text, result=None, error=None):
+    if error is not None:
+        print(f"[error] {name}: {error}", file=sys.stderr)
+        return name, text, None, None, error
+    status = "skipped" if result[2] is None else f"{result[2] * 1000:.0f} ms"
+    print(f"[ok] {name} ({status})")
+    return result
+
+def run_batch(requests, synthesize, extension, output_dir, workers, skip_existing=False):
+    """Synthesize every request with a worker pool; returns (results, wall_time)"""
+    os.makedirs(output_dir, exist_ok=True)
+
+    def process(name, text):
+        output_path = os.path.join(output_dir, f"{name}.{extension}")
+        if skip_existing and os.path.exists(output_path):
+            return name, text, None, output_path, None
+        start = time.perf_counter()
+        audio_data = synthesize(text)
+        latency = time.perf_counter() - start
+        _write_output(output_path, audio_data)
+        return name, text, latency, output_path, None
+
+    results = []
+    wall_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(process, name, text): (name, text) for name, text in requests}
+        for future in as_completed(futures):
+            name, text = futures[future]
+            try:
+                results.append(_report_result(name, text, future.result()))
+            except Exception as e:
+                results.append(_report_result(name, text, error=e))
+    return results, time.perf_counter() - wall_start
+
+async def run_batch_async(requests, synthesize, extension, output_dir, concurrency, skip_existing=False):
+    """Synthesize every request on the event loop with at most concurrency in flight;
+    synthesize is a coroutine function. Returns (results, wall_time)."""
+    os.makedirs(output_dir, exist_ok=True)
+    semaphore = asyncio.Semaphore(concurrency)
+    results = []
+
+    async def process(name, text):
+        output_path = os.path.join(output_dir, f"{name}.{extension}")
+        if skip_existing and os.path.exists(output_path):
+            results.append(_report_result(name, text, (name, text, None, output_path, None)))
+            return
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                audio_data = await synthesize(text)
+                latency = time.perf_counter() - start
+                _write_output(output_path, audio_data)
+            except Exception as e:
+                results.append(_report_result(name, text, error=e))
+                return
+        results.append(_report_result(name, text, (name, text, latency, output_path, None)))
+
+    wall_start = time.perf_counter()
+    await asyncio.gather(*(process(name, text) for name, text in requests))
+    return results, time.perf_counter() - wall_start
+
+def print_report(results, wall_time):
+    """Print throughput and latency percentiles"""
+    completed = [r for r in results if r[4] is None and r[2] is not None]
+    failed = [r for r in results if r[4] is not None]
+    skipped = len(results) - len(completed) - len(failed)
+    latencies = sorted(r[2] * 1000 for r in completed)
+    characters = sum(len(r[1]) for r in completed)
+
+    print()
+    print(f"Requests:    {len(completed)} ok, {len(failed)} failed, {skipped} skipped")
+    print(f"Wall time:   {wall_time:.2f} s")
+    if wall_time > 0:
+        print(f"Throughput:  {len(completed) / wall_time:.2f} requests/s, {characters / wall_time:.0f} characters/s")
+    if latencies:
+        print("Latency:     " + ", ".join(
+            f"p{pct} {percentile(latencies, pct):.0f} ms" for pct in (50, 90, 95, 99)
+        ) + f", max {latencies[-1]:.0f} ms")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch text-to-speech without the GUI")
+    parser.add_argument('--provider', choices=['polly', 'azure'], required=True)
+    parser.add_argument('--input', required=True, help="Directory of .txt files or a JSONL file")
+    parser.add_argument('--output-dir', default="tts_output")
+    parser.add_argument('--voice', required=True, help="Polly voice id or Azure voice short name")
+    parser.add_argument('--workers', type=int, default=4,
+                        help="Worker threads, or requests in flight with --async")
+    parser.add_argument('--async', dest='use_async', action='store_true',
+                        help="Run requests on an asyncio event loop instead of a thread per worker")
+    parser.add_argument('--skip-existing', action='store_true', help="Skip requests whose output exists")
+    parser.add_argument('--region', default='us-east-1', help="Polly region")
+    parser.add_argument('--engine', default='neural', help="Polly engine")
+    parser.add_argument('--format', help="Output format: mp3, ogg_vorbis or pcm for Polly; "
+                                          "mp3, ogg_opus, wav or pcm for Azure (default mp3)")
+    parser.add_argument('--sample-rate', help="Sample rate (defaults to the highest for Polly, 24000 for Azure)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    requests = load_requests(args.input)
+    if not requests:
+        raise SystemExit(f"No texts found in {args.input}")
+
+    if args.provider == 'polly':
+        synthesize, extension = build_polly_synthesizer(args)
+    else:
+        synthesize, extension = build_azure_synthesizer(args)
+
+    if args.use_async:
+        print(f"Synthesizing {len(requests)} request(s) with up to {args.workers} in flight (asyncio)...")
+        results, wall_time = asyncio.run(run_batch_async(
+            requests, synthesize, extension, args.output_dir, args.workers, args.skip_existing
+        ))
+    else:
+        print(f"Synthesizing {len(requests)} request(s) with {args.workers} worker(s)...")
+        results, wall_time = run_batch(
+            requests, synthesize, extension, args.output_dir, args.workers, args.skip_existing
+        )
+    print_report(results, wall_time)
+    return 1 if any(r[4] is not None for r in results) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,19 +1,45 @@
 import os
 import platform
 import subprocess
+import tempfile
+import time
 import tkinter as tk
 from tkinter import messagebox
 from views.azure_main_view import AzureMainView
 from views.azure_auth_view import AzureAuthView
+from managers.audio_assembler import build_wav_header
+from managers.audio_streamer import AudioStreamer, PlayerProcessSink, get_stream_player_command
 from managers.azure_auth_manager import AzureAuthenticationManager
 from managers.azure_speech_manager import AzureSpeechManager
+from managers.catalog_snapshot import CatalogSnapshotStore
+from managers.credentials import AzureCredentials
+from managers.daemon_client import DaemonClient, DaemonServerError, DaemonUnavailableError
+from managers.incremental_synthesis import IncrementalSynthesizer
+from managers.play_queue import PlayQueue
+from managers.speculative_synthesis import SpeculativeSynthesizer
+from managers.synthesis_cache import SynthesisCache
+from managers.synthesis_job_queue import SynthesisJobQueue
+from managers.synthesis_metrics import (
+    STAGE_FILE_WRITE, STAGE_FIRST_AUDIO, STAGE_PLAYER_LAUNCH, STAGE_TOTAL, SynthesisMetrics
+)
+from managers.text_analysis import EMPTY_TEXT_ANALYSIS, analyze_text_length, format_text_analysis
+from managers.voice_preview import VoicePreviewCache
 
 class AzureController:
     """Controller for Azure TTS functionality"""
-    def __init__(self, main_frame, status_bar, main_controller=None):
+    def __init__(self, main_frame, status_bar, main_controller=None, job_queue=None, synthesis_cache=None,
+                 daemon_client=None, synthesis_metrics=None, playback_engine=None):
         self.main_frame = main_frame
         self.status_bar = status_bar
         self.main_controller = main_controller
+        self.job_queue = job_queue or SynthesisJobQueue(main_frame)
+        self.synthesis_cache = synthesis_cache or SynthesisCache()
+        self.daemon_client = daemon_client or DaemonClient()
+        self.synthesis_metrics = synthesis_metrics or SynthesisMetrics()
+        # Shared in-process player; without one each clip is played by a new player process
+        self.playback_engine = playback_engine
+        # Prompts played back to back, prefetching the next few while one plays
+        self.play_queue = PlayQueue(playback_engine) if playback_engine is not None else None
         
         # Initialize variables
         self.api_key_var = tk.StringVar()
@@ -21,20 +47,39 @@ class AzureController:
         self.language_var = tk.StringVar()
         self.voice_var = tk.StringVar()
         self.gender_var = tk.StringVar(value="All")
-        self.char_count_var = tk.StringVar(value="0/3000")
-        self.remaining_chars = 3000
+        self.output_format_var = tk.StringVar(value="mp3")
+        self.sample_rate_var = tk.StringVar(value="24000")
+        self.stream_playback_var = tk.BooleanVar(value=True)
+        self.lookahead_var = tk.IntVar(value=PlayQueue.DEFAULT_LOOKAHEAD)
+        self.presynthesize_var = tk.BooleanVar(value=False)
+        self.char_count_var = tk.StringVar(value=EMPTY_TEXT_ANALYSIS)
         
         # Initialize authentication manager
-        self.auth_manager = AzureAuthenticationManager(self.api_key_var, self.endpoint_var)
+        self.auth_manager = AzureAuthenticationManager()
         
         # Initialize TTS manager
-        self.tts_manager = AzureSpeechManager()
+        self.tts_manager = AzureSpeechManager(metrics=self.synthesis_metrics)
+        # Generate & Save re-synthesizes only the segments an edit touched
+        self.incremental_synthesizer = IncrementalSynthesizer(self.tts_manager.MAX_REQUEST_CHARS)
+        self.voice_preview_cache = VoicePreviewCache()
+        # Opt-in: synthesize the text once it is idle so Generate & Play starts from the cache
+        self.speculative_synthesizer = SpeculativeSynthesizer(main_frame, self.job_queue, self.synthesis_cache)
+        for var in (self.voice_var, self.presynthesize_var):
+            var.trace_add('write', self._on_synthesis_input_changed)
         
         # Try to load saved credentials
-        self.auth_manager.load_credentials()
+        saved_credentials = self.auth_manager.load_credentials()
+        if saved_credentials:
+            self.api_key_var.set(saved_credentials.api_key)
+            self.endpoint_var.set(saved_credentials.endpoint)
         
         # Dynamic voice data will be managed by TTS manager
         self.voices_loaded = False
+        
+        # Voice list persisted per endpoint, served at startup and refreshed in the background
+        self.catalog_store = CatalogSnapshotStore()
+        self._catalog_age = None
+        self._catalog_revalidated = False
 
     def show_navigation(self):
         """Navigate back to main navigation screen"""
@@ -43,6 +88,10 @@ class AzureController:
         else:
             self.update_status("Navigation not available", is_error=True)
 
+    def _get_credentials(self):
+        """Snapshot the credential Tk variables into an immutable AzureCredentials"""
+        return AzureCredentials(self.api_key_var.get().strip(), self.endpoint_var.get().strip())
+
     def show_azure_interface(self):
         """Show the Azure TTS interface"""
         if self.api_key_var.get() and self.endpoint_var.get():
@@ -54,6 +103,7 @@ class AzureController:
         """Show the main Azure TTS interface"""
         self.clear_frame()
         self.azure_ui = AzureMainView(self.main_frame, self)
+        self.update_output_formats()
         self.update_languages()
         self.status_bar.update_status("Azure Speech Services ready")
 
@@ -72,17 +122,44 @@ class AzureController:
         """Clear all widgets from main frame"""
         for widget in self.main_frame.winfo_children():
             widget.destroy()
-        self.char_count_var.set("0/3000")
+        self.reset_text_analysis()
+        self.speculative_synthesizer.cancel()
+
+    def reset_text_analysis(self):
+        self.char_count_var.set(EMPTY_TEXT_ANALYSIS)
 
     def update_char_count(self, event=None):
-        """Update character count display"""
-        if hasattr(self, 'azure_ui'):
-            text = self.azure_ui.text_input.get("1.0", tk.END)
-            char_count = len(text.strip())
-            remaining = max(0, self.remaining_chars - char_count)
-            self.char_count_var.set(f"{char_count}/{self.remaining_chars}")
-            if remaining < 100:
-                self.azure_ui.char_count_label.config(foreground="red")
+        """Show billed characters, requests, duration and cost from the widget's tracked count"""
+        try:
+            analysis = analyze_text_length(
+                self.azure_ui.text_input.billed_char_count(),
+                self.tts_manager.MAX_REQUEST_CHARS,
+                self.tts_manager.PRICE_PER_MILLION_CHARS
+            )
+            self.char_count_var.set(format_text_analysis(analysis))
+        except (AttributeError, tk.TclError):
+            # Text widget not shown
+            return
+        self._on_synthesis_input_changed()
+
+    def _on_synthesis_input_changed(self, *args):
+        """Cancel stale speculative synthesis and restart its debounce timer"""
+        self.speculative_synthesizer.enabled = self.presynthesize_var.get()
+        self.speculative_synthesizer.schedule(self._speculative_request)
+
+    def _speculative_request(self):
+        """What Generate & Play would synthesize right now, or None if inputs are incomplete"""
+        try:
+            text = self.azure_ui.text_input.get("1.0", tk.END).strip()
+        except (AttributeError, tk.TclError):
+            return None
+        api_key = self.api_key_var.get()
+        endpoint = self.endpoint_var.get()
+        if not text or not api_key or not endpoint or not self.voice_var.get():
+            return None
+        voice_short_name = self._get_voice_short_name(self.voice_var.get())
+        key = self._cache_key(text, voice_short_name, self.tts_manager.DEFAULT_OUTPUT_FORMAT)
+        return key, len(text), lambda job: self._synthesize_cached(job, text, api_key, endpoint, voice_short_name)
 
     def fetch_available_voices(self):
         """Fetch available voices using Azure TTS Manager"""
@@ -112,17 +189,85 @@ class AzureController:
             self.update_status(f"Error fetching voices: {str(e)}", is_error=True)
             return False
 
+    def _catalog_account_id(self):
+        """Snapshot key for the current endpoint and subscription (hashed)"""
+        return CatalogSnapshotStore.make_account_id(self.endpoint_var.get(), self.api_key_var.get())
+
+    def _load_voice_snapshot(self):
+        """Load voices saved by a previous launch; returns True if a snapshot was used"""
+        snapshot = self.catalog_store.load('azure', self._catalog_account_id(), 'voices')
+        if not snapshot:
+            return False
+        self.tts_manager.load_voice_records(snapshot.value)
+        self.voices_loaded = True
+        self._catalog_age = snapshot.format_age()
+        return True
+
+    def refresh_catalog(self, force=True):
+        """Re-fetch the voice list in the background, updating dropdowns only if it changed"""
+        if self._catalog_revalidated and not force:
+            return
+        self._catalog_revalidated = True
+        if force:
+            self.update_status("Refreshing voice catalog...")
+        self.job_queue.submit(
+            self._refresh_catalog_job,
+            self._catalog_account_id(),
+            self.api_key_var.get(),
+            self.endpoint_var.get(),
+            on_success=self._on_catalog_refreshed,
+            on_error=self._on_catalog_refresh_error,
+            description="Azure voice catalog"
+        )
+
+    def _refresh_catalog_job(self, job, account_id, api_key, endpoint):
+        """Fetch and persist the voice list; runs on a worker thread"""
+        records = self.tts_manager.fetch_voice_records(api_key, endpoint)
+        job.check_cancelled()
+        _, changed = self.catalog_store.save('azure', account_id, 'voices', records)
+        return records, changed
+
+    def _on_catalog_refreshed(self, result):
+        records, changed = result
+        self._catalog_age = None
+        if not changed:
+            self.update_status("Voice catalog is up to date")
+            return
+        
+        selected_language = self.language_var.get()
+        selected_voice = self.voice_var.get()
+        self.tts_manager.load_voice_records(records)
+        try:
+            self.update_languages()
+            # Keep the user's selection when it is still offered
+            if selected_language in self.azure_ui.language_dropdown['values']:
+                self.language_var.set(selected_language)
+                self.update_voices()
+                if selected_voice in self.azure_ui.voice_dropdown['values']:
+                    self.voice_var.set(selected_voice)
+            self.update_status("Voice catalog updated")
+        except Exception as e:
+            # The view may have been closed while the refresh was running
+            print(f"Error applying Azure voice catalog: {e}")
+
+    def _on_catalog_refresh_error(self, error):
+        self._catalog_revalidated = False
+        print(f"Error refreshing Azure voice catalog: {error}")
+
     def update_languages(self, event=None):
         """Update available languages"""
         try:
-            if not self.voices_loaded:
-                # Try to fetch voices if not already loaded
+            if not self.voices_loaded and not self._load_voice_snapshot():
+                # No saved catalog: fetch voices now
                 if not self.fetch_available_voices():
                     # If fetching fails, show error and return
                     if hasattr(self, 'azure_ui'):
                         self.azure_ui.language_dropdown['values'] = []
                         self.azure_ui.voice_dropdown['values'] = []
                     return
+                self._catalog_revalidated = True
+                self.catalog_store.save('azure', self._catalog_account_id(), 'voices',
+                                        self.tts_manager.available_voices)
             
             # Get list of available languages from TTS manager
             languages = self.tts_manager.get_languages()
@@ -135,8 +280,12 @@ class AzureController:
                     default_lang = next((lang for lang in languages if 'English (United States)' in lang), languages[0])
                     self.language_var.set(default_lang)
                     self.update_voices()
-                
-            self.update_status(f"Loaded {len(languages)} languages")
+            
+            if self._catalog_age:
+                self.update_status(f"Loaded {len(languages)} languages (voice catalog from {self._catalog_age}, checking for updates)")
+                self.refresh_catalog(force=False)
+            else:
+                self.update_status(f"Loaded {len(languages)} languages")
             
         except Exception as e:
             self.update_status(f"Error updating languages: {str(e)}", is_error=True)
@@ -152,24 +301,15 @@ class AzureController:
                     self.azure_ui.voice_dropdown['values'] = []
                 return
                 
-            # Get voices for selected language from TTS manager
-            voice_displays = self.tts_manager.get_voices_for_language(selected_lang)
-            
-            # Filter by gender if not "All"
-            if selected_gender != "All":
-                filtered_voices = []
-                for voice_display in voice_displays:
-                    voice_short_name = self.tts_manager.get_voice_short_name(voice_display, selected_lang)
-                    voice_gender = self.tts_manager.get_voice_gender(voice_short_name)
-                    if voice_gender and voice_gender.lower() == selected_gender.lower():
-                        filtered_voices.append(voice_display)
-                voice_displays = filtered_voices
+            # Get voices for selected language and gender from the TTS manager's index
+            voice_displays = self.tts_manager.get_voices_by_gender(selected_lang, selected_gender)
             
             if hasattr(self, 'azure_ui'):
                 self.azure_ui.voice_dropdown['values'] = voice_displays
             
             if voice_displays:
                 self.voice_var.set(voice_displays[0])
+                self.on_voice_selected()
             else:
                 self.voice_var.set("")
                 
@@ -179,6 +319,54 @@ class AzureController:
         except Exception as e:
             self.update_status(f"Error updating voices: {str(e)}", is_error=True)
 
+    def on_voice_selected(self, event=None):
+        """Pre-open a synthesizer connection for the selected voice in the background"""
+        voice_display = self.voice_var.get()
+        if not voice_display or not self.api_key_var.get() or not self.endpoint_var.get():
+            return
+        
+        self.job_queue.submit(
+            self._preconnect_job,
+            self.api_key_var.get(),
+            self.endpoint_var.get(),
+            self._get_voice_short_name(voice_display),
+            description="Azure preconnect"
+        )
+
+    def _preconnect_job(self, job, api_key, endpoint, voice_short_name):
+        """Open a pooled connection for a voice; runs on a worker thread"""
+        try:
+            self.tts_manager.preconnect(api_key, endpoint, voice_short_name)
+        except Exception as e:
+            # Pre-connecting is only an optimization; synthesis will connect on demand
+            print(f"Error pre-connecting Azure voice {voice_short_name}: {e}")
+
+    def update_output_formats(self, event=None):
+        """Populate output formats and their sample rates"""
+        try:
+            self.azure_ui.format_dropdown['values'] = self.tts_manager.OUTPUT_FORMATS
+            if self.output_format_var.get() not in self.tts_manager.OUTPUT_FORMATS:
+                self.output_format_var.set('mp3')
+            self.update_sample_rates()
+        except Exception as e:
+            self.update_status(f"Error updating formats: {str(e)}", is_error=True)
+
+    def update_sample_rates(self, event=None):
+        """Update available sample rates for the selected output format"""
+        try:
+            rates = self.tts_manager.get_sample_rates(self.output_format_var.get())
+            self.azure_ui.sample_rate_dropdown['values'] = rates
+            
+            # Keep the current rate if the new format supports it, otherwise prefer 24 kHz
+            if self.sample_rate_var.get() not in rates:
+                self.sample_rate_var.set("24000" if "24000" in rates else rates[-1])
+        except Exception as e:
+            self.update_status(f"Error updating sample rates: {str(e)}", is_error=True)
+
+    def _get_sdk_output_format(self):
+        """SpeechSynthesisOutputFormat name for the selected format and sample rate"""
+        return self.tts_manager.get_sdk_output_format(self.output_format_var.get(), self.sample_rate_var.get())
+
     def update_gender_filter(self, event=None):
         """Update voices when gender filter changes"""
         self.update_voices()
@@ -198,10 +386,9 @@ class AzureController:
 
     def verify_and_continue(self):
         """Verify Azure credentials and continue"""
-        api_key = self.api_key_var.get().strip()
-        endpoint = self.endpoint_var.get().strip()
+        credentials = self._get_credentials()
         
-        if not api_key or not endpoint:
+        if not credentials.is_complete():
             self.update_status("Both API Key and Endpoint are required", is_error=True)
             messagebox.showerror("Error", "Both Subscription Key and Endpoint are required")
             return
@@ -210,13 +397,17 @@ class AzureController:
             self.update_status("Verifying Azure credentials...")
             self.main_frame.master.update()
             
-            if self.tts_manager.test_credentials(api_key, endpoint):
+            # Synthesizers connected with previous credentials must not be reused
+            self.tts_manager.invalidate_synthesizers()
+            self._catalog_revalidated = False
+            
+            if self.tts_manager.test_credentials(credentials.api_key, credentials.endpoint):
                 self.update_status("Credentials verified successfully!")
                 
                 # Save credentials if remember me is checked
                 if hasattr(self, 'azure_auth_ui'):
                     remember = self.azure_auth_ui.remember_var.get()
-                    self.auth_manager.save_credentials(remember)
+                    self.auth_manager.save_credentials(credentials, remember)
                 
                 self._show_azure_main_interface()
             else:
@@ -256,29 +447,106 @@ class AzureController:
             return
         
         try:
-            self.update_status("Generating audio...")
-            self.main_frame.master.update()
-            
             voice_short_name = self._get_voice_short_name(self.voice_var.get())
-            output_path = self.tts_manager.generate_output_filename(voice_short_name)
+            output_format = self._get_sdk_output_format()
+            output_path = self.tts_manager.generate_output_filename(
+                voice_short_name, output_format=output_format
+            )
             
-            success, message = self.tts_manager.synthesize_to_file(
+            self.update_status("Generating audio...")
+            self.job_queue.submit(
+                self._generate_and_save_job,
                 text,
                 self.api_key_var.get(),
                 self.endpoint_var.get(),
                 voice_short_name,
-                output_path
+                output_path,
+                output_format,
+                on_success=self._on_generate_and_save_done,
+                on_error=self._on_synthesis_error,
+                description="Azure generate"
             )
-            
-            if success:
-                self.update_status(message)
-                self._open_file_location(output_path)
-            else:
-                self.update_status(message, is_error=True)
                 
         except Exception as e:
             self.update_status(f"Error: {str(e)}", is_error=True)
 
+    def _cache_key(self, text, voice_short_name, output_format):
+        return self.synthesis_cache.make_key('azure', voice_short_name, None, output_format, None, text)
+
+    def _synthesize_cached(self, job, text, api_key, endpoint, voice_short_name, output_format=None):
+        """Return audio from the synthesis cache, synthesizing on a miss"""
+        output_format = output_format or self.tts_manager.DEFAULT_OUTPUT_FORMAT
+        key = self._cache_key(text, voice_short_name, output_format)
+        self.speculative_synthesizer.wait_for(key, job)
+        audio_data = self.synthesis_cache.get(key)
+        if audio_data is None:
+            audio_data = self._synthesize_uncached(job, text, api_key, endpoint, voice_short_name, output_format)
+            self.synthesis_cache.put(key, audio_data)
+        return audio_data
+
+    def _synthesize_uncached(self, job, text, api_key, endpoint, voice_short_name, output_format):
+        """Synthesize through the local daemon when one is running, otherwise in-process"""
+        if self.daemon_client.is_available():
+            try:
+                audio_data, _ = self.daemon_client.synthesize(
+                    'azure',
+                    text,
+                    voice_short_name,
+                    output_format,
+                    credentials=AzureCredentials(api_key, endpoint),
+                    cancel_check=job.check_cancelled
+                )
+                return audio_data
+            except (DaemonUnavailableError, DaemonServerError) as e:
+                print(f"{e}; synthesizing locally")
+        return self.tts_manager.synthesize_long_text(
+            text, api_key, endpoint, voice_short_name,
+            cancel_check=job.check_cancelled, output_format=output_format
+        )
+
+    def _update_cache_stats(self):
+        self.status_bar.update_cache_stats(self.synthesis_cache.format_stats())
+
+    def _generate_and_save_job(self, job, text, api_key, endpoint, voice_short_name, output_path, output_format):
+        """Synthesize (or load from cache) and save to file; runs on a worker thread"""
+        started_at = time.perf_counter()
+        key = self._cache_key(text, voice_short_name, output_format)
+        audio_data = self.synthesis_cache.get(key)
+        summary = "from cache"
+        if audio_data is None:
+            audio_data, stats = self._synthesize_incremental(job, text, api_key, endpoint, voice_short_name,
+                                                             output_format)
+            self.synthesis_cache.put(key, audio_data)
+            summary = IncrementalSynthesizer.format_stats(stats)
+        job.check_cancelled()
+        with self.synthesis_metrics.stage('azure', voice_short_name, STAGE_FILE_WRITE):
+            with open(output_path, 'wb') as f:
+                f.write(audio_data)
+        self.synthesis_metrics.record('azure', voice_short_name, STAGE_TOTAL, time.perf_counter() - started_at)
+        return output_path, summary
+
+    def _synthesize_incremental(self, job, text, api_key, endpoint, voice_short_name, output_format):
+        """Synthesize text in sentence-group segments, reusing segments unchanged since the last
+        document saved with the same voice and format; runs on a worker thread"""
+        return self.incremental_synthesizer.synthesize(
+            text,
+            (voice_short_name, output_format),
+            self.tts_manager.get_container_format(output_format),
+            lambda segment: self._synthesize_uncached(job, segment, api_key, endpoint, voice_short_name,
+                                                      output_format),
+            cancel_check=job.check_cancelled
+        )
+
+    def _on_generate_and_save_done(self, result):
+        output_path, summary = result
+        self._update_cache_stats()
+        self.update_status(f"Audio saved to: {output_path} ({summary})")
+        self._open_file_location(output_path)
+
+    def _on_synthesis_error(self, error, prefix="Error"):
+        self._update_cache_stats()
+        self.update_status(f"{prefix}: {str(error)}", is_error=True)
+
     def play_audio_directly(self):
         """Generate and play audio without saving"""
         text = self._validate_synthesis_inputs()
@@ -286,26 +554,234 @@ class AzureController:
             return
         
         try:
-            self.update_status("Generating and playing...")
-            self.main_frame.master.update()
-            
             voice_short_name = self._get_voice_short_name(self.voice_var.get())
+            if self._use_playback_engine():
+                player_command = None
+            else:
+                player_command = get_stream_player_command('pcm', self.tts_manager.STREAM_SAMPLE_RATE)
+            
+            # Without the playback engine or a player that reads stdin, fall back to a temporary WAV file
+            if self.stream_playback_var.get() and (player_command is not None or self._use_playback_engine()):
+                job_func, job_args = self._stream_play_job, (player_command,)
+            else:
+                job_func, job_args = self._play_job, ()
             
-            success, tmp_path, message = self.tts_manager.synthesize_to_temp_file(
+            self.update_status("Generating...")
+            self.job_queue.submit(
+                job_func,
                 text,
                 self.api_key_var.get(),
                 self.endpoint_var.get(),
-                voice_short_name
+                voice_short_name,
+                *job_args,
+                on_success=self._on_play_done,
+                on_error=lambda e: self._on_synthesis_error(e, "Playback error"),
+                description="Azure play"
             )
-            
-            if success:
-                self._play_audio_file(tmp_path)
-                self.update_status("Audio played successfully")
-            else:
-                self.update_status(message, is_error=True)
-                
         except Exception as e:
-            self.update_status(f"Playback error: {str(e)}", is_error=True)
+            self.update_status(f"Error: {str(e)}", is_error=True)
+
+    def _stream_play_job(self, job, text, api_key, endpoint, voice_short_name, player_command):
+        """Pipe audio into the player as the SDK produces it, without a file on disk; runs on a worker thread"""
+        started_at = time.perf_counter()
+        # Streamed audio is stored as the default RIFF WAV so buffered playback can reuse it
+        key = self._cache_key(text, voice_short_name, self.tts_manager.DEFAULT_OUTPUT_FORMAT)
+        with self.synthesis_metrics.stage('azure', voice_short_name, STAGE_PLAYER_LAUNCH):
+            if player_command is None:
+                sink = self.playback_engine.open_stream()
+            else:
+                sink = PlayerProcessSink(player_command)
+        job.add_cancel_callback(sink.terminate)
+        
+        self.speculative_synthesizer.wait_for(key, job)
+        cached = self.synthesis_cache.get(key)
+        if cached is not None:
+            sink.write(cached)
+            time_to_first_audio = time.perf_counter() - started_at
+            self.synthesis_metrics.record('azure', voice_short_name, STAGE_FIRST_AUDIO, time_to_first_audio)
+            sink.close()
+            job.check_cancelled()
+            return {'time_to_first_audio': time_to_first_audio, 'streamed': False, 'engine': player_command is None}
+        
+        audio_stream = self.tts_manager.synthesize_to_stream(
+            text, api_key, endpoint, voice_short_name, cancel_check=job.check_cancelled
+        )
+        pcm_chunks = []
+        stats = AudioStreamer().stream(
+            audio_stream,
+            sink,
+            'pcm',
+            audio_stream.sample_rate,
+            started_at=started_at,
+            cancel_check=job.check_cancelled,
+            on_chunk=pcm_chunks.append
+        )
+        job.check_cancelled()
+        
+        pcm_data = b''.join(pcm_chunks)
+        self.synthesis_cache.put(key, build_wav_header(len(pcm_data), audio_stream.sample_rate) + pcm_data)
+        if stats['time_to_first_audio'] is not None:
+            self.synthesis_metrics.record('azure', voice_short_name, STAGE_FIRST_AUDIO, stats['time_to_first_audio'])
+        stats['streamed'] = True
+        stats['engine'] = player_command is None
+        return stats
+
+    def _play_job(self, job, text, api_key, endpoint, voice_short_name):
+        """Synthesize (or load from cache) and play through the playback engine, or from a
+        temp file without one; runs on a worker thread"""
+        started_at = time.perf_counter()
+        audio_data = self._synthesize_cached(job, text, api_key, endpoint, voice_short_name)
+        job.check_cancelled()
+        return self._play_bytes(job, voice_short_name, audio_data, started_at)
+
+    def _play_bytes(self, job, voice_short_name, audio_data, started_at):
+        """Hand RIFF WAV audio to the playback engine, or write it to a temp file and play that;
+        runs on a worker thread"""
+        if self._use_playback_engine():
+            sink = self.playback_engine.open_stream()
+            job.add_cancel_callback(sink.terminate)
+            stats = {'time_to_first_audio': time.perf_counter() - started_at, 'streamed': False, 'engine': True}
+            self.synthesis_metrics.record('azure', voice_short_name, STAGE_FIRST_AUDIO, stats['time_to_first_audio'])
+            # Blocks only while a clip longer than the engine's buffer is queued
+            sink.write(audio_data)
+            sink.close()
+            return stats
+        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
+            tmp_file.write(audio_data)
+            tmp_path = tmp_file.name
+        stats = {'time_to_first_audio': time.perf_counter() - started_at, 'streamed': False}
+        self.synthesis_metrics.record('azure', voice_short_name, STAGE_FIRST_AUDIO, stats['time_to_first_audio'])
+        self._play_audio_file(tmp_path, job, voice_short_name)
+        return stats
+
+    def _on_play_done(self, stats):
+        """Report playback completion (or, with the playback engine, buffering) with time-to-first-audio"""
+        self._update_cache_stats()
+        ttfa = stats.get('time_to_first_audio')
+        mode = "streamed" if stats.get('streamed') else "buffered"
+        done = "Playing" if stats.get('engine') else "Audio played successfully"
+        if ttfa is not None:
+            self.update_status(f"{done} ({mode}, first audio after {ttfa * 1000:.0f} ms)")
+        else:
+            self.update_status(done)
+
+    def _use_playback_engine(self):
+        return self.playback_engine is not None and self.playback_engine.is_available()
+
+    def add_to_play_queue(self):
+        """Queue the current text with the current voice"""
+        text = self._validate_synthesis_inputs()
+        if not text:
+            return
+        
+        api_key = self.api_key_var.get()
+        endpoint = self.endpoint_var.get()
+        voice_short_name = self._get_voice_short_name(self.voice_var.get())
+        label = f"{voice_short_name}: {' '.join(text.split())[:40]}"
+        # Queued items are synthesized as RIFF WAV, which carries its own sample rate
+        self.play_queue.add(
+            label, lambda job: self._synthesize_cached(job, text, api_key, endpoint, voice_short_name)
+        )
+        self.update_status(f"Added to play queue ({len(self.play_queue)} items)")
+
+    def start_play_queue(self, start_index=0):
+        """Play the queue from start_index, synthesizing the look-ahead items in the background"""
+        if not self._use_playback_engine():
+            self.update_status("Play queue needs an audio output device.", is_error=True)
+            return
+        if not len(self.play_queue):
+            self.update_status("Play queue is empty.", is_error=True)
+            return
+        self.update_lookahead()
+        self.play_queue.play(start_index)
+        self.update_status("Playing queue")
+
+    def update_lookahead(self):
+        try:
+            self.play_queue.set_lookahead(self.lookahead_var.get())
+        except (tk.TclError, ValueError):
+            pass
+
+    def stop_play_queue(self):
+        self.play_queue.stop()
+        self.update_status("Play queue stopped")
+
+    def clear_play_queue(self):
+        self.play_queue.clear()
+        self.update_status("Play queue cleared")
+
+    def _voice_preview_ready(self):
+        if not self.api_key_var.get() or not self.endpoint_var.get():
+            self.update_status("Azure configuration is incomplete.", is_error=True)
+            return False
+        return True
+
+    def preview_voice(self):
+        """Play the sample sentence in the selected voice, synthesizing it only on first use"""
+        if not self.voice_var.get():
+            self.update_status("Please select a voice.", is_error=True)
+            return
+        if not self._voice_preview_ready():
+            return
+        
+        voice_short_name = self._get_voice_short_name(self.voice_var.get())
+        self.update_status(f"Previewing {voice_short_name}...")
+        self.job_queue.submit(
+            self._preview_job,
+            self.api_key_var.get(),
+            self.endpoint_var.get(),
+            voice_short_name,
+            on_success=self._on_play_done,
+            on_error=lambda e: self._on_synthesis_error(e, "Preview error"),
+            description="Azure voice preview"
+        )
+
+    def _preview_job(self, job, api_key, endpoint, voice_short_name):
+        started_at = time.perf_counter()
+        audio_data = self.voice_preview_cache.get(
+            'azure', voice_short_name, None,
+            lambda text: self.tts_manager.synthesize_to_bytes(text, api_key, endpoint, voice_short_name)
+        )
+        job.check_cancelled()
+        return self._play_bytes(job, voice_short_name, audio_data, started_at)
+
+    def prefetch_voice_previews(self):
+        """Fetch previews for every voice of the selected language in parallel"""
+        selected_lang = self.language_var.get()
+        if not selected_lang:
+            self.update_status("Please select a language.", is_error=True)
+            return
+        if not self._voice_preview_ready():
+            return
+        
+        voice_short_names = [self._get_voice_short_name(display)
+                             for display in self.tts_manager.get_voices_for_language(selected_lang)]
+        self.update_status(f"Fetching previews for {len(voice_short_names)} voices...")
+        self.job_queue.submit(
+            self._prefetch_previews_job,
+            self.api_key_var.get(),
+            self.endpoint_var.get(),
+            voice_short_names,
+            on_success=lambda result: self.update_status(VoicePreviewCache.format_result(result), is_error=bool(result[2])),
+            on_error=lambda e: self._on_synthesis_error(e, "Preview error"),
+            description="Azure preview prefetch"
+        )
+
+    def _prefetch_previews_job(self, job, api_key, endpoint, voice_short_names):
+        return self.voice_preview_cache.prefetch(
+            'azure', voice_short_names, None,
+            lambda voice_short_name, text: self.tts_manager.synthesize_to_bytes(text, api_key, endpoint, voice_short_name),
+            cancel_check=job.check_cancelled
+        )
+
+    def cancel_jobs(self):
+        """Cancel all queued and in-flight synthesis/playback jobs"""
+        cancelled = self.job_queue.cancel_all()
+        if self.play_queue is not None:
+            # Play queue prefetches run on the queue's own executor, outside the job queue
+            was_playing = self.play_queue.is_playing()
+            cancelled += self.play_queue.stop() + int(was_playing)
+        self.update_status(f"Cancelled {cancelled} job(s)" if cancelled else "Nothing to cancel")
 
     def _open_file_location(self, file_path):
         """Open file location in system file manager"""
@@ -317,16 +793,25 @@ class AzureController:
         elif system == "Linux":
             subprocess.run(["xdg-open", os.path.dirname(file_path)])
 
-    def _play_audio_file(self, file_path):
-        """Play audio file using system player"""
+    def _play_audio_file(self, file_path, job=None, voice_short_name=None):
+        """Play audio file using system player; cancelling the job stops playback"""
         system = platform.system()
         try:
+            launch_started_at = time.perf_counter()
             if system == "Darwin":  # macOS
-                subprocess.run(["afplay", file_path])
+                process = subprocess.Popen(["afplay", file_path])
             elif system == "Windows":
-                subprocess.run(["start", file_path], shell=True)
+                process = subprocess.Popen(["start", file_path], shell=True)
             elif system == "Linux":
-                subprocess.run(["aplay", file_path])
+                process = subprocess.Popen(["aplay", file_path])
+            else:
+                return
+            self.synthesis_metrics.record('azure', voice_short_name, STAGE_PLAYER_LAUNCH, time.perf_counter() - launch_started_at)
+            if job:
+                job.add_cancel_callback(process.terminate)
+            process.wait()
+            if job:
+                job.check_cancelled()
         finally:
             # Clean up temp file
             try:
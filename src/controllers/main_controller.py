@@ -1,10 +1,14 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 
 from views.main_view import MainNavigationView
+from views.metrics_view import MetricsView
 from views.widget.status_bar import StatusBar
-from controllers.polly_controller import PollyController
-from controllers.azure_controller import AzureController
+from managers.daemon_client import DaemonClient
+from managers.playback_engine import PlaybackEngine
+from managers.synthesis_cache import SynthesisCache
+from managers.synthesis_job_queue import SynthesisJobQueue
+from managers.synthesis_metrics import StageHistogram, SynthesisMetrics
 
 class MainController:
     """Main controller for the TTS application navigation and coordination"""
@@ -21,13 +25,48 @@ class MainController:
         self.status_bar = StatusBar(root)
         self.status_bar.pack(fill="x", side="bottom", pady=(0, 0))
         
-        # Initialize controllers
-        self.polly_controller = PollyController(self.main_frame, self.status_bar, self)
-        self.azure_controller = AzureController(self.main_frame, self.status_bar, self)
+        # Background synthesis/playback jobs shared by all providers
+        self.job_queue = SynthesisJobQueue(root)
+        self.synthesis_cache = SynthesisCache()
+        self.synthesis_metrics = SynthesisMetrics()
+        self.metrics_view = None
+        
+        # One long-lived player shared by all providers; the output device is opened on first use
+        self.playback_engine = PlaybackEngine()
+        
+        # Synthesis goes through a local daemon (src/daemon.py) whenever one is running
+        self.daemon_client = DaemonClient()
+        
+        # Provider controllers are created on first use so boto3, the Azure Speech SDK
+        # and keyring are not loaded before the navigation screen is drawn
+        self._polly_controller = None
+        self._azure_controller = None
         
         # Always start with navigation screen
         self.show_navigation()
 
+    @property
+    def polly_controller(self):
+        """Polly controller, imported and created on first access"""
+        if self._polly_controller is None:
+            from controllers.polly_controller import PollyController
+            self._polly_controller = PollyController(
+                self.main_frame, self.status_bar, self, self.job_queue, self.synthesis_cache,
+                self.daemon_client, self.synthesis_metrics, self.playback_engine
+            )
+        return self._polly_controller
+
+    @property
+    def azure_controller(self):
+        """Azure controller, imported and created on first access"""
+        if self._azure_controller is None:
+            from controllers.azure_controller import AzureController
+            self._azure_controller = AzureController(
+                self.main_frame, self.status_bar, self, self.job_queue, self.synthesis_cache,
+                self.daemon_client, self.synthesis_metrics, self.playback_engine
+            )
+        return self._azure_controller
+
     def show_navigation(self):
         """Show the main navigation screen"""
         self.clear_frame()
@@ -68,6 +107,40 @@ class MainController:
         if hasattr(self, 'navigation_view') and self.navigation_view.winfo_exists():
             self.navigation_view.azure_btn.config(state=tk.NORMAL)
 
+    def show_metrics(self):
+        """Show per-stage synthesis latency histograms for this session"""
+        self.clear_frame()
+        self.metrics_view = MetricsView(self.main_frame, self)
+        self.refresh_metrics()
+
+    def metrics_bucket_bounds(self):
+        return StageHistogram.BUCKET_BOUNDS_MS
+
+    def refresh_metrics(self):
+        rows = self.synthesis_metrics.get_rows()
+        if self.metrics_view and self.metrics_view.winfo_exists():
+            self.metrics_view.show_rows(rows)
+        self.update_status(f"{len(rows)} metric series recorded" if rows else "No synthesis metrics recorded yet")
+
+    def export_metrics(self):
+        """Save the metrics as JSON for offline analysis"""
+        path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json")],
+            initialfile="tts_metrics.json"
+        )
+        if not path:
+            return
+        try:
+            self.synthesis_metrics.export_json(path)
+            self.update_status(f"Metrics exported to: {path}")
+        except OSError as e:
+            self.update_status(f"Error exporting metrics: {str(e)}", is_error=True)
+
+    def reset_metrics(self):
+        self.synthesis_metrics.reset()
+        self.refresh_metrics()
+
     def update_status(self, message, is_error=False):
         """Update status bar with message"""
         self.status_bar.update_status(message, is_error)
@@ -1,22 +1,47 @@
 import subprocess
 import platform
 import tempfile
+import time
 import tkinter as tk
 from tkinter import messagebox
 from datetime import datetime
 import os
 
 from managers.aws_auth_manager import AWSAuthenticationManager
+from managers.audio_assembler import build_wav_header
+from managers.audio_streamer import AudioStreamer, PlayerProcessSink, get_stream_player_command
 from managers.aws_polly_manager import AWSPollyManager
+from managers.catalog_snapshot import CatalogSnapshotStore
+from managers.credentials import AWSCredentials
+from managers.daemon_client import DaemonClient, DaemonServerError, DaemonUnavailableError
+from managers.incremental_synthesis import IncrementalSynthesizer
+from managers.play_queue import PlayQueue
+from managers.speculative_synthesis import SpeculativeSynthesizer
+from managers.synthesis_cache import SynthesisCache
+from managers.synthesis_job_queue import SynthesisJobQueue
+from managers.synthesis_metrics import (
+    STAGE_FILE_WRITE, STAGE_FIRST_AUDIO, STAGE_PLAYER_LAUNCH, STAGE_TOTAL, SynthesisMetrics
+)
+from managers.text_analysis import EMPTY_TEXT_ANALYSIS, analyze_text_length, format_text_analysis
+from managers.voice_preview import VoicePreviewCache
 from views.polly_auth_view import PollyAuthenticationView
 from views.polly_main_view import PollyMainView
 
 class PollyController:
     """Controller for Amazon Polly TTS functionality"""
-    def __init__(self, main_frame, status_bar, main_controller=None):
+    def __init__(self, main_frame, status_bar, main_controller=None, job_queue=None, synthesis_cache=None,
+                 daemon_client=None, synthesis_metrics=None, playback_engine=None):
         self.main_frame = main_frame
         self.status_bar = status_bar
         self.main_controller = main_controller
+        self.job_queue = job_queue or SynthesisJobQueue(main_frame)
+        self.synthesis_cache = synthesis_cache or SynthesisCache()
+        self.daemon_client = daemon_client or DaemonClient()
+        self.synthesis_metrics = synthesis_metrics or SynthesisMetrics()
+        # Shared in-process player; without one each clip is played by a new player process
+        self.playback_engine = playback_engine
+        # Prompts played back to back, prefetching the next few while one plays
+        self.play_queue = PlayQueue(playback_engine) if playback_engine is not None else None
         
         # Initialize variables
         self.access_key_var = tk.StringVar()
@@ -29,15 +54,37 @@ class PollyController:
         self.output_format_var = tk.StringVar(value="mp3")
         self.sample_rate_var = tk.StringVar(value="22050")
         self.remember_var = tk.IntVar(value=1)
-        self.char_count_var = tk.StringVar(value="0/3000")
-        self.remaining_chars = 3000
+        self.stream_playback_var = tk.BooleanVar(value=True)
+        # The engine needs PCM, which Polly only offers at up to 16 kHz; off plays the selected format
+        self.engine_playback_var = tk.BooleanVar(value=True)
+        self.lookahead_var = tk.IntVar(value=PlayQueue.DEFAULT_LOOKAHEAD)
+        self.presynthesize_var = tk.BooleanVar(value=False)
+        self.char_count_var = tk.StringVar(value=EMPTY_TEXT_ANALYSIS)
+        self._catalog_region = None
+        
+        # Catalog sections served from disk and already revalidated this session
+        self.catalog_store = CatalogSnapshotStore()
+        self._catalog_ages = {}
+        self._revalidated_sections = set()
         
         # Initialize managers
-        self.credentials_manager = AWSAuthenticationManager(self.access_key_var, self.secret_key_var)
-        self.polly_manager = AWSPollyManager(self.access_key_var, self.secret_key_var)
+        self.credentials_manager = AWSAuthenticationManager()
+        self.polly_manager = AWSPollyManager(metrics=self.synthesis_metrics)
+        # Generate & Save re-synthesizes only the segments an edit touched
+        self.incremental_synthesizer = IncrementalSynthesizer(self.polly_manager.MAX_REQUEST_CHARS)
+        self.voice_preview_cache = VoicePreviewCache()
+        # Opt-in: synthesize the text once it is idle so Generate & Play starts from the cache
+        self.speculative_synthesizer = SpeculativeSynthesizer(main_frame, self.job_queue, self.synthesis_cache)
+        for var in (self.region_var, self.engine_var, self.voice_var, self.output_format_var,
+                    self.sample_rate_var, self.presynthesize_var, self.engine_playback_var):
+            var.trace_add('write', self._on_synthesis_input_changed)
         
         # Check for saved credentials
-        self.credentials_manager.load_credentials()
+        saved_credentials = self.credentials_manager.load_credentials()
+        if saved_credentials:
+            self.access_key_var.set(saved_credentials.access_key_id)
+            self.secret_key_var.set(saved_credentials.secret_access_key)
+            self.polly_manager.set_credentials(saved_credentials)
 
     def show_navigation(self):
         """Navigate back to main navigation screen"""
@@ -46,9 +93,14 @@ class PollyController:
         else:
             self.update_status("Navigation not available", is_error=True)
 
+    def _get_credentials(self):
+        """Snapshot the credential Tk variables into an immutable AWSCredentials"""
+        return AWSCredentials(self.access_key_var.get().strip(), self.secret_key_var.get().strip())
+
     def show_polly_interface(self):
         """Determine and show the appropriate Polly interface view"""
         if self.access_key_var.get() and self.secret_key_var.get():
+            self.polly_manager.set_credentials(self._get_credentials())
             self._show_polly_main_interface()
         else:
             self._show_polly_auth_interface()
@@ -58,7 +110,7 @@ class PollyController:
         self.clear_frame()
         self.main_ui = PollyMainView(self.main_frame, self)
         self.load_regions()
-        self.char_count_var.set("0/3000")
+        self.reset_text_analysis()
         self.status_bar.update_status("Amazon Polly ready")
 
     def _show_polly_auth_interface(self):
@@ -71,21 +123,54 @@ class PollyController:
         """Clear all widgets from main frame"""
         for widget in self.main_frame.winfo_children():
             widget.destroy()
-        self.char_count_var.set("0/3000")
+        self.reset_text_analysis()
+        self.speculative_synthesizer.cancel()
+
+    def reset_text_analysis(self):
+        self.char_count_var.set(EMPTY_TEXT_ANALYSIS)
 
     def update_char_count(self, event=None):
-        """Update character count display"""
-        text = self.text_input.get("1.0", tk.END)
-        char_count = len(text.strip())
-        remaining = max(0, self.remaining_chars - char_count)
-        self.char_count_var.set(f"{char_count}/{self.remaining_chars}")
-        if remaining < 100:
-            self.char_count_label.config(foreground="red")
+        """Show billed characters, requests, duration and cost from the widget's tracked count"""
+        try:
+            analysis = analyze_text_length(
+                self.text_input.billed_char_count(),
+                self.polly_manager.MAX_REQUEST_CHARS,
+                self.polly_manager.get_price_per_million_chars(self.engine_var.get())
+            )
+            self.char_count_var.set(format_text_analysis(analysis))
+        except (AttributeError, tk.TclError):
+            # Text widget not shown
+            return
+        self._on_synthesis_input_changed()
+
+    def _on_synthesis_input_changed(self, *args):
+        """Cancel stale speculative synthesis and restart its debounce timer"""
+        self.speculative_synthesizer.enabled = self.presynthesize_var.get()
+        self.speculative_synthesizer.schedule(self._speculative_request)
+
+    def _speculative_request(self):
+        """What Generate & Play would synthesize right now, or None if inputs are incomplete"""
+        try:
+            text = self.main_ui.text_input.get("1.0", tk.END).strip()
+        except (AttributeError, tk.TclError):
+            return None
+        if not text or not all([self.access_key_var.get(), self.secret_key_var.get(),
+                                self.region_var.get(), self.voice_var.get()]):
+            return None
+        params = self._get_playback_params(text)
+        return self._cache_key(params), len(text), lambda job: self._synthesize_cached(job, params)
 
     def load_regions(self):
         """Load available AWS regions that support Polly"""
         try:
-            supported_regions = self.polly_manager.get_supported_regions()
+            snapshot = self.catalog_store.load('polly', self._catalog_account_id(), 'regions')
+            if snapshot:
+                supported_regions = snapshot.value
+                self._revalidate_catalog('regions', self.polly_manager.get_supported_regions,
+                                         self._apply_regions)
+            else:
+                supported_regions = self.polly_manager.get_supported_regions()
+                self.catalog_store.save('polly', self._catalog_account_id(), 'regions', supported_regions)
             
             if not supported_regions:
                 self.update_status("No AWS regions with Polly support found", is_error=True)
@@ -101,12 +186,112 @@ class PollyController:
         except Exception as e:
             self.update_status(f"Error loading regions: {str(e)}", is_error=True)
 
+    def _catalog_account_id(self):
+        """Snapshot key for the current account; only the access key id is hashed in"""
+        credentials = self.polly_manager.credentials
+        return CatalogSnapshotStore.make_account_id(credentials.access_key_id if credentials else "")
+
+    def _voices_section(self, region, engine):
+        return f"voices/{region}/{engine}"
+
+    def _load_voice_snapshot(self, region, engine):
+        """Seed the in-memory catalog from disk so dropdowns fill without calling Polly"""
+        if self.polly_manager.is_voice_catalog_loaded(region, engine):
+            return
+        section = self._voices_section(region, engine)
+        snapshot = self.catalog_store.load('polly', self._catalog_account_id(), section)
+        if snapshot:
+            self.polly_manager.seed_voices(region, engine, snapshot.value)
+            self._catalog_ages[section] = snapshot.format_age()
+
+    def _revalidate_catalog(self, section, fetch, apply, force=False):
+        """Fetch a catalog section in the background and apply it only if it changed.
+        Returns whether a refresh was queued."""
+        if section in self._revalidated_sections and not force:
+            return False
+        self._revalidated_sections.add(section)
+        self.job_queue.submit(
+            self._revalidate_catalog_job,
+            self._catalog_account_id(),
+            section,
+            fetch,
+            on_success=lambda result: self._on_catalog_revalidated(result, apply),
+            on_error=lambda e: self._on_catalog_revalidation_error(section, e),
+            description=f"Polly catalog {section}"
+        )
+        return True
+
+    def _revalidate_catalog_job(self, job, account_id, section, fetch):
+        """Fetch and persist a catalog section; runs on a worker thread"""
+        value = fetch()
+        job.check_cancelled()
+        _, changed = self.catalog_store.save('polly', account_id, section, value)
+        return section, value, changed
+
+    def _on_catalog_revalidated(self, result, apply):
+        section, value, changed = result
+        self._catalog_ages.pop(section, None)
+        if not changed:
+            self.update_status("Voice catalog is up to date")
+            return
+        try:
+            apply(section, value)
+            self.update_status("Voice catalog updated")
+        except Exception as e:
+            # The view may have been closed while the refresh was running
+            print(f"Error applying Polly catalog {section}: {e}")
+
+    def _on_catalog_revalidation_error(self, section, error):
+        # The snapshot stays usable; allow another attempt later
+        self._revalidated_sections.discard(section)
+        print(f"Error refreshing Polly catalog {section}: {error}")
+
+    def _apply_regions(self, section, regions):
+        if hasattr(self, 'main_ui'):
+            self.main_ui.region_dropdown['values'] = regions
+
+    def _apply_voices(self, section, voices):
+        """Swap in a changed voice list, keeping the user's language and voice when still offered"""
+        _, region, engine = section.split('/', 2)
+        self.polly_manager.seed_voices(region, engine, voices)
+        if region != self.region_var.get() or engine != self.engine_var.get():
+            return
+        
+        selected_language = self.language_var.get()
+        selected_voice = self.voice_var.get()
+        self.update_languages()
+        if selected_language in self.main_ui.language_dropdown['values']:
+            self.language_var.set(selected_language)
+            self.update_voices()
+            if selected_voice in self.main_ui.voice_dropdown['values']:
+                self.voice_var.set(selected_voice)
+
+    def refresh_catalog(self):
+        """Re-fetch regions and the current region's voices, updating dropdowns if they changed"""
+        region = self.region_var.get()
+        engine = self.engine_var.get()
+        self.update_status("Refreshing voice catalog...")
+        self._revalidate_catalog('regions', self.polly_manager.get_supported_regions,
+                                 self._apply_regions, force=True)
+        if region and engine:
+            self._revalidate_catalog(
+                self._voices_section(region, engine),
+                lambda: self.polly_manager.describe_voices(region, engine),
+                self._apply_voices,
+                force=True
+            )
+
     def update_engines_for_region(self, event=None):
         """Update available engines based on selected region"""
         try:
             selected_region = self.region_var.get()
             if not selected_region:
                 return
+            
+            # Voices cached for the previous region are no longer relevant
+            if self._catalog_region and self._catalog_region != selected_region:
+                self.polly_manager.invalidate_voice_catalog(self._catalog_region)
+            self._catalog_region = selected_region
                 
             available_engines = self.polly_manager.get_engines_for_region(selected_region)
             self.main_ui.engine_dropdown['values'] = available_engines
@@ -128,7 +313,9 @@ class PollyController:
         """Update available languages"""
         region = self.region_var.get()
         engine = self.engine_var.get()
+        section = self._voices_section(region, engine)
         
+        self._load_voice_snapshot(region, engine)
         success, error_msg = self.polly_manager.get_languages(region, engine)
         
         if not success:
@@ -164,8 +351,29 @@ class PollyController:
                 default_lang = us_english if us_english else f"{languages[0][1]} ({languages[0][0]})"
                 self.language_var.set(default_lang)
                 self.update_voices()
-                
-            self.update_status(f"Loaded {len(languages)} languages")
+            
+            age = self._catalog_ages.get(section)
+            refreshing = False
+            if age:
+                # Served from disk: re-fetch in the background
+                refreshing = self._revalidate_catalog(
+                    section,
+                    lambda: self.polly_manager.describe_voices(region, engine),
+                    self._apply_voices
+                )
+            elif section not in self._revalidated_sections:
+                # Just fetched from Polly: persist for the next launch
+                voices = self.polly_manager.get_loaded_voices(region, engine)
+                if voices is not None:
+                    self._revalidated_sections.add(section)
+                    self.catalog_store.save('polly', self._catalog_account_id(), section, voices)
+            
+            if refreshing:
+                self.update_status(f"Loaded {len(languages)} languages (voice catalog from {age}, checking for updates)")
+            elif age:
+                self.update_status(f"Loaded {len(languages)} languages (voice catalog from {age})")
+            else:
+                self.update_status(f"Loaded {len(languages)} languages")
             
         except Exception as e:
             self.update_status(f"Error updating languages: {str(e)}", is_error=True)
@@ -219,6 +427,8 @@ class PollyController:
     def update_output_formats(self, event=None):
         """Update available output formats and sample rates"""
         try:
+            # Cost estimates depend on the engine
+            self.update_char_count()
             self.main_ui.format_dropdown['values'] = self.polly_manager.OUTPUT_FORMATS
             if self.polly_manager.OUTPUT_FORMATS:
                 self.output_format_var.set('mp3')
@@ -254,30 +464,33 @@ class PollyController:
         self.main_frame.master.update()
         
         try:
-            access_key = self.access_key_var.get().strip()
-            secret_key = self.secret_key_var.get().strip()
+            credentials = self._get_credentials()
             
-            if not access_key or not secret_key:
+            if not credentials.is_complete():
                 self.status_bar.update_status("Both Access Key and Secret Key are required", is_error=True)
                 self.main_frame.master.update()
                 messagebox.showerror("Error", "Both Access Key and Secret Key are required")
                 return
 
-            session = self.polly_manager.get_session()
-
-            # Test the credentials by making a simple AWS call
+            # Test the credentials by making a simple AWS call before the manager uses them
             self.status_bar.update_status("Authenticating with AWS...")
             self.main_frame.master.update()
             
-            sts = session.client('sts')
-            sts.get_caller_identity()
+            self.polly_manager.verify_credentials(credentials)
+            
+            # Clients and voices cached under the previous credentials may not apply anymore
+            self.polly_manager.set_credentials(credentials)
+            self.polly_manager.invalidate_clients()
+            self.polly_manager.invalidate_voice_catalog()
+            self._revalidated_sections.clear()
+            self._catalog_ages.clear()
             
             # Only save if credentials are valid
             if self.remember_var.get():
                 self.status_bar.update_status("Saving credentials...")
                 self.main_frame.master.update()
                 
-                if not self.credentials_manager.save_credentials(True):
+                if not self.credentials_manager.save_credentials(credentials, True):
                     self.status_bar.update_status("Warning: Could not save credentials to keyring", is_error=True)
                     self.main_frame.master.update()
                     messagebox.showwarning("Warning", "Could not save credentials to keyring")
@@ -343,54 +556,135 @@ class PollyController:
         
         return text
 
+    def _get_synthesis_params(self, text):
+        """Snapshot the Tk variables needed for a synthesis job"""
+        return {
+            'region': self.region_var.get(),
+            'text': text,
+            'voice_id': self.polly_manager.get_voice_id_from_display(self.voice_var.get()),
+            'engine': self.engine_var.get(),
+            'output_format': self.output_format_var.get(),
+            'sample_rate': self.sample_rate_var.get()
+        }
+
+    def _get_playback_params(self, text):
+        """Synthesis params for Generate & Play, which needs PCM when the playback engine is used"""
+        params = self._get_synthesis_params(text)
+        if self._play_through_engine():
+            self._use_engine_format(params)
+        return params
+
+    def _cache_key(self, params):
+        """Cache key for a synthesis request"""
+        return self.synthesis_cache.make_key(
+            'polly',
+            params['voice_id'],
+            params['engine'],
+            params['output_format'],
+            params['sample_rate'],
+            params['text']
+        )
+
+    def _synthesize_cached(self, job, params):
+        """Return audio for params from the synthesis cache, synthesizing on a miss"""
+        key = self._cache_key(params)
+        self.speculative_synthesizer.wait_for(key, job)
+        audio_data = self.synthesis_cache.get(key)
+        if audio_data is None:
+            audio_data = self._synthesize_uncached(job, params)
+            self.synthesis_cache.put(key, audio_data)
+        return audio_data
+
+    def _synthesize_uncached(self, job, params):
+        """Synthesize through the local daemon when one is running, otherwise in-process"""
+        if self.daemon_client.is_available():
+            try:
+                audio_data, _ = self.daemon_client.synthesize(
+                    'polly',
+                    params['text'],
+                    params['voice_id'],
+                    params['output_format'],
+                    params['sample_rate'],
+                    credentials=self.polly_manager.credentials,
+                    cancel_check=job.check_cancelled,
+                    region=params['region'],
+                    engine=params['engine']
+                )
+                return audio_data
+            except (DaemonUnavailableError, DaemonServerError) as e:
+                print(f"{e}; synthesizing locally")
+        return self.polly_manager.synthesize_speech_bytes(**params, cancel_check=job.check_cancelled)
+
+    def _update_cache_stats(self):
+        self.status_bar.update_cache_stats(self.synthesis_cache.format_stats())
+
     def generate(self):
         """Generate speech from text"""
         text = self._validate_synthesis_inputs()
         if not text:
             return
         
-        try:
-            voice_id = self.polly_manager.get_voice_id_from_display(self.voice_var.get())
-            engine = self.engine_var.get()
-            output_format = self.output_format_var.get()
-            
-            self.status_bar.update_status("Generating...")
-            self.main_frame.master.update()
-
-            response = self.polly_manager.synthesize_speech(
-                region=self.region_var.get(),
-                text=text,
-                voice_id=voice_id,
-                engine=engine,
-                output_format=output_format,
-                sample_rate=self.sample_rate_var.get()
-            )
-            
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_dir = os.path.join(os.path.expanduser("~"), "Downloads")
+        params = self._get_synthesis_params(text)
+        self.status_bar.update_status("Generating...")
+        self.job_queue.submit(
+            self._generate_job,
+            params,
+            on_success=self._on_generate_done,
+            on_error=self._on_synthesis_error,
+            description="Polly generate"
+        )
+
+    def _generate_job(self, job, params):
+        """Synthesize and save audio; runs on a worker thread"""
+        started_at = time.perf_counter()
+        key = self._cache_key(params)
+        audio_data = self.synthesis_cache.get(key)
+        summary = "from cache"
+        if audio_data is None:
+            audio_data, stats = self._synthesize_incremental(job, params)
+            self.synthesis_cache.put(key, audio_data)
+            summary = IncrementalSynthesizer.format_stats(stats)
+        job.check_cancelled()
+        
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        output_dir = os.path.join(os.path.expanduser("~"), "Downloads")
 
-            if not os.path.exists(output_dir):
-                os.makedirs(output_dir)
-                
-            format_to_extension = {
-                'mp3': 'mp3',
-                'ogg_vorbis': 'ogg',
-                'pcm': 'pcm'
-            }
-            
-            ext = format_to_extension.get(output_format, 'mp3')
-            output_path = os.path.join(output_dir, f"tts_output_{voice_id}_{timestamp}.{ext}")
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir, exist_ok=True)
             
+        format_to_extension = {
+            'mp3': 'mp3',
+            'ogg_vorbis': 'ogg',
+            'pcm': 'pcm'
+        }
+        
+        ext = format_to_extension.get(params['output_format'], 'mp3')
+        output_path = os.path.join(output_dir, f"tts_output_{params['voice_id']}_{timestamp}.{ext}")
+        
+        with self.synthesis_metrics.stage('polly', params['voice_id'], STAGE_FILE_WRITE):
             with open(output_path, 'wb') as f:
-                f.write(response['AudioStream'].read())
-                
-            self.update_status(f"Audio saved to: {output_path}")
-            
-            # Open file explorer to show the file
-            self._open_file_location(output_path)
-                
-        except Exception as e:
-            self.update_status(f"Error: {str(e)}", is_error=True)
+                f.write(audio_data)
+        self.synthesis_metrics.record('polly', params['voice_id'], STAGE_TOTAL, time.perf_counter() - started_at)
+        return output_path, summary
+
+    def _synthesize_incremental(self, job, params):
+        """Synthesize params['text'] in sentence-group segments, reusing segments unchanged since
+        the last document saved with the same voice settings; runs on a worker thread"""
+        settings_key = (params['voice_id'], params['engine'], params['output_format'], params['sample_rate'])
+        return self.incremental_synthesizer.synthesize(
+            params['text'],
+            settings_key,
+            params['output_format'],
+            lambda segment: self._synthesize_uncached(job, {**params, 'text': segment}),
+            cancel_check=job.check_cancelled
+        )
+
+    def _on_generate_done(self, result):
+        """Report a saved file and reveal it in the file manager"""
+        output_path, summary = result
+        self._update_cache_stats()
+        self.update_status(f"Audio saved to: {output_path} ({summary})")
+        self._open_file_location(output_path)
 
     def play_audio_directly(self):
         """Generate and play audio without saving"""
@@ -398,63 +692,265 @@ class PollyController:
         if not text:
             return
         
-        try:
+        params = self._get_playback_params(text)
+        use_engine = self._play_through_engine()
+        if use_engine:
+            player_command = None
+        else:
+            player_command = get_stream_player_command(params['output_format'], params['sample_rate'])
+        use_streaming = (
+            self.stream_playback_var.get()
+            and (player_command is not None or use_engine)
+            and len(text) <= self.polly_manager.MAX_REQUEST_CHARS
+        )
+        
+        if use_streaming:
+            job_func, job_args = self._stream_play_job, (params, player_command)
+        else:
+            job_func, job_args = self._play_job, (params,)
+        
+        if use_engine and self.output_format_var.get() != 'pcm':
+            self.status_bar.update_status(f"Generating {params['sample_rate']} Hz PCM for the playback bar...")
+        else:
             self.status_bar.update_status("Generating...")
-            self.main_frame.master.update()
+        self.job_queue.submit(
+            job_func,
+            *job_args,
+            on_success=self._on_play_done,
+            on_error=lambda e: self._on_synthesis_error(e, "Playback error"),
+            description="Polly play"
+        )
+
+    def _on_synthesis_error(self, error, prefix="Error"):
+        self._update_cache_stats()
+        self.update_status(f"{prefix}: {str(error)}", is_error=True)
+
+    def _on_play_done(self, stats):
+        """Report playback completion (or, with the playback engine, buffering) with time-to-first-audio"""
+        self._update_cache_stats()
+        ttfa = stats.get('time_to_first_audio')
+        mode = "streamed" if stats.get('streamed') else "buffered"
+        done = "Playing" if stats.get('engine') else "Audio played successfully"
+        if ttfa is not None:
+            self.update_status(f"{done} ({mode}, first audio after {ttfa * 1000:.0f} ms)")
+        else:
+            self.update_status(done)
 
-            voice_id = self.polly_manager.get_voice_id_from_display(self.voice_var.get())
-            output_format = self.output_format_var.get()
-            
-            response = self.polly_manager.synthesize_speech(
-                region=self.region_var.get(),
-                text=text,
-                voice_id=voice_id,
-                engine=self.engine_var.get(),
-                output_format=output_format,
-                sample_rate=self.sample_rate_var.get()
-            )
+    def _use_playback_engine(self):
+        return self.playback_engine is not None and self.playback_engine.is_available()
+
+    def _play_through_engine(self):
+        """Whether Generate & Play uses the playback engine rather than the selected format"""
+        return self.engine_playback_var.get() and self._use_playback_engine()
 
-            # Create temp file with appropriate extension
-            if output_format == 'mp3':
-                suffix = '.mp3'
-            elif output_format == 'ogg_vorbis':
-                suffix = '.ogg'
+    def _use_engine_format(self, params):
+        """The engine plays raw PCM, so playback asks Polly for PCM whatever format is selected for saving"""
+        params['output_format'] = 'pcm'
+        params['sample_rate'] = self.polly_manager.get_sample_rates('pcm')[-1]
+
+    def add_to_play_queue(self):
+        """Queue the current text with the current voice settings"""
+        text = self._validate_synthesis_inputs()
+        if not text:
+            return
+        
+        params = self._get_synthesis_params(text)
+        self._use_engine_format(params)
+        label = f"{params['voice_id']}: {' '.join(text.split())[:40]}"
+        self.play_queue.add(label, lambda job: self._synthesize_cached(job, params), int(params['sample_rate']))
+        self.update_status(f"Added to play queue as {params['sample_rate']} Hz PCM ({len(self.play_queue)} items)")
+
+    def start_play_queue(self, start_index=0):
+        """Play the queue from start_index, synthesizing the look-ahead items in the background"""
+        if not self._use_playback_engine():
+            self.update_status("Play queue needs an audio output device.", is_error=True)
+            return
+        if not len(self.play_queue):
+            self.update_status("Play queue is empty.", is_error=True)
+            return
+        self.update_lookahead()
+        self.play_queue.play(start_index)
+        self.update_status("Playing queue")
+
+    def update_lookahead(self):
+        try:
+            self.play_queue.set_lookahead(self.lookahead_var.get())
+        except (tk.TclError, ValueError):
+            pass
+
+    def stop_play_queue(self):
+        self.play_queue.stop()
+        self.update_status("Play queue stopped")
+
+    def clear_play_queue(self):
+        self.play_queue.clear()
+        self.update_status("Play queue cleared")
+
+    def _stream_play_job(self, job, params, player_command):
+        """Synthesize and pipe audio into the player as it downloads; runs on a worker thread"""
+        started_at = time.perf_counter()
+        key = self._cache_key(params)
+        self.speculative_synthesizer.wait_for(key, job)
+        cached = self.synthesis_cache.get(key)
+        if cached is not None:
+            return self._play_bytes(job, params, cached, started_at)
+        
+        response = self.polly_manager.synthesize_speech(**params)
+        job.check_cancelled()
+        
+        audio_chunks = []
+        with self.synthesis_metrics.stage('polly', params['voice_id'], STAGE_PLAYER_LAUNCH):
+            if player_command is None:
+                sink = self.playback_engine.open_stream()
             else:
-                suffix = '.wav'
+                sink = PlayerProcessSink(player_command)
+        job.add_cancel_callback(sink.terminate)
+        stats = AudioStreamer().stream(
+            response['AudioStream'],
+            sink,
+            params['output_format'],
+            params['sample_rate'],
+            started_at=started_at,
+            cancel_check=job.check_cancelled,
+            on_chunk=audio_chunks.append
+        )
+        job.check_cancelled()
+        self.synthesis_cache.put(key, b''.join(audio_chunks))
+        if stats['time_to_first_audio'] is not None:
+            self.synthesis_metrics.record('polly', params['voice_id'], STAGE_FIRST_AUDIO, stats['time_to_first_audio'])
+        stats['streamed'] = True
+        stats['engine'] = player_command is None
+        return stats
+
+    def _play_job(self, job, params):
+        """Synthesize and play audio; runs on a worker thread"""
+        started_at = time.perf_counter()
+        audio_data = self._synthesize_cached(job, params)
+        job.check_cancelled()
+        return self._play_bytes(job, params, audio_data, started_at)
+
+    def _play_bytes(self, job, params, audio_data, started_at):
+        """Hand audio to the playback engine, or write it to a temp file and play that;
+        runs on a worker thread"""
+        output_format = params['output_format']
+        if output_format == 'pcm' and self._use_playback_engine():
+            sink = self.playback_engine.open_stream(int(params['sample_rate']))
+            job.add_cancel_callback(sink.terminate)
+            stats = {'time_to_first_audio': time.perf_counter() - started_at, 'streamed': False, 'engine': True}
+            self.synthesis_metrics.record('polly', params['voice_id'], STAGE_FIRST_AUDIO, stats['time_to_first_audio'])
+            # Blocks only while a clip longer than the engine's buffer is queued
+            sink.write(audio_data)
+            sink.close()
+            return stats
+
+        # Create temp file with appropriate extension
+        if output_format == 'mp3':
+            suffix = '.mp3'
+        elif output_format == 'ogg_vorbis':
+            suffix = '.ogg'
+        else:
+            suffix = '.wav'
 
-            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
-                audio_data = response['AudioStream'].read()
-                
-                if output_format == 'pcm':
-                    # Convert PCM to WAV for playback
-                    import struct
-                    sample_rate = int(self.sample_rate_var.get())
-                    # Write simple WAV header for PCM
-                    tmp_file.write(b'RIFF')
-                    tmp_file.write(struct.pack('<I', 36 + len(audio_data)))
-                    tmp_file.write(b'WAVE')
-                    tmp_file.write(b'fmt ')
-                    tmp_file.write(struct.pack('<I', 16))
-                    tmp_file.write(struct.pack('<H', 1))
-                    tmp_file.write(struct.pack('<H', 1))
-                    tmp_file.write(struct.pack('<I', sample_rate))
-                    tmp_file.write(struct.pack('<I', sample_rate * 2))
-                    tmp_file.write(struct.pack('<H', 2))
-                    tmp_file.write(struct.pack('<H', 16))
-                    tmp_file.write(b'data')
-                    tmp_file.write(struct.pack('<I', len(audio_data)))
-                    tmp_file.write(audio_data)
-                else:
-                    tmp_file.write(audio_data)
-                
-                tmp_file.flush()
-                temp_path = tmp_file.name
-                
-            self._play_audio_file(temp_path)
-            self.update_status("Audio played successfully")
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp_file:
+            if output_format == 'pcm':
+                # Convert PCM to WAV for playback
+                tmp_file.write(build_wav_header(len(audio_data), int(params['sample_rate'])))
+                tmp_file.write(audio_data)
+            else:
+                tmp_file.write(audio_data)
             
-        except Exception as e:
-            self.update_status(f"Playback error: {str(e)}", is_error=True)
+            tmp_file.flush()
+            temp_path = tmp_file.name
+            
+        stats = {'time_to_first_audio': time.perf_counter() - started_at, 'streamed': False}
+        self.synthesis_metrics.record('polly', params['voice_id'], STAGE_FIRST_AUDIO, stats['time_to_first_audio'])
+        self._play_audio_file(temp_path, job, params['voice_id'])
+        return stats
+
+    def _voice_preview_ready(self):
+        if not all([self.access_key_var.get(), self.secret_key_var.get(), self.region_var.get()]):
+            self.update_status("AWS configuration is incomplete.", is_error=True)
+            return False
+        return True
+
+    def _synthesize_preview(self, region, voice_id, engine, text, cancel_check):
+        """Previews are raw PCM so the playback engine can play them directly"""
+        return self.polly_manager.synthesize_speech_bytes(
+            region, text, voice_id, engine, 'pcm', self.polly_manager.get_sample_rates('pcm')[-1],
+            cancel_check=cancel_check
+        )
+
+    def preview_voice(self):
+        """Play the sample sentence in the selected voice, synthesizing it only on first use"""
+        if not self.voice_var.get():
+            self.update_status("Please select a voice.", is_error=True)
+            return
+        if not self._voice_preview_ready():
+            return
+        
+        voice_id = self.polly_manager.get_voice_id_from_display(self.voice_var.get())
+        self.update_status(f"Previewing {voice_id}...")
+        self.job_queue.submit(
+            self._preview_job,
+            self.region_var.get(),
+            voice_id,
+            self.engine_var.get(),
+            on_success=self._on_play_done,
+            on_error=lambda e: self._on_synthesis_error(e, "Preview error"),
+            description="Polly voice preview"
+        )
+
+    def _preview_job(self, job, region, voice_id, engine):
+        started_at = time.perf_counter()
+        audio_data = self.voice_preview_cache.get(
+            'polly', voice_id, engine,
+            lambda text: self._synthesize_preview(region, voice_id, engine, text, job.check_cancelled)
+        )
+        job.check_cancelled()
+        params = {'voice_id': voice_id, 'output_format': 'pcm',
+                  'sample_rate': self.polly_manager.get_sample_rates('pcm')[-1]}
+        return self._play_bytes(job, params, audio_data, started_at)
+
+    def prefetch_voice_previews(self):
+        """Fetch previews for every voice of the selected language and engine in parallel"""
+        selected_lang = self.language_var.get()
+        if not selected_lang:
+            self.update_status("Please select a language.", is_error=True)
+            return
+        if not self._voice_preview_ready():
+            return
+        
+        region = self.region_var.get()
+        engine = self.engine_var.get()
+        lang_code = selected_lang.split('(')[-1].rstrip(')')
+        voice_ids = [self.polly_manager.get_voice_id_from_display(display)
+                     for display in self.polly_manager.get_voices(lang_code, engine, region)]
+        self.update_status(f"Fetching previews for {len(voice_ids)} voices...")
+        self.job_queue.submit(
+            self._prefetch_previews_job,
+            region,
+            engine,
+            voice_ids,
+            on_success=lambda result: self.update_status(VoicePreviewCache.format_result(result), is_error=bool(result[2])),
+            on_error=lambda e: self._on_synthesis_error(e, "Preview error"),
+            description="Polly preview prefetch"
+        )
+
+    def _prefetch_previews_job(self, job, region, engine, voice_ids):
+        return self.voice_preview_cache.prefetch(
+            'polly', voice_ids, engine,
+            lambda voice_id, text: self._synthesize_preview(region, voice_id, engine, text, job.check_cancelled),
+            cancel_check=job.check_cancelled
+        )
+
+    def cancel_jobs(self):
+        """Cancel all queued and in-flight synthesis/playback jobs"""
+        cancelled = self.job_queue.cancel_all()
+        if self.play_queue is not None:
+            # Play queue prefetches run on the queue's own executor, outside the job queue
+            was_playing = self.play_queue.is_playing()
+            cancelled += self.play_queue.stop() + int(was_playing)
+        self.update_status(f"Cancelled {cancelled} job(s)" if cancelled else "Nothing to cancel")
 
     def on_language_changed(self, event=None):
         """Handle language change event"""
@@ -477,15 +973,24 @@ class PollyController:
         elif platform.system() == "Linux":
             subprocess.run(["xdg-open", os.path.dirname(file_path)])
 
-    def _play_audio_file(self, file_path):
-        """Play audio file using system player"""
+    def _play_audio_file(self, file_path, job=None, voice_id=None):
+        """Play audio file using system player; cancelling the job stops playback"""
         try:
+            launch_started_at = time.perf_counter()
             if platform.system() == "Darwin":
-                subprocess.run(["afplay", file_path])
+                process = subprocess.Popen(["afplay", file_path])
             elif platform.system() == "Windows":
-                subprocess.run(["start", file_path], shell=True)
+                process = subprocess.Popen(["start", file_path], shell=True)
             elif platform.system() == "Linux":
-                subprocess.run(["aplay", file_path])
+                process = subprocess.Popen(["aplay", file_path])
+            else:
+                return
+            self.synthesis_metrics.record('polly', voice_id, STAGE_PLAYER_LAUNCH, time.perf_counter() - launch_started_at)
+            if job:
+                job.add_cancel_callback(process.terminate)
+            process.wait()
+            if job:
+                job.check_cancelled()
         finally:
             try:
                 os.unlink(file_path)
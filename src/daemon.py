@@ -0,0 +1,298 @@
+"""Long-running local synthesis server shared by the Tk app, the CLI and other tools.
+
+Examples:
+    python src/daemon.py
+    TTS_DAEMON_PORT=9000 python src/daemon.py --verbose
+
+The daemon imports boto3 and the Azure Speech SDK once, keeps pooled Polly clients and
+Azure synthesizers warm, serves repeated requests from the synthesis cache, and collapses
+identical in-flight requests so N callers asking for the same text, voice and format
+trigger one upstream call.
+
+Endpoints (JSON in, audio or JSON out):
+    GET  /health      status, coalescing and cache statistics
+    POST /synthesize  {"provider": "polly"|"azure", "text": ..., "voice": ..., "format": ...,
+                       "sample_rate": ..., "region": ..., "engine": ..., "credentials": {...}}
+
+For Azure, "format" is mp3/ogg_opus/wav/pcm or a SpeechSynthesisOutputFormat name.
+
+Requests without "credentials" use AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY or
+AZURE_SPEECH_KEY / AZURE_SPEECH_ENDPOINT, falling back to the credentials saved by the app.
+Because those bill the daemon owner's account, such requests must carry the X-TTS-Token header
+with the token the daemon writes at startup to a file only its user can read (see
+managers.daemon_client.get_token_path); other requests without credentials are rejected.
+Clients send a random X-TTS-Challenge header to /health and only send credentials once the
+X-TTS-Proof answer shows the daemon holds that token.
+The server binds to 127.0.0.1 by default; do not expose it on other interfaces.
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import sys
+import threading
+from dataclasses import astuple
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from managers.credentials import AWSCredentials, AzureCredentials
+from managers.daemon_client import (CHALLENGE_HEADER, DEFAULT_HOST, PROOF_HEADER, TOKEN_HEADER, compute_proof,
+                                    get_daemon_port, get_token_path)
+from managers.request_coalescer import RequestCoalescer
+from managers.synthesis_cache import SynthesisCache
+
+CONTENT_TYPES = {
+    'mp3': 'audio/mpeg',
+    'ogg_vorbis': 'audio/ogg',
+    'ogg_opus': 'audio/ogg',
+    'wav': 'audio/wav',
+    'pcm': 'application/octet-stream'
+}
+
+class DaemonAuthError(Exception):
+    """Raised when a request asks for the daemon's own credentials without a valid token"""
+
+def write_token_file(path):
+    """Create a fresh random token in a file readable only by the current user"""
+    token = secrets.token_hex(32)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        # The mode passed to open() does not apply to an existing file
+        os.chmod(path, 0o600)
+        f.write(token)
+    return token
+
+class SynthesisService:
+    """Warm provider managers, the synthesis cache and request coalescing behind the daemon"""
+    def __init__(self, synthesis_cache=None, max_pool_connections=32):
+        self.synthesis_cache = synthesis_cache or SynthesisCache()
+        self.coalescer = RequestCoalescer()
+        self.max_pool_connections = max_pool_connections
+        self._client_pool = None
+        self._polly_managers = {}
+        self._azure_manager = None
+        self._default_credentials = {}
+        self._lock = threading.Lock()
+
+    def warm_up(self):
+        """Import the provider SDKs and create managers before the first request arrives"""
+        self._get_polly_manager(self.get_default_credentials('polly'))
+        self._get_azure_manager()
+
+    def get_default_credentials(self, provider):
+        """Daemon-wide credentials from the environment or the keyring, loaded once"""
+        with self._lock:
+            if provider not in self._default_credentials:
+                if provider == 'polly':
+                    from managers.aws_auth_manager import AWSAuthenticationManager
+                    credentials = AWSCredentials.from_environment() or AWSAuthenticationManager().load_credentials()
+                else:
+                    from managers.azure_auth_manager import AzureAuthenticationManager
+                    credentials = AzureCredentials.from_environment() or AzureAuthenticationManager().load_credentials()
+                self._default_credentials[provider] = credentials
+            return self._default_credentials[provider]
+
+    def _get_polly_manager(self, credentials):
+        """One AWSPollyManager per account, all sharing a pooled set of boto3 clients"""
+        from managers.aws_client_pool import AWSClientPool
+        from managers.aws_polly_manager import AWSPollyManager
+
+        with self._lock:
+            if self._client_pool is None:
+                self._client_pool = AWSClientPool(max_pool_connections=self.max_pool_connections)
+            manager = self._polly_managers.get(credentials)
+            if manager is None:
+                manager = self._polly_managers[credentials] = AWSPollyManager(credentials, self._client_pool)
+            return manager
+
+    def _get_azure_manager(self):
+        from managers.azure_speech_manager import AzureSpeechManager
+
+        with self._lock:
+            if self._azure_manager is None:
+                self._azure_manager = AzureSpeechManager()
+            return self._azure_manager
+
+    def _resolve_credentials(self, provider, request, authorized):
+        """Credentials sent with the request, or the daemon's own for callers holding the token"""
+        supplied = request.get('credentials')
+        if supplied:
+            credentials_class = AWSCredentials if provider == 'polly' else AzureCredentials
+            credentials = credentials_class(**supplied)
+        elif not authorized:
+            raise DaemonAuthError(f"Send {provider} credentials or the daemon token to use its saved credentials")
+        else:
+            credentials = self.get_default_credentials(provider)
+        if not credentials or not credentials.is_complete():
+            raise ValueError(f"No {provider} credentials supplied and none configured for the daemon")
+        return credentials
+
+    def _prepare(self, request, authorized):
+        """Validate a request; returns (credentials, cache_key, container_format, synthesize)"""
+        provider = request.get('provider')
+        text = (request.get('text') or '').strip()
+        voice = request.get('voice')
+        if provider not in ('polly', 'azure'):
+            raise ValueError("provider must be 'polly' or 'azure'")
+        if not text or not voice:
+            raise ValueError("text and voice are required")
+        credentials = self._resolve_credentials(provider, request, authorized)
+
+        if provider == 'polly':
+            manager = self._get_polly_manager(credentials)
+            output_format = request.get('format') or 'mp3'
+            if output_format not in manager.OUTPUT_FORMATS:
+                raise ValueError(f"Unsupported Polly format: {output_format}")
+            sample_rate = str(request.get('sample_rate') or manager.get_sample_rates(output_format)[-1])
+            engine = request.get('engine') or 'neural'
+            region = request.get('region') or 'us-east-1'
+            key = self.synthesis_cache.make_key('polly', voice, engine, output_format, sample_rate, text)
+
+            def synthesize():
+                return manager.synthesize_speech_bytes(region, text, voice, engine, output_format, sample_rate)
+
+            return credentials, key, output_format, synthesize
+
+        manager = self._get_azure_manager()
+        output_format = request.get('format') or 'mp3'
+        if output_format in manager.SDK_OUTPUT_FORMATS.values():
+            # SpeechSynthesisOutputFormat names are accepted as-is
+            sdk_output_format = output_format
+        else:
+            sdk_output_format = manager.get_sdk_output_format(output_format, request.get('sample_rate') or "24000")
+        key = self.synthesis_cache.make_key('azure', voice, None, sdk_output_format, None, text)
+
+        def synthesize():
+            return manager.synthesize_long_text(
+                text, credentials.api_key, credentials.endpoint, voice, output_format=sdk_output_format
+            )
+
+        return credentials, key, manager.get_container_format(sdk_output_format), synthesize
+
+    def synthesize(self, request, authorized=False):
+        """Serve a synthesis request; returns (audio_data, container_format, source).
+        authorized says whether the caller presented the daemon token."""
+        credentials, key, container_format, synthesize = self._prepare(request, authorized)
+
+        audio_data = self.synthesis_cache.get(key)
+        if audio_data is not None:
+            return audio_data, container_format, 'cache'
+
+        def synthesize_and_cache():
+            data = synthesize()
+            self.synthesis_cache.put(key, data)
+            return data
+
+        # Callers with different credentials never share an upstream call
+        credentials_hash = hashlib.sha256(repr(astuple(credentials)).encode('utf-8')).hexdigest()
+        audio_data, shared = self.coalescer.run((key, credentials_hash), synthesize_and_cache)
+        return audio_data, container_format, 'coalesced' if shared else 'synthesized'
+
+    def get_health(self):
+        return {
+            'status': 'ok',
+            'pid': os.getpid(),
+            'coalescing': self.coalescer.get_stats(),
+            'cache': self.synthesis_cache.get_stats()
+        }
+
+class DaemonRequestHandler(BaseHTTPRequestHandler):
+    """HTTP front end for SynthesisService"""
+    server_version = "python-tts-daemon/1.0"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == '/health':
+            # Answer the client's challenge so it knows it is talking to this daemon
+            challenge = self.headers.get(CHALLENGE_HEADER)
+            headers = {}
+            if challenge and self.server.token:
+                headers[PROOF_HEADER] = compute_proof(self.server.token, challenge)
+            self._send_json(200, self.server.service.get_health(), headers)
+        else:
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+
+    def do_POST(self):
+        if self.path != '/synthesize':
+            self._send_json(404, {'error': f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            request = json.loads(self.rfile.read(length).decode('utf-8'))
+            audio_data, container_format, source = self.server.service.synthesize(request, self._authorized())
+        except DaemonAuthError as e:
+            self._send_json(401, {'error': str(e)})
+            return
+        except (ValueError, TypeError) as e:
+            self._send_json(400, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(502, {'error': str(e)})
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', CONTENT_TYPES.get(container_format, 'application/octet-stream'))
+        self.send_header('Content-Length', str(len(audio_data)))
+        self.send_header('X-TTS-Source', source)
+        self.end_headers()
+        self.wfile.write(audio_data)
+
+    def _authorized(self):
+        token = self.headers.get(TOKEN_HEADER)
+        return bool(token and self.server.token and hmac.compare_digest(token, self.server.token))
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+class SynthesisDaemon(ThreadingHTTPServer):
+    """Threaded HTTP server holding a SynthesisService"""
+    daemon_threads = True
+
+    def __init__(self, address, service, verbose=False, token=None):
+        super().__init__(address, DaemonRequestHandler)
+        self.service = service
+        self.verbose = verbose
+        # Without a token only requests that bring their own credentials are served
+        self.token = token
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Local text-to-speech daemon")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=get_daemon_port(), help="Defaults to TTS_DAEMON_PORT or 8765")
+    parser.add_argument('--cache-dir', help="Synthesis cache directory (defaults to the app's cache)")
+    parser.add_argument('--no-warm-up', action='store_true', help="Load provider SDKs on first request")
+    parser.add_argument('--verbose', action='store_true', help="Log every request")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    service = SynthesisService(SynthesisCache(args.cache_dir))
+    if not args.no_warm_up:
+        service.warm_up()
+
+    token = write_token_file(get_token_path())
+    server = SynthesisDaemon((args.host, args.port), service, args.verbose, token)
+    print(f"TTS daemon listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,175 @@
+import asyncio
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+from managers.audio_assembler import assemble_audio
+from managers.text_chunker import chunk_text
+
+class AsyncTTSProvider(ABC):
+    """Base asyncio provider: splits long text, limits concurrency and reassembles audio"""
+    name = None
+    # Format used when synthesize() is called without one; subclasses set it
+    default_format = None
+    DEFAULT_MAX_CONCURRENCY = 16
+
+    def __init__(self, max_chars, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        self.max_chars = max_chars
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+
+    @property
+    def semaphore(self):
+        # Created lazily so the provider can be constructed outside the event loop
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def synthesize(self, text, voice, fmt=None, **options):
+        """Synthesize text of any length and return the audio bytes"""
+        chunks = chunk_text(text, self.max_chars)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        fmt = fmt or self.default_format
+
+        async def limited(chunk):
+            async with self.semaphore:
+                return await self._synthesize_chunk(chunk, voice, fmt, **options)
+
+        audio_chunks = await asyncio.gather(*(limited(chunk) for chunk in chunks))
+        return assemble_audio(self.assembly_format(fmt), list(audio_chunks))
+
+    @abstractmethod
+    async def list_voices(self):
+        """Voices as plain dicts with id, name, language and gender"""
+
+    @abstractmethod
+    async def _synthesize_chunk(self, text, voice, fmt, **options):
+        """Synthesize one request-sized chunk and return its audio bytes"""
+
+    def assembly_format(self, fmt):
+        """Container format name understood by assemble_audio"""
+        return fmt
+
+class AsyncPollyProvider(AsyncTTSProvider):
+    """asyncio facade over AWSPollyManager; boto3 calls run in an executor on the pooled client"""
+    name = "polly"
+    default_format = "mp3"
+
+    def __init__(self, polly_manager, region, engine="neural",
+                 max_concurrency=AsyncTTSProvider.DEFAULT_MAX_CONCURRENCY, executor=None):
+        super().__init__(polly_manager.MAX_REQUEST_CHARS, max_concurrency)
+        self.polly_manager = polly_manager
+        self.region = region
+        self.engine = engine
+        # Size polly_manager.client_pool's max_pool_connections to at least max_concurrency
+        self.executor = executor or ThreadPoolExecutor(max_workers=max_concurrency,
+                                                       thread_name_prefix="polly-async")
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
+    async def _synthesize_chunk(self, text, voice, fmt, sample_rate=None, engine=None, **options):
+        sample_rate = sample_rate or self.polly_manager.get_sample_rates(fmt)[-1]
+
+        def call():
+            response = self.polly_manager.synthesize_speech(
+                self.region, text, voice, engine or self.engine, fmt, str(sample_rate)
+            )
+            return response['AudioStream'].read()
+
+        return await self._run(call)
+
+    async def list_voices(self):
+        """Voices for the provider's region and engine as plain dicts"""
+        voices = await self._run(self.polly_manager.load_voices, self.region, self.engine)
+        return [
+            {'id': v['Id'], 'name': v.get('Name', v['Id']), 'language': v['LanguageCode'], 'gender': v['Gender']}
+            for v in voices
+        ]
+
+class _SynthesisCompletionBridge:
+    """Resolves an asyncio future from a pooled synthesizer's completion events"""
+    def __init__(self, synthesizer):
+        self._loop = None
+        self._future = None
+        synthesizer.synthesis_completed.connect(self._on_done)
+        synthesizer.synthesis_canceled.connect(self._on_done)
+
+    def arm(self, loop, future):
+        """Resolve future, created on loop's thread, when the next request completes"""
+        self._loop = loop
+        self._future = future
+
+    def _on_done(self, event):
+        loop, future = self._loop, self._future
+        if loop is not None and future is not None:
+            loop.call_soon_threadsafe(self._resolve, future, event.result)
+
+    @staticmethod
+    def _resolve(future, result):
+        if not future.done():
+            future.set_result(result)
+
+class AsyncAzureProvider(AsyncTTSProvider):
+    """asyncio facade over AzureSpeechManager that awaits SDK events instead of blocking a thread"""
+    name = "azure"
+
+    def __init__(self, speech_manager, credentials, max_concurrency=AsyncTTSProvider.DEFAULT_MAX_CONCURRENCY):
+        super().__init__(speech_manager.MAX_REQUEST_CHARS, max_concurrency)
+        self.speech_manager = speech_manager
+        self.credentials = credentials
+        self.default_format = speech_manager.DEFAULT_OUTPUT_FORMAT
+
+    def assembly_format(self, fmt):
+        return self.speech_manager.get_container_format(fmt)
+
+    async def _synthesize_chunk(self, text, voice, fmt, **options):
+        import azure.cognitiveservices.speech as speechsdk
+
+        pool = self.speech_manager.synthesizer_pool
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def start():
+            """Check out a synthesizer and start the request. Building a SpeechConfig, synthesizer
+            and connection on a pool miss blocks, so this runs in the executor."""
+            entry = pool.acquire(self.credentials.api_key, self.credentials.endpoint, voice, fmt)
+            try:
+                bridge = getattr(entry, 'async_bridge', None)
+                if bridge is None:
+                    bridge = entry.async_bridge = _SynthesisCompletionBridge(entry.synthesizer)
+                bridge.arm(loop, future)
+                # The SDK resolves the request on its own threads; only the event is awaited
+                return entry, entry.synthesizer.speak_text_async(text)
+            except BaseException:
+                entry.close()
+                raise
+
+        entry, result_future = await loop.run_in_executor(None, start)
+        try:
+            result = await future
+            del result_future
+        except BaseException:
+            entry.close()
+            raise
+        pool.release(entry)
+
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
+            raise Exception(self.speech_manager._format_synthesis_error(result))
+        return result.audio_data
+
+    async def list_voices(self):
+        """Voices for the configured endpoint as plain dicts; the manager's loaded voices are untouched"""
+        loop = asyncio.get_running_loop()
+        records = await loop.run_in_executor(
+            None,
+            self.speech_manager.fetch_voice_records,
+            self.credentials.api_key,
+            self.credentials.endpoint
+        )
+        return [
+            {'id': v['short_name'], 'name': v['local_name'], 'language': v['locale'], 'gender': v['gender']}
+            for v in records
+        ]
@@ -0,0 +1,145 @@
+import struct
+
+def build_wav_header(data_length, sample_rate, channels=1, bits_per_sample=16):
+    """Build a 44-byte PCM WAV header for data_length bytes of audio"""
+    block_align = channels * bits_per_sample // 8
+    return b''.join([
+        b'RIFF',
+        struct.pack('<I', 36 + data_length),
+        b'WAVE',
+        b'fmt ',
+        struct.pack('<I', 16),
+        struct.pack('<H', 1),
+        struct.pack('<H', channels),
+        struct.pack('<I', sample_rate),
+        struct.pack('<I', sample_rate * block_align),
+        struct.pack('<H', block_align),
+        struct.pack('<H', bits_per_sample),
+        b'data',
+        struct.pack('<I', data_length)
+    ])
+
+def build_streaming_wav_header(sample_rate, channels=1, bits_per_sample=16):
+    """Build a WAV header for a stream of unknown length (sizes set to the maximum)"""
+    return build_wav_header(0xFFFFFFFF - 36, sample_rate, channels, bits_per_sample)
+
+def _strip_id3(data, keep_leading=False, keep_trailing=False):
+    """Remove ID3v2 (leading) and ID3v1 (trailing) tags so frames concatenate cleanly"""
+    if not keep_leading and data[:3] == b'ID3' and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        has_footer = data[5] & 0x10
+        data = data[10 + size + (10 if has_footer else 0):]
+    if not keep_leading:
+        # Skip anything before the first frame sync
+        for i in range(len(data) - 1):
+            if data[i] == 0xFF and (data[i + 1] & 0xE0) == 0xE0:
+                data = data[i:]
+                break
+    if not keep_trailing and len(data) >= 128 and data[-128:-125] == b'TAG':
+        data = data[:-128]
+    return data
+
+def join_mp3(chunks):
+    """Concatenate MP3 streams frame-wise, keeping only the first header tag and last trailer tag"""
+    last = len(chunks) - 1
+    return b''.join(
+        _strip_id3(chunk, keep_leading=(i == 0), keep_trailing=(i == last))
+        for i, chunk in enumerate(chunks)
+    )
+
+def join_pcm(chunks):
+    """Append raw PCM chunks"""
+    return b''.join(chunks)
+
+def parse_wav(data):
+    """Return (fmt_chunk_bytes, pcm_data) from a RIFF WAV byte string"""
+    if data[:4] != b'RIFF' or data[8:12] != b'WAVE':
+        raise ValueError("Not a RIFF WAV stream")
+    fmt = None
+    pos = 12
+    while pos + 8 <= len(data):
+        chunk_id = data[pos:pos + 4]
+        size = struct.unpack('<I', data[pos + 4:pos + 8])[0]
+        body = data[pos + 8:pos + 8 + size]
+        if chunk_id == b'fmt ':
+            fmt = body
+        elif chunk_id == b'data':
+            return fmt, body
+        pos += 8 + size + (size & 1)
+    raise ValueError("WAV stream has no data chunk")
+
+def join_wav(chunks):
+    """Merge RIFF WAV chunks into one file with a single header"""
+    fmt = None
+    pcm_parts = []
+    for chunk in chunks:
+        chunk_fmt, pcm = parse_wav(chunk)
+        fmt = fmt or chunk_fmt
+        pcm_parts.append(pcm)
+    pcm = b''.join(pcm_parts)
+    channels, sample_rate = struct.unpack('<HI', fmt[2:8])
+    bits_per_sample = struct.unpack('<H', fmt[14:16])[0]
+    return build_wav_header(len(pcm), sample_rate, channels, bits_per_sample) + pcm
+
+def _ogg_crc_table():
+    table = []
+    for i in range(256):
+        crc = i << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else (crc << 1)
+        table.append(crc & 0xFFFFFFFF)
+    return table
+
+_OGG_CRC_TABLE = _ogg_crc_table()
+
+def _ogg_crc(page):
+    crc = 0
+    for byte in page:
+        crc = ((crc << 8) & 0xFFFFFFFF) ^ _OGG_CRC_TABLE[((crc >> 24) & 0xFF) ^ byte]
+    return crc
+
+def iter_ogg_pages(data):
+    """Yield raw Ogg pages from a byte string"""
+    pos = 0
+    while pos + 27 <= len(data):
+        if data[pos:pos + 4] != b'OggS':
+            raise ValueError(f"Invalid Ogg page at offset {pos}")
+        segment_count = data[pos + 26]
+        lacing = data[pos + 27:pos + 27 + segment_count]
+        end = pos + 27 + segment_count + sum(lacing)
+        yield data[pos:end]
+        pos = end
+
+def join_ogg(chunks):
+    """Chain Ogg streams, giving each link unique serial numbers and fresh page CRCs"""
+    pages = []
+    next_serial = 1
+    for chunk in chunks:
+        serial_map = {}
+        for page in iter_ogg_pages(chunk):
+            page = bytearray(page)
+            serial = struct.unpack('<I', page[14:18])[0]
+            if serial not in serial_map:
+                serial_map[serial] = next_serial
+                next_serial += 1
+            page[14:18] = struct.pack('<I', serial_map[serial])
+            page[22:26] = b'\x00\x00\x00\x00'
+            page[22:26] = struct.pack('<I', _ogg_crc(page))
+            pages.append(bytes(page))
+    return b''.join(pages)
+
+def assemble_audio(output_format, chunks):
+    """Reassemble per-request audio chunks, in order, into a single stream"""
+    if len(chunks) == 1:
+        return chunks[0]
+    if output_format == 'mp3':
+        return join_mp3(chunks)
+    if output_format in ('ogg_vorbis', 'ogg', 'ogg_opus'):
+        return join_ogg(chunks)
+    if output_format == 'pcm':
+        return join_pcm(chunks)
+    if output_format == 'wav':
+        return join_wav(chunks)
+    raise ValueError(f"Unsupported output format: {output_format}")
@@ -0,0 +1,116 @@
+import platform
+import shutil
+import subprocess
+import time
+
+from managers.audio_assembler import build_streaming_wav_header
+
+def get_stream_player_command(output_format, sample_rate=None):
+    """Return a command that plays audio of output_format from stdin, or None if unavailable"""
+    if shutil.which("ffplay"):
+        return ["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", "-i", "pipe:0"]
+    if platform.system() == "Linux":
+        if output_format == 'pcm' and shutil.which("aplay"):
+            # A WAV header is emitted ahead of the raw samples
+            return ["aplay", "-q", "-"]
+        if output_format == 'mp3' and shutil.which("mpg123"):
+            return ["mpg123", "-q", "-"]
+        if output_format == 'ogg_vorbis' and shutil.which("ogg123"):
+            return ["ogg123", "-q", "-"]
+    return None
+
+class PlayerProcessSink:
+    """Audio sink that pipes chunks into a player process's stdin"""
+    def __init__(self, command):
+        self.process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def write(self, chunk):
+        try:
+            self.process.stdin.write(chunk)
+            self.process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            # Player exited early (e.g. terminated on cancel)
+            pass
+
+    def close(self):
+        """Signal end of stream and wait for playback to finish"""
+        try:
+            self.process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.wait()
+
+    def terminate(self):
+        self.process.terminate()
+
+class CallbackSink:
+    """In-process audio sink that hands each chunk to a callable"""
+    def __init__(self, on_chunk, on_close=None):
+        self.on_chunk = on_chunk
+        self.on_close = on_close
+
+    def write(self, chunk):
+        self.on_chunk(chunk)
+
+    def close(self):
+        if self.on_close:
+            self.on_close()
+
+    def terminate(self):
+        pass
+
+class AudioStreamer:
+    """Copies an audio stream into a sink as chunks arrive and times first audio"""
+    DEFAULT_CHUNK_SIZE = 4096
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+
+    def _iter_chunks(self, audio_stream):
+        if hasattr(audio_stream, 'iter_chunks'):
+            yield from audio_stream.iter_chunks(self.chunk_size)
+            return
+        while True:
+            chunk = audio_stream.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    def stream(self, audio_stream, sink, output_format, sample_rate=None, started_at=None,
+               cancel_check=None, on_chunk=None):
+        """Stream audio into sink; returns timing stats measured from started_at.
+        on_chunk receives each provider chunk (without any added WAV header)."""
+        started_at = started_at if started_at is not None else time.perf_counter()
+        time_to_first_audio = None
+        total_bytes = 0
+
+        try:
+            if output_format == 'pcm':
+                sink.write(build_streaming_wav_header(int(sample_rate)))
+
+            for chunk in self._iter_chunks(audio_stream):
+                if cancel_check:
+                    cancel_check()
+                if not chunk:
+                    continue
+                sink.write(chunk)
+                if on_chunk:
+                    on_chunk(chunk)
+                total_bytes += len(chunk)
+                if time_to_first_audio is None:
+                    time_to_first_audio = time.perf_counter() - started_at
+            download_time = time.perf_counter() - started_at
+        finally:
+            sink.close()
+
+        return {
+            'time_to_first_audio': time_to_first_audio,
+            'download_time': download_time,
+            'total_time': time.perf_counter() - started_at,
+            'bytes': total_bytes
+        }
@@ -0,0 +1,67 @@
+import hashlib
+import threading
+
+import boto3
+from botocore.config import Config
+
+class AWSClientPool:
+    """Thread-safe pool of reusable boto3 sessions and clients keyed by region and credentials"""
+    DEFAULT_MAX_POOL_CONNECTIONS = 10
+
+    def __init__(self, max_pool_connections=DEFAULT_MAX_POOL_CONNECTIONS, tcp_keepalive=True):
+        self.max_pool_connections = max_pool_connections
+        self.tcp_keepalive = tcp_keepalive
+        self._sessions = {}
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _credentials_hash(access_key, secret_key):
+        """Hash credentials so raw secrets are never used as dictionary keys"""
+        return hashlib.sha256(f"{access_key}:{secret_key}".encode("utf-8")).hexdigest()[:16]
+
+    def _get_session_locked(self, access_key, secret_key, key_hash):
+        """Get or create a session; caller must hold the lock"""
+        session = self._sessions.get(key_hash)
+        if session is None:
+            session = boto3.Session(
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key
+            )
+            self._sessions[key_hash] = session
+        return session
+
+    def get_session(self, access_key, secret_key):
+        """Get a shared boto3 session for the given credentials"""
+        key_hash = self._credentials_hash(access_key, secret_key)
+        with self._lock:
+            return self._get_session_locked(access_key, secret_key, key_hash)
+
+    def get_client(self, service, region, access_key, secret_key):
+        """Get a shared client for (service, region, credentials), creating it on first use"""
+        key_hash = self._credentials_hash(access_key, secret_key)
+        key = (service, region, key_hash)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                # boto3 sessions are not thread-safe, so clients are built under the lock;
+                # the clients themselves can be shared freely between threads
+                session = self._get_session_locked(access_key, secret_key, key_hash)
+                client = session.client(
+                    service,
+                    region_name=region,
+                    config=Config(
+                        max_pool_connections=self.max_pool_connections,
+                        tcp_keepalive=self.tcp_keepalive
+                    )
+                )
+                self._clients[key] = client
+            return client
+
+    def invalidate(self):
+        """Drop all pooled sessions and clients, e.g. after credentials change.
+        Dropped clients are not closed: worker jobs may still be using them, and their
+        connections are released when the last request finishes and the client is collected."""
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
@@ -1,5 +1,12 @@
+import time
+
 import boto3
 
+from managers.aws_client_pool import AWSClientPool
+from managers.chunked_synthesis import ChunkedSynthesizer
+from managers.polly_voice_catalog import PollyVoiceCatalog
+from managers.synthesis_metrics import STAGE_CLIENT_SETUP, STAGE_DOWNLOAD, STAGE_FIRST_BYTE, SynthesisMetrics
+
 class AWSPollyManager:
     """Manages AWS Polly operations and configurations"""
     ENGINE_REGIONS = {
@@ -27,29 +34,70 @@ class AWSPollyManager:
         'ogg_vorbis': ["8000", "16000", "22050", "24000"], 
         'pcm': ["8000", "16000"]
     }
+    
+    # Polly rejects requests with more than 3000 billed characters
+    MAX_REQUEST_CHARS = 3000
+    
+    # On-demand list prices in USD per million characters, used for estimates only
+    PRICE_PER_MILLION_CHARS = {
+        'standard': 4.0,
+        'neural': 16.0,
+        'long-form': 100.0,
+        'generative': 30.0
+    }
 
-    def __init__(self, access_key_var, secret_key_var):
-        self.access_key_var = access_key_var
-        self.secret_key_var = secret_key_var
+    def __init__(self, credentials=None, client_pool=None, metrics=None):
+        self.credentials = credentials
+        self.client_pool = client_pool or AWSClientPool()
+        self.metrics = metrics or SynthesisMetrics()
         self.language_map = {}
         self.voices_data = {}
+        self.voice_catalog = PollyVoiceCatalog()
+        self.chunked_synthesizer = ChunkedSynthesizer(self.MAX_REQUEST_CHARS)
+
+    def set_credentials(self, credentials):
+        """Replace the AWSCredentials snapshot used for subsequent calls"""
+        self.credentials = credentials
 
-    def _get_client(self, region):
-        """Get Polly client"""
-        return boto3.client(
-            'polly',
-            aws_access_key_id=self.access_key_var.get(),
-            aws_secret_access_key=self.secret_key_var.get(),
-            region_name=region
+    @staticmethod
+    def verify_credentials(credentials):
+        """Check credentials with an STS call on a throwaway session, leaving the pool untouched;
+        raises the boto3 error when they are rejected"""
+        session = boto3.Session(
+            aws_access_key_id=credentials.access_key_id,
+            aws_secret_access_key=credentials.secret_access_key
         )
+        session.client('sts').get_caller_identity()
+
+    def _require_credentials(self):
+        credentials = self.credentials
+        if credentials is None or not credentials.is_complete():
+            raise ValueError("AWS credentials are not configured")
+        return credentials
+
+    def _get_client(self, region, voice_id=None):
+        """Get pooled Polly client"""
+        credentials = self._require_credentials()
+        with self.metrics.stage('polly', voice_id, STAGE_CLIENT_SETUP):
+            return self.client_pool.get_client(
+                'polly',
+                region,
+                credentials.access_key_id,
+                credentials.secret_access_key
+            )
     
     def get_session(self):
-        """Get a boto3 session with the provided credentials"""
-        return boto3.Session(
-            aws_access_key_id=self.access_key_var.get(),
-            aws_secret_access_key=self.secret_key_var.get()
+        """Get a pooled boto3 session with the provided credentials"""
+        credentials = self._require_credentials()
+        return self.client_pool.get_session(
+            credentials.access_key_id,
+            credentials.secret_access_key
         )
 
+    def invalidate_clients(self):
+        """Drop pooled sessions and clients, e.g. after credentials change"""
+        self.client_pool.invalidate()
+
     def get_supported_regions(self):
         """Get all regions supporting Polly"""
         session = self.get_session()
@@ -61,25 +109,56 @@ class AWSPollyManager:
         return [engine for engine, regions in self.ENGINE_REGIONS.items() 
                 if region in regions]
 
+    def get_price_per_million_chars(self, engine):
+        """Estimated price for an engine, falling back to the neural price"""
+        return self.PRICE_PER_MILLION_CHARS.get(engine, self.PRICE_PER_MILLION_CHARS['neural'])
+
     def get_sample_rates(self, output_format):
         """Get sample rates for format/engine combo"""
         return self.SAMPLE_RATES.get(output_format, [])
 
+    def describe_voices(self, region, engine):
+        """Fetch every voice for region/engine from Polly, following pagination"""
+        client = self._get_client(region)
+        voices = []
+        kwargs = {'Engine': engine}
+        while True:
+            response = client.describe_voices(**kwargs)
+            voices.extend(response['Voices'])
+            if not response.get('NextToken'):
+                return voices
+            kwargs['NextToken'] = response['NextToken']
+
+    def load_voices(self, region, engine):
+        """Get all voices for region/engine, calling describe_voices only on a catalog miss"""
+        return self.voice_catalog.get_or_load(region, engine, lambda: self.describe_voices(region, engine))
+
+    def seed_voices(self, region, engine, voices):
+        """Serve region/engine lookups from previously fetched voices (e.g. a disk snapshot)"""
+        self.voice_catalog.put(region, engine, voices)
+
+    def is_voice_catalog_loaded(self, region, engine):
+        return self.voice_catalog.is_loaded(region, engine)
+
+    def get_loaded_voices(self, region, engine):
+        """Voices already in the catalog for region/engine, or None; never calls Polly"""
+        return self.voice_catalog.get_loaded(region, engine)
+
+    def invalidate_voice_catalog(self, region=None):
+        """Forget cached voices, e.g. after a region or credential change"""
+        self.voice_catalog.invalidate(region)
+
     def get_languages(self, region, engine):
         """Get available languages and store voice data"""
         try:
-            client = self._get_client(region)
-            response = client.describe_voices(Engine=engine)
+            voices = self.load_voices(region, engine)
             
             # Store both language map and voices data
-            self.language_map = {
-                v['LanguageCode']: v['LanguageName'] 
-                for v in response['Voices']
-            }
+            self.language_map = self.voice_catalog.get_language_map(region, engine)
             
             # Store voices data grouped by language code
             self.voices_data = {}
-            for voice in response['Voices']:
+            for voice in voices:
                 lang_code = voice['LanguageCode']
                 if lang_code not in self.voices_data:
                     self.voices_data[lang_code] = []
@@ -93,18 +172,8 @@ class AWSPollyManager:
     def get_voices(self, language_code, engine, region, gender_filter="All"):
         """Get voices for specific language with optional gender filter"""
         try:
-            client = self._get_client(region)
-            response = client.describe_voices(
-                Engine=engine,
-                LanguageCode=language_code
-            )
-            
-            voices = response['Voices']
-            
-            # Filter by gender if not "All"
-            if gender_filter != "All":
-                voices = [v for v in voices if v['Gender'] == gender_filter]
-            
+            self.load_voices(region, engine)
+            voices = self.voice_catalog.get_voices(region, engine, language_code, gender_filter)
             return [f"{v['Id']} ({v['Gender']})" for v in voices]
         except Exception as e:
             print(f"Error getting voices: {str(e)}")
@@ -113,17 +182,8 @@ class AWSPollyManager:
     def get_available_genders_for_language(self, language_code, engine, region):
         """Get available genders for a specific language"""
         try:
-            client = self._get_client(region)
-            response = client.describe_voices(
-                Engine=engine,
-                LanguageCode=language_code
-            )
-            
-            genders = set()
-            for voice in response['Voices']:
-                genders.add(voice['Gender'])
-            
-            return ["All"] + sorted(list(genders))
+            self.load_voices(region, engine)
+            return ["All"] + self.voice_catalog.get_genders(region, engine, language_code)
         except Exception as e:
             print(f"Error getting genders for language: {e}")
             return ["All", "Male", "Female"]
@@ -133,12 +193,25 @@ class AWSPollyManager:
         return voice_display.split(' ')[0] if voice_display else ""
 
     def synthesize_speech(self, region, text, voice_id, engine, output_format, sample_rate):
-        """Generate speech synthesis"""
-        client = self._get_client(region)
-        return client.synthesize_speech(
-            Text=text,
-            VoiceId=voice_id,
-            Engine=engine,
-            OutputFormat=output_format,
-            SampleRate=sample_rate
-        )
\ No newline at end of file
+        """Generate speech synthesis; returns once the response headers (first byte) arrive"""
+        client = self._get_client(region, voice_id)
+        with self.metrics.stage('polly', voice_id, STAGE_FIRST_BYTE):
+            return client.synthesize_speech(
+                Text=text,
+                VoiceId=voice_id,
+                Engine=engine,
+                OutputFormat=output_format,
+                SampleRate=sample_rate
+            )
+
+    def synthesize_speech_bytes(self, region, text, voice_id, engine, output_format, sample_rate,
+                                cancel_check=None):
+        """Synthesize text of any length, splitting it into parallel requests when needed"""
+        def synthesize_chunk(chunk):
+            started_at = time.perf_counter()
+            response = self.synthesize_speech(region, chunk, voice_id, engine, output_format, sample_rate)
+            audio_data = response['AudioStream'].read()
+            self.metrics.record('polly', voice_id, STAGE_DOWNLOAD, time.perf_counter() - started_at)
+            return audio_data
+
+        return self.chunked_synthesizer.synthesize(text, synthesize_chunk, output_format, cancel_check)
@@ -1,33 +1,29 @@
 import keyring
 
+from managers.credentials import AzureCredentials
+
 class AzureAuthenticationManager:
     """Handles Azure Speech Services credential storage and retrieval"""
     SERVICE_NAME = "azure_tts_app"
 
-    def __init__(self, api_key_var, endpoint_var):
-        self.api_key_var = api_key_var
-        self.endpoint_var = endpoint_var
-
     def load_credentials(self):
-        """Load saved credentials from secure storage"""
+        """Load saved credentials from secure storage, returning AzureCredentials or None"""
         try:
             api_key = keyring.get_password(self.SERVICE_NAME, "subscription_key")
             endpoint = keyring.get_password(self.SERVICE_NAME, "endpoint")
-            
+
             if api_key and endpoint:
-                self.api_key_var.set(api_key)
-                self.endpoint_var.set(endpoint)
-                return True
+                return AzureCredentials(api_key, endpoint)
         except Exception as e:
             print(f"Error loading Azure credentials: {e}")
-        return False
+        return None
 
-    def save_credentials(self, remember):
+    def save_credentials(self, credentials, remember):
         """Save credentials to secure storage if remember is True"""
         if remember:
             try:
-                keyring.set_password(self.SERVICE_NAME, "subscription_key", self.api_key_var.get())
-                keyring.set_password(self.SERVICE_NAME, "endpoint", self.endpoint_var.get())
+                keyring.set_password(self.SERVICE_NAME, "subscription_key", credentials.api_key)
+                keyring.set_password(self.SERVICE_NAME, "endpoint", credentials.endpoint)
                 return True
             except Exception as e:
                 print(f"Error saving Azure credentials: {e}")
@@ -1,71 +1,142 @@
 import os
-import tempfile
+import time
 from datetime import datetime
 import azure.cognitiveservices.speech as speechsdk
-from babel import Locale as BabelLocale
-from babel.core import UnknownLocaleError
+
+from managers.azure_synthesizer_pool import AzureSynthesizerPool
+from managers.chunked_synthesis import ChunkedSynthesizer
+from managers.locale_names import get_locale_display_name
+from managers.synthesis_metrics import STAGE_DOWNLOAD, STAGE_FIRST_BYTE, SynthesisMetrics
 
 class AzureSpeechManager:
     """Manages Azure Speech Services TTS operations"""
     
-    def __init__(self):
+    # Long texts are split into requests of this size and synthesized in parallel
+    MAX_REQUEST_CHARS = 3000
+    
+    # Neural voice list price in USD per million characters, used for estimates only
+    PRICE_PER_MILLION_CHARS = 15.0
+    
+    # In-memory synthesis output used for playback, saving and chunk assembly
+    DEFAULT_OUTPUT_FORMAT = "Riff24Khz16BitMonoPcm"
+    
+    # Headerless output read incrementally for streamed playback
+    STREAM_OUTPUT_FORMAT = "Raw24Khz16BitMonoPcm"
+    STREAM_SAMPLE_RATE = 24000
+    STREAM_CHUNK_SIZE = 4096
+    
+    TEST_VOICE = "en-US-AvaMultilingualNeural"
+    
+    OUTPUT_FORMATS = ['mp3', 'ogg_opus', 'wav', 'pcm']
+    
+    SAMPLE_RATES = {
+        'mp3': ["16000", "24000", "48000"],
+        'ogg_opus': ["16000", "24000", "48000"],
+        'wav': ["8000", "16000", "22050", "24000", "44100", "48000"],
+        'pcm': ["8000", "16000", "22050", "24000", "44100", "48000"]
+    }
+    
+    OUTPUT_EXTENSIONS = {'mp3': 'mp3', 'ogg_opus': 'ogg', 'wav': 'wav', 'pcm': 'pcm'}
+    
+    # Mono 16-bit SpeechSynthesisOutputFormat names, keyed by output format and sample rate
+    SDK_OUTPUT_FORMATS = {
+        ('mp3', "16000"): "Audio16Khz32KBitRateMonoMp3",
+        ('mp3', "24000"): "Audio24Khz48KBitRateMonoMp3",
+        ('mp3', "48000"): "Audio48Khz96KBitRateMonoMp3",
+        ('ogg_opus', "16000"): "Ogg16Khz16BitMonoOpus",
+        ('ogg_opus', "24000"): "Ogg24Khz16BitMonoOpus",
+        ('ogg_opus', "48000"): "Ogg48Khz16BitMonoOpus",
+        ('wav', "8000"): "Riff8Khz16BitMonoPcm",
+        ('wav', "16000"): "Riff16Khz16BitMonoPcm",
+        ('wav', "22050"): "Riff22050Hz16BitMonoPcm",
+        ('wav', "24000"): "Riff24Khz16BitMonoPcm",
+        ('wav', "44100"): "Riff44100Hz16BitMonoPcm",
+        ('wav', "48000"): "Riff48Khz16BitMonoPcm",
+        ('pcm', "8000"): "Raw8Khz16BitMonoPcm",
+        ('pcm', "16000"): "Raw16Khz16BitMonoPcm",
+        ('pcm', "22050"): "Raw22050Hz16BitMonoPcm",
+        ('pcm', "24000"): "Raw24Khz16BitMonoPcm",
+        ('pcm', "44100"): "Raw44100Hz16BitMonoPcm",
+        ('pcm', "48000"): "Raw48Khz16BitMonoPcm",
+    }
+    
+    def __init__(self, synthesizer_pool=None, metrics=None):
         self.available_voices = []
         self.language_voice_map = {}
         self.voices_loaded = False
+        self._voices_by_short_name = {}
+        self._short_name_by_display = {}
+        self._displays_by_language_gender = {}
+        self._genders_by_language = {}
+        self.chunked_synthesizer = ChunkedSynthesizer(self.MAX_REQUEST_CHARS)
+        self.metrics = metrics or SynthesisMetrics()
+        self.synthesizer_pool = synthesizer_pool or AzureSynthesizerPool(metrics=self.metrics)
     
     def test_credentials(self, api_key, endpoint):
         """Test Azure credentials by attempting a simple synthesis"""
         try:
-            # Test the credentials by creating a speech config
-            speech_config = speechsdk.SpeechConfig(subscription=api_key, endpoint=endpoint)
-            speech_config.speech_synthesis_voice_name = "en-US-AvaMultilingualNeural"
-            
             # Simple test synthesis to verify credentials
-            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
-            result = synthesizer.speak_text_async("test").get()
+            with self.synthesizer_pool.synthesizer(api_key, endpoint, self.TEST_VOICE) as synthesizer:
+                result = synthesizer.speak_text_async("test").get()
             
             return result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted
         except Exception as e:
             raise Exception(f"Credential verification failed: {str(e)}")
     
+    def invalidate_synthesizers(self):
+        """Close pooled synthesizers, e.g. after credentials change"""
+        self.synthesizer_pool.invalidate()
+    
+    def preconnect(self, api_key, endpoint, voice_short_name):
+        """Open a connection for voice ahead of time so the next playback skips setup"""
+        self.synthesizer_pool.preconnect(api_key, endpoint, voice_short_name, self.STREAM_OUTPUT_FORMAT)
+    
     def fetch_available_voices(self, api_key, endpoint):
         """Fetch available voices using Azure Speech SDK"""
         try:
-            # Create speech config
-            speech_config = speechsdk.SpeechConfig(
-                subscription=api_key,
-                endpoint=endpoint
-            )
-            
-            # Create synthesizer to get voice list
-            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
-            
-            # Get voices using the synthesizer
-            voices_result = synthesizer.get_voices_async().get()
-            
-            if voices_result.reason == speechsdk.ResultReason.VoicesListRetrieved:
-                self._process_voices_from_sdk(voices_result.voices)
-                self.voices_loaded = True
-                return True, f"Successfully loaded {len(self.available_voices)} voices"
-            else:
-                error_msg = f"Failed to fetch voices: {voices_result.reason}"
-                if hasattr(voices_result, 'error_details') and voices_result.error_details:
-                    error_msg += f" - {voices_result.error_details}"
-                return False, error_msg
-                
+            self.load_voice_records(self.fetch_voice_records(api_key, endpoint))
+            return True, f"Successfully loaded {len(self.available_voices)} voices"
         except Exception as e:
             return False, f"Error fetching voices: {str(e)}"
     
+    def fetch_voice_records(self, api_key, endpoint):
+        """Fetch the voice list as plain records without changing the loaded voices"""
+        with self.synthesizer_pool.synthesizer(api_key, endpoint) as synthesizer:
+            voices_result = synthesizer.get_voices_async().get()
+        if voices_result.reason != speechsdk.ResultReason.VoicesListRetrieved:
+            error_msg = f"Failed to fetch voices: {voices_result.reason}"
+            if getattr(voices_result, 'error_details', None):
+                error_msg += f" - {voices_result.error_details}"
+            raise Exception(error_msg)
+        return self.voice_records_from_sdk(voices_result.voices)
+    
+    @staticmethod
+    def voice_records_from_sdk(voices_list):
+        """Convert SDK VoiceInfo objects to JSON-serializable records"""
+        return [
+            {
+                "short_name": voice.short_name,
+                "local_name": voice.local_name,
+                "locale": voice.locale,
+                "gender": voice.gender.name if hasattr(voice.gender, 'name') else str(voice.gender)
+            }
+            for voice in voices_list
+        ]
+    
     def _process_voices_from_sdk(self, voices_list):
         """Process the voices data from Azure SDK and organize by language"""
-        self.available_voices = voices_list
+        self.load_voice_records(self.voice_records_from_sdk(voices_list))
+    
+    def load_voice_records(self, records):
+        """Organize voice records (fresh or from a disk snapshot) by language"""
+        self.available_voices = records
         self.language_voice_map = {}
         
         # Group voices by locale
-        for voice in voices_list:
-            locale = voice.locale
-            display_name = voice.local_name
-            short_name = voice.short_name
+        for voice in records:
+            locale = voice["locale"]
+            display_name = voice["local_name"]
+            short_name = voice["short_name"]
             
             if not locale or not short_name:
                 continue
@@ -80,7 +151,7 @@ class AzureSpeechManager:
                 }
             
             # Add voice with display name and gender info if available
-            gender = voice.gender.name if hasattr(voice.gender, 'name') else str(voice.gender)
+            gender = voice["gender"]
             voice_display = f"{short_name}"
             if display_name and display_name != short_name:
                 voice_display += f" ({display_name})"
@@ -97,24 +168,33 @@ class AzureSpeechManager:
         # Sort languages and voices
         for lang_data in self.language_voice_map.values():
             lang_data["voices"].sort(key=lambda x: x["display"])
+        
+        self._build_voice_indexes()
+        self.voices_loaded = True
     
-    def _get_dynamic_language_name(self, voice, locale):
-        """Get language name dynamically from voice data or use babel library"""
-        # Ensure we never return None
-        if not locale:
-            return "Unknown"
-            
-        try:
-            # Convert locale format (en-US to en_US)
-            babel_locale = locale.replace('-', '_')
-            loc = BabelLocale.parse(babel_locale)
-            display_name = loc.display_name
-            # Ensure display_name is not None
-            return display_name if display_name else locale
-        except (UnknownLocaleError, ValueError):
-            pass
+    def _build_voice_indexes(self):
+        """Index voices so lookups and gender filtering are dictionary hits"""
+        self._voices_by_short_name = {}
+        self._short_name_by_display = {}
+        self._displays_by_language_gender = {}
+        self._genders_by_language = {}
         
-        return str(locale) if locale else "Unknown"
+        for lang_name, lang_data in self.language_voice_map.items():
+            genders = set()
+            for voice in lang_data["voices"]:
+                gender = voice.get("gender") or "Unknown"
+                self._voices_by_short_name[voice["short_name"]] = voice
+                self._short_name_by_display[(lang_name, voice["display"])] = voice["short_name"]
+                self._displays_by_language_gender.setdefault(
+                    (lang_name, gender.lower()), []
+                ).append(voice["display"])
+                if gender != "Unknown":
+                    genders.add(gender)
+            self._genders_by_language[lang_name] = sorted(genders)
+    
+    def _get_dynamic_language_name(self, voice, locale):
+        """Get language name from the prebuilt table or Babel, memoized per locale"""
+        return get_locale_display_name(locale)
     
     def get_languages(self):
         """Get list of available languages"""
@@ -135,112 +215,128 @@ class AzureSpeechManager:
     
     def get_voice_short_name(self, voice_display, language):
         """Get the actual voice short name from the display name"""
-        if language not in self.language_voice_map:
-            return voice_display
-        
-        voices_data = self.language_voice_map[language]["voices"]
-        for voice in voices_data:
-            if voice["display"] == voice_display:
-                return voice["short_name"]
-        
-        return voice_display
+        return self._short_name_by_display.get((language, voice_display), voice_display)
     
     def get_voice_gender(self, voice_short_name):
         """Get the gender of a voice by its short name"""
-        try:
-            # Search through all languages for the voice
-            for lang_data in self.language_voice_map.values():
-                for voice in lang_data["voices"]:
-                    if voice["short_name"] == voice_short_name:
-                        return voice.get("gender", "Unknown")
-            return None
-        except Exception as e:
-            print(f"Error getting voice gender: {e}")
-            return None
+        voice = self._voices_by_short_name.get(voice_short_name)
+        return voice.get("gender", "Unknown") if voice else None
     
     def get_available_genders_for_language(self, language):
         """Get available genders for a specific language"""
+        if language not in self._genders_by_language:
+            return ["All"]
+        return ["All"] + self._genders_by_language[language]
+    
+    def get_sample_rates(self, output_format):
+        """Get sample rates available for an output format"""
+        return self.SAMPLE_RATES.get(output_format, [])
+    
+    def get_sdk_output_format(self, output_format, sample_rate):
+        """Map an output format and sample rate to a SpeechSynthesisOutputFormat name"""
         try:
-            if language not in self.language_voice_map:
-                return ["All"]
-            
-            voices_data = self.language_voice_map[language]["voices"]
-            genders = set()
-            
-            for voice in voices_data:
-                gender = voice.get("gender", "Unknown")
-                if gender and gender != "Unknown":
-                    genders.add(gender)
-            
-            return ["All"] + sorted(list(genders))
-        except Exception as e:
-            print(f"Error getting genders for language: {e}")
-            return ["All", "Male", "Female"]
+            return self.SDK_OUTPUT_FORMATS[(output_format, str(sample_rate))]
+        except KeyError:
+            raise ValueError(f"Unsupported Azure output format: {output_format} at {sample_rate} Hz")
     
-    def synthesize_to_file(self, text, api_key, endpoint, voice_short_name, output_path):
+    @staticmethod
+    def get_container_format(sdk_output_format):
+        """Map a SpeechSynthesisOutputFormat name to the container name used by assemble_audio"""
+        if sdk_output_format.startswith("Riff"):
+            return "wav"
+        if sdk_output_format.startswith("Raw"):
+            return "pcm"
+        if sdk_output_format.startswith("Ogg"):
+            return "ogg_opus"
+        if sdk_output_format.endswith("Mp3"):
+            return "mp3"
+        raise ValueError(f"Unsupported Azure output format: {sdk_output_format}")
+    
+    def _format_synthesis_error(self, result):
+        """Build an error message from a failed synthesis result"""
+        cancellation_details = result.cancellation_details
+        error_msg = f"Speech synthesis failed: {cancellation_details.reason}"
+        if cancellation_details.error_details:
+            error_msg += f" - {cancellation_details.error_details}"
+        return error_msg
+
+    def synthesize_to_bytes(self, text, api_key, endpoint, voice_short_name, output_format=None):
+        """Synthesize a single request in memory with a pooled synthesizer.
+        output_format is a SpeechSynthesisOutputFormat name (RIFF WAV by default)."""
+        with self.synthesizer_pool.synthesizer(
+            api_key, endpoint, voice_short_name, output_format or self.DEFAULT_OUTPUT_FORMAT
+        ) as synthesizer:
+            started_at = time.perf_counter()
+            result = synthesizer.speak_text_async(text).get()
+        
+        if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
+            raise Exception(self._format_synthesis_error(result))
+        self.metrics.record('azure', voice_short_name, STAGE_DOWNLOAD, time.perf_counter() - started_at)
+        return result.audio_data
+    
+    def synthesize_long_text(self, text, api_key, endpoint, voice_short_name, cancel_check=None,
+                             output_format=None):
+        """Synthesize text of any length as parallel requests joined into one file"""
+        output_format = output_format or self.DEFAULT_OUTPUT_FORMAT
+        return self.chunked_synthesizer.synthesize(
+            text,
+            lambda chunk: self.synthesize_to_bytes(chunk, api_key, endpoint, voice_short_name, output_format),
+            self.get_container_format(output_format),
+            cancel_check
+        )
+    
+    def synthesize_to_file(self, text, api_key, endpoint, voice_short_name, output_path, output_format=None):
         """Synthesize speech and save to file"""
         try:
-            # Configure speech synthesis
-            speech_config = speechsdk.SpeechConfig(
-                subscription=api_key, 
-                endpoint=endpoint
+            audio_data = self.synthesize_long_text(
+                text, api_key, endpoint, voice_short_name, output_format=output_format
             )
-            speech_config.speech_synthesis_voice_name = voice_short_name
-            
-            # Configure audio output
-            audio_config = speechsdk.audio.AudioOutputConfig(filename=output_path)
-            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=audio_config)
-            
-            # Synthesize speech
-            result = synthesizer.speak_text_async(text).get()
-            
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                return True, f"Audio saved to: {output_path}"
-            else:
-                cancellation_details = result.cancellation_details
-                error_msg = f"Speech synthesis failed: {cancellation_details.reason}"
-                if cancellation_details.error_details:
-                    error_msg += f" - {cancellation_details.error_details}"
-                return False, error_msg
-                
+            with open(output_path, 'wb') as f:
+                f.write(audio_data)
+            return True, f"Audio saved to: {output_path}"
         except Exception as e:
             return False, f"Error: {str(e)}"
     
-    def synthesize_to_temp_file(self, text, api_key, endpoint, voice_short_name):
-        """Synthesize speech to a temporary file and return the path"""
-        try:
-            # Configure speech synthesis
-            speech_config = speechsdk.SpeechConfig(
-                subscription=api_key, 
-                endpoint=endpoint
-            )
-            speech_config.speech_synthesis_voice_name = voice_short_name
-            
-            # Create temp file for playback
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_file:
-                tmp_path = tmp_file.name
-            
-            # Configure audio output to temp file
-            audio_config = speechsdk.audio.AudioOutputConfig(filename=tmp_path)
-            synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=audio_config)
+    def synthesize_to_stream(self, text, api_key, endpoint, voice_short_name, cancel_check=None):
+        """Return an AzureAudioStream of raw PCM that yields audio as soon as the service produces it"""
+        chunks = self.chunked_synthesizer.split(text)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        return AzureAudioStream(self, chunks, api_key, endpoint, voice_short_name, cancel_check)
+    
+    def _stream_request(self, text, api_key, endpoint, voice_short_name, chunk_size, cancel_check=None):
+        """Yield raw PCM chunks of a single request from a pooled synthesizer"""
+        with self.synthesizer_pool.synthesizer(
+            api_key, endpoint, voice_short_name, self.STREAM_OUTPUT_FORMAT
+        ) as synthesizer:
+            # Resolves once the first audio arrives rather than when synthesis completes
+            started_at = time.perf_counter()
+            result = synthesizer.start_speaking_text_async(text).get()
+            if result.reason not in (speechsdk.ResultReason.SynthesizingAudioStarted,
+                                     speechsdk.ResultReason.SynthesizingAudioCompleted):
+                raise Exception(self._format_synthesis_error(result))
+            # Only time spent waiting on the SDK counts, not time the consumer holds each chunk
+            service_time = time.perf_counter() - started_at
+            self.metrics.record('azure', voice_short_name, STAGE_FIRST_BYTE, service_time)
             
-            # Synthesize speech
-            result = synthesizer.speak_text_async(text).get()
+            audio_stream = speechsdk.AudioDataStream(result)
+            buffer = bytes(chunk_size)
+            while True:
+                if cancel_check:
+                    cancel_check()
+                read_started_at = time.perf_counter()
+                filled = audio_stream.read_data(buffer)
+                service_time += time.perf_counter() - read_started_at
+                if not filled:
+                    break
+                yield buffer[:filled]
             
-            if result.reason == speechsdk.ResultReason.SynthesizingAudioCompleted:
-                return True, tmp_path, "Audio synthesized successfully"
-            else:
-                cancellation_details = result.cancellation_details
-                error_msg = f"Speech synthesis failed: {cancellation_details.reason}"
-                if cancellation_details.error_details:
-                    error_msg += f" - {cancellation_details.error_details}"
-                return False, None, error_msg
-                
-        except Exception as e:
-            return False, None, f"Synthesis error: {str(e)}"
+            if audio_stream.status == speechsdk.StreamStatus.Canceled:
+                raise Exception(self._format_synthesis_error(audio_stream))
+            self.metrics.record('azure', voice_short_name, STAGE_DOWNLOAD, service_time)
     
-    def generate_output_filename(self, voice_short_name, output_dir=None):
-        """Generate a timestamped output filename"""
+    def generate_output_filename(self, voice_short_name, output_dir=None, output_format=None):
+        """Generate a timestamped output filename with the extension for a SpeechSynthesisOutputFormat"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if output_dir is None:
@@ -250,23 +346,31 @@ class AzureSpeechManager:
             os.makedirs(output_dir)
         
         voice_name = voice_short_name.replace("-", "_")
-        return os.path.join(output_dir, f"azure_tts_{voice_name}_{timestamp}.wav")
+        container = self.get_container_format(output_format or self.DEFAULT_OUTPUT_FORMAT)
+        extension = self.OUTPUT_EXTENSIONS.get(container, 'wav')
+        return os.path.join(output_dir, f"azure_tts_{voice_name}_{timestamp}.{extension}")
 
     def get_voices_by_gender(self, language, gender):
         """Get voices filtered by language and gender"""
-        try:
-            all_voices = self.get_voices_for_language(language)
-            if gender == "All":
-                return all_voices
-            
-            filtered_voices = []
-            for voice_display in all_voices:
-                voice_short_name = self.get_voice_short_name(voice_display, language)
-                voice_gender = self.get_voice_gender(voice_short_name)
-                if voice_gender and voice_gender.lower() == gender.lower():
-                    filtered_voices.append(voice_display)
-            
-            return filtered_voices
-        except Exception as e:
-            print(f"Error filtering voices by gender: {e}")
-            return []
+        if gender == "All":
+            return self.get_voices_for_language(language)
+        return list(self._displays_by_language_gender.get((language, gender.lower()), []))
+
+class AzureAudioStream:
+    """Raw PCM audio for one or more requests, read from the SDK while synthesis is running"""
+    def __init__(self, tts_manager, text_chunks, api_key, endpoint, voice_short_name, cancel_check=None):
+        self.tts_manager = tts_manager
+        self.text_chunks = text_chunks
+        self.api_key = api_key
+        self.endpoint = endpoint
+        self.voice_short_name = voice_short_name
+        self.cancel_check = cancel_check
+        self.sample_rate = tts_manager.STREAM_SAMPLE_RATE
+
+    def iter_chunks(self, chunk_size=None):
+        chunk_size = chunk_size or self.tts_manager.STREAM_CHUNK_SIZE
+        # Requests are streamed one after another so audio stays in order
+        for text in self.text_chunks:
+            yield from self.tts_manager._stream_request(
+                text, self.api_key, self.endpoint, self.voice_short_name, chunk_size, self.cancel_check
+            )
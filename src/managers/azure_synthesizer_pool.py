@@ -0,0 +1,118 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+import azure.cognitiveservices.speech as speechsdk
+
+from managers.synthesis_metrics import STAGE_CLIENT_SETUP
+
+class PooledSynthesizer:
+    """A SpeechSynthesizer together with its (possibly pre-opened) connection"""
+    def __init__(self, key, synthesizer, connection):
+        self.key = key
+        self.synthesizer = synthesizer
+        self.connection = connection
+
+    def close(self):
+        try:
+            self.connection.close()
+        except Exception as e:
+            print(f"Error closing Azure connection: {e}")
+
+class AzureSynthesizerPool:
+    """Thread-safe LRU pool of in-memory SpeechSynthesizers keyed by endpoint, voice and format"""
+    DEFAULT_MAX_IDLE = 8
+
+    def __init__(self, max_idle=DEFAULT_MAX_IDLE, metrics=None):
+        self.max_idle = max_idle
+        self.metrics = metrics
+        self._idle = OrderedDict()
+        self._idle_count = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(api_key, endpoint, voice_short_name=None, output_format=None):
+        """Pool key; the subscription key is hashed so it is never stored in plain form"""
+        key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+        return (endpoint, voice_short_name, output_format, key_hash)
+
+    def _create(self, key, api_key, endpoint, voice_short_name, output_format):
+        started_at = time.perf_counter()
+        speech_config = speechsdk.SpeechConfig(subscription=api_key, endpoint=endpoint)
+        if voice_short_name:
+            speech_config.speech_synthesis_voice_name = voice_short_name
+        if output_format:
+            speech_config.set_speech_synthesis_output_format(
+                getattr(speechsdk.SpeechSynthesisOutputFormat, output_format)
+            )
+        synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=None)
+        connection = speechsdk.Connection.from_speech_synthesizer(synthesizer)
+        if self.metrics:
+            self.metrics.record('azure', voice_short_name, STAGE_CLIENT_SETUP, time.perf_counter() - started_at)
+        return PooledSynthesizer(key, synthesizer, connection)
+
+    def acquire(self, api_key, endpoint, voice_short_name=None, output_format=None):
+        """Check out an idle synthesizer for the key, creating one if none is idle"""
+        key = self.make_key(api_key, endpoint, voice_short_name, output_format)
+        with self._lock:
+            entries = self._idle.get(key)
+            if entries:
+                entry = entries.pop()
+                self._idle_count -= 1
+                if not entries:
+                    del self._idle[key]
+                return entry
+        return self._create(key, api_key, endpoint, voice_short_name, output_format)
+
+    def release(self, entry):
+        """Return a synthesizer to the pool, evicting least recently used ones over max_idle"""
+        evicted = []
+        with self._lock:
+            self._idle.setdefault(entry.key, []).append(entry)
+            self._idle.move_to_end(entry.key)
+            self._idle_count += 1
+            while self._idle_count > self.max_idle:
+                oldest_key = next(iter(self._idle))
+                oldest = self._idle[oldest_key]
+                evicted.append(oldest.pop(0))
+                self._idle_count -= 1
+                if not oldest:
+                    del self._idle[oldest_key]
+
+        for old_entry in evicted:
+            old_entry.close()
+
+    @contextmanager
+    def synthesizer(self, api_key, endpoint, voice_short_name=None, output_format=None):
+        """Context manager yielding a pooled SpeechSynthesizer"""
+        entry = self.acquire(api_key, endpoint, voice_short_name, output_format)
+        try:
+            yield entry.synthesizer
+        except BaseException:
+            # The synthesizer may be in a bad state; don't hand it out again
+            entry.close()
+            raise
+        else:
+            self.release(entry)
+
+    def preconnect(self, api_key, endpoint, voice_short_name=None, output_format=None):
+        """Make sure an idle synthesizer with an open connection exists for the key"""
+        key = self.make_key(api_key, endpoint, voice_short_name, output_format)
+        with self._lock:
+            if self._idle.get(key):
+                self._idle.move_to_end(key)
+                return
+        entry = self._create(key, api_key, endpoint, voice_short_name, output_format)
+        entry.connection.open(True)
+        self.release(entry)
+
+    def invalidate(self):
+        """Close and drop every idle synthesizer, e.g. after credentials change"""
+        with self._lock:
+            entries = [entry for entries in self._idle.values() for entry in entries]
+            self._idle.clear()
+            self._idle_count = 0
+        for entry in entries:
+            entry.close()
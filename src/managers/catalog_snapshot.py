@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+from managers.synthesis_cache import SynthesisCache
+
+class CatalogSnapshot:
+    """One section of a provider's voice catalog (e.g. a region's voices) and when it was fetched"""
+    def __init__(self, provider, account_id, section, value, fetched_at):
+        self.provider = provider
+        self.account_id = account_id
+        self.section = section
+        self.value = value
+        self.fetched_at = fetched_at
+
+    def age_seconds(self):
+        return max(0.0, time.time() - self.fetched_at)
+
+    def format_age(self):
+        """Human-readable snapshot age, e.g. "3 days ago\""""
+        age = self.age_seconds()
+        for unit, seconds in (("day", 86400), ("hour", 3600), ("minute", 60)):
+            if age >= seconds:
+                count = int(age // seconds)
+                return f"{count} {unit}{'s' if count != 1 else ''} ago"
+        return "just now"
+
+class CatalogSnapshotStore:
+    """Voice catalogs persisted as one JSON file per provider and account/endpoint"""
+    FORMAT_VERSION = 1
+
+    def __init__(self, snapshot_dir=None):
+        self.snapshot_dir = snapshot_dir or os.path.join(SynthesisCache.default_cache_root(), "catalogs")
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_account_id(*parts):
+        """Opaque account identifier; secrets are hashed so they never reach the disk"""
+        return hashlib.sha256("\0".join(str(p) for p in parts).encode('utf-8')).hexdigest()[:24]
+
+    @staticmethod
+    def _digest(value):
+        canonical = json.dumps(value, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def _path(self, provider, account_id):
+        return os.path.join(self.snapshot_dir, f"{provider}_{account_id}.json")
+
+    def _read_sections(self, provider, account_id):
+        try:
+            with open(self._path(provider, account_id), encoding='utf-8') as f:
+                payload = json.load(f)
+            if payload.get('version') == self.FORMAT_VERSION:
+                return payload['sections']
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error reading {provider} catalog snapshot: {e}")
+        return {}
+
+    def load(self, provider, account_id, section):
+        """Return the stored CatalogSnapshot for a section, or None"""
+        with self._lock:
+            entry = self._read_sections(provider, account_id).get(section)
+        if entry is None:
+            return None
+        return CatalogSnapshot(provider, account_id, section, entry['value'], entry['fetched_at'])
+
+    def save(self, provider, account_id, section, value):
+        """Store a freshly fetched section; returns (snapshot, changed) where changed is
+        False when the catalog is identical to what was stored before"""
+        fetched_at = time.time()
+        with self._lock:
+            sections = self._read_sections(provider, account_id)
+            previous = sections.get(section)
+            changed = previous is None or self._digest(previous['value']) != self._digest(value)
+            sections[section] = {'fetched_at': fetched_at, 'value': value}
+            try:
+                os.makedirs(self.snapshot_dir, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.snapshot_dir, suffix=".tmp")
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump({'version': self.FORMAT_VERSION, 'sections': sections}, f)
+                os.replace(tmp_path, self._path(provider, account_id))
+            except OSError as e:
+                print(f"Error writing {provider} catalog snapshot: {e}")
+        return CatalogSnapshot(provider, account_id, section, value, fetched_at), changed
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from managers.audio_assembler import assemble_audio
+from managers.text_chunker import chunk_text
+
+class ChunkedSynthesizer:
+    """Splits long text into provider-sized requests and synthesizes them concurrently"""
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(self, max_chars, max_workers=DEFAULT_MAX_WORKERS):
+        self.max_chars = max_chars
+        self.max_workers = max_workers
+
+    def split(self, text):
+        """Split text into sentence-aligned chunks no longer than max_chars"""
+        return chunk_text(text, self.max_chars)
+
+    def synthesize(self, text, synthesize_chunk, output_format, cancel_check=None):
+        """Synthesize every chunk with synthesize_chunk(text) -> bytes and join the audio in order"""
+        chunks = self.split(text)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        if len(chunks) == 1:
+            return synthesize_chunk(chunks[0])
+
+        def run(chunk):
+            if cancel_check:
+                cancel_check()
+            return synthesize_chunk(chunk)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(chunks))) as executor:
+            futures = [executor.submit(run, chunk) for chunk in chunks]
+            try:
+                audio_chunks = [future.result() for future in futures]
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        return assemble_audio(output_format, audio_chunks)
@@ -0,0 +1,32 @@
+import os
+from dataclasses import dataclass, field
+
+@dataclass(frozen=True)
+class AWSCredentials:
+    """Immutable AWS credential snapshot that can be shared with worker threads or processes"""
+    access_key_id: str
+    secret_access_key: str = field(repr=False)
+
+    @classmethod
+    def from_environment(cls):
+        """Credentials from AWS_ACCESS_KEY_ID / AWS_SECRET_ACCESS_KEY, or None if unset"""
+        credentials = cls(os.environ.get('AWS_ACCESS_KEY_ID', ''), os.environ.get('AWS_SECRET_ACCESS_KEY', ''))
+        return credentials if credentials.is_complete() else None
+
+    def is_complete(self):
+        return bool(self.access_key_id and self.secret_access_key)
+
+@dataclass(frozen=True)
+class AzureCredentials:
+    """Immutable Azure Speech credential snapshot that can be shared with worker threads or processes"""
+    api_key: str = field(repr=False)
+    endpoint: str
+
+    @classmethod
+    def from_environment(cls):
+        """Credentials from AZURE_SPEECH_KEY / AZURE_SPEECH_ENDPOINT, or None if unset"""
+        credentials = cls(os.environ.get('AZURE_SPEECH_KEY', ''), os.environ.get('AZURE_SPEECH_ENDPOINT', ''))
+        return credentials if credentials.is_complete() else None
+
+    def is_complete(self):
+        return bool(self.api_key and self.endpoint)
@@ -0,0 +1,168 @@
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import asdict
+
+from managers.synthesis_cache import SynthesisCache
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+TOKEN_HEADER = "X-TTS-Token"
+# The client sends a random challenge with /health; only a daemon that can read the token file
+# can answer it, so secrets are never sent to another process listening on the port
+CHALLENGE_HEADER = "X-TTS-Challenge"
+PROOF_HEADER = "X-TTS-Proof"
+
+def get_daemon_port():
+    """Port of the local synthesis daemon, overridable with TTS_DAEMON_PORT"""
+    return int(os.environ.get('TTS_DAEMON_PORT', DEFAULT_PORT))
+
+def get_token_path():
+    """Per-user file (mode 0600) holding the token that lets callers use the daemon's saved credentials"""
+    return os.path.join(SynthesisCache.default_cache_root(), "daemon.token")
+
+def read_daemon_token():
+    try:
+        with open(get_token_path(), encoding="utf-8") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+def compute_proof(token, challenge):
+    """Answer to a client's challenge, proving knowledge of the token without revealing it"""
+    return hmac.new(token.encode('utf-8'), challenge.encode('utf-8'), hashlib.sha256).hexdigest()
+
+class DaemonUnavailableError(Exception):
+    """Raised when the synthesis daemon cannot be reached; nothing was synthesized, so callers
+    fall back to local synthesis"""
+
+class DaemonServerError(Exception):
+    """Raised when the daemon answers with a 5xx because synthesis failed on its side;
+    callers fall back to local synthesis"""
+
+class DaemonRequestError(Exception):
+    """Raised when the daemon rejects a request, or stops answering after the request was sent
+    and may already have been billed; callers must not retry locally"""
+
+class DaemonClient:
+    """Client for the local synthesis daemon (src/daemon.py); callers fall back to local synthesis"""
+    # How long a health check result is trusted before probing again
+    HEALTH_TTL = 10.0
+    HEALTH_TIMEOUT = 0.5
+    # How often a cancellable request checks whether its job was cancelled
+    CANCEL_POLL_SECONDS = 0.1
+    MAX_CONCURRENT_REQUESTS = 8
+
+    def __init__(self, host=DEFAULT_HOST, port=None, timeout=120):
+        self.base_url = f"http://{host}:{port or get_daemon_port()}"
+        self.timeout = timeout
+        self._available = None
+        self._checked_at = 0.0
+        self._executor = None
+
+    def _request(self, path, payload=None, timeout=None, headers=None):
+        # urllib.request pulls in ssl/http.client, so it is only imported off the startup path
+        import urllib.error
+        import urllib.request
+
+        headers = dict(headers or {})
+        data = None
+        if payload is not None:
+            data = json.dumps(payload).encode('utf-8')
+            headers['Content-Type'] = 'application/json'
+        request = urllib.request.Request(self.base_url + path, data=data, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=timeout or self.timeout) as response:
+                return response.read(), response.headers
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read().decode('utf-8')).get('error', str(e))
+            except ValueError:
+                message = str(e)
+            if e.code >= 500:
+                raise DaemonServerError(f"Synthesis daemon error: {message}")
+            raise DaemonRequestError(message)
+        except urllib.error.URLError as e:
+            # Raised while connecting or sending, before the daemon could act on the request
+            self._available = False
+            self._checked_at = time.monotonic()
+            raise DaemonUnavailableError(f"Synthesis daemon unavailable at {self.base_url}: {e.reason}")
+        except OSError as e:
+            # A timeout or reset while waiting for the response: the daemon may already be synthesizing
+            raise DaemonRequestError(f"Synthesis daemon stopped responding after the request was sent: {e}")
+
+    def health(self):
+        """Return the daemon's health report"""
+        body, _ = self._request('/health', timeout=self.HEALTH_TIMEOUT)
+        return json.loads(body.decode('utf-8'))
+
+    def authenticate(self):
+        """Check that the process on the port is our daemon by having it answer a fresh challenge
+        with the token only this user can read. Returns (token, health report)."""
+        token = read_daemon_token()
+        if not token:
+            raise DaemonUnavailableError("No synthesis daemon token found; is the daemon running as this user?")
+        challenge = secrets.token_hex(16)
+        body, headers = self._request('/health', timeout=self.HEALTH_TIMEOUT, headers={CHALLENGE_HEADER: challenge})
+        proof = headers.get(PROOF_HEADER)
+        if not proof or not hmac.compare_digest(proof, compute_proof(token, challenge)):
+            self._available = False
+            self._checked_at = time.monotonic()
+            raise DaemonUnavailableError(f"The process at {self.base_url} could not prove it is the synthesis daemon")
+        return token, json.loads(body.decode('utf-8'))
+
+    def is_available(self):
+        """Whether our daemon answered recently; probes at most once per HEALTH_TTL"""
+        now = time.monotonic()
+        if self._available is None or now - self._checked_at > self.HEALTH_TTL:
+            try:
+                self._available = self.authenticate()[1].get('status') == 'ok'
+            except Exception:
+                self._available = False
+            self._checked_at = now
+        return self._available
+
+    def _run_cancellable(self, func, cancel_check):
+        """Run a blocking request on a helper thread, calling cancel_check while waiting.
+        A cancelled request is abandoned; the daemon still finishes and caches it."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_REQUESTS,
+                                                thread_name_prefix="daemon-request")
+        future = self._executor.submit(func)
+        while True:
+            cancel_check()
+            try:
+                return future.result(timeout=self.CANCEL_POLL_SECONDS)
+            except TimeoutError:
+                continue
+
+    def synthesize(self, provider, text, voice, output_format, sample_rate=None, credentials=None,
+                   cancel_check=None, **options):
+        """Synthesize through the daemon and return (audio_data, source).
+        source is 'cache', 'coalesced' or 'synthesized'. The daemon is authenticated before
+        anything is sent; credentials then go over loopback so it uses the caller's account."""
+        token, _ = self.authenticate()
+        payload = {
+            'provider': provider,
+            'text': text,
+            'voice': voice,
+            'format': output_format,
+            'sample_rate': sample_rate,
+            **options
+        }
+        if credentials is not None:
+            payload['credentials'] = asdict(credentials)
+
+        def request():
+            return self._request('/synthesize', payload, headers={TOKEN_HEADER: token})
+
+        if cancel_check is None:
+            body, headers = request()
+        else:
+            body, headers = self._run_cancellable(request, cancel_check)
+        return body, headers.get('X-TTS-Source', 'synthesized')
@@ -0,0 +1,150 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from managers.audio_assembler import assemble_audio
+from managers.chunked_synthesis import ChunkedSynthesizer
+from managers.text_chunker import chunk_text
+
+class SegmentMap:
+    """Audio for each segment of the last document synthesized with one set of voice settings"""
+    def __init__(self, segments, audio_segments):
+        self.segments = segments
+        self.audio_by_segment = dict(zip(segments, audio_segments))
+
+    def get(self, segment):
+        return self.audio_by_segment.get(segment)
+
+class IncrementalSynthesizer:
+    """Re-synthesizes only the segments of a document that changed since it was last synthesized.
+    Segments are groups of whole sentences well below the provider's request limit; providers bill
+    per character rather than per request, so smaller requests cost the same on the first save
+    and make an edit re-bill only the few sentences around it."""
+    DEFAULT_MAX_WORKERS = 8
+    DEFAULT_SEGMENT_CHARS = 500
+    # Segment maps kept for the most recently used voice settings
+    MAX_DOCUMENTS = 4
+
+    def __init__(self, max_chars, max_workers=DEFAULT_MAX_WORKERS, segment_chars=DEFAULT_SEGMENT_CHARS):
+        self.max_chars = max_chars
+        self.segment_chars = min(segment_chars, max_chars)
+        self.max_workers = max_workers
+        self.chunked_synthesizer = ChunkedSynthesizer(self.segment_chars, max_workers)
+        self._maps = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _find_segment(text, segment, start):
+        """Index of segment in text at or after start, beginning and ending on whitespace; -1 if absent"""
+        index = text.find(segment, start)
+        while index >= 0:
+            end = index + len(segment)
+            if (index == 0 or text[index - 1].isspace()) and (end == len(text) or text[end].isspace()):
+                return index
+            index = text.find(segment, index + 1)
+        return -1
+
+    def split(self, text, previous=None):
+        """Split text into sentence-group segments. Segments of the previous document that still
+        appear, in order, are kept exactly as they were and only the text between them is
+        re-split, so an edit invalidates just the segment(s) it falls in."""
+        if previous is None:
+            return chunk_text(text, self.segment_chars)
+
+        segments = []
+        position = 0
+        for segment in previous.segments:
+            index = self._find_segment(text, segment, position)
+            if index < 0:
+                continue
+            segments.extend(chunk_text(text[position:index], self.segment_chars))
+            segments.append(segment)
+            position = index + len(segment)
+        segments.extend(chunk_text(text[position:], self.segment_chars))
+        return segments
+
+    def _get_map(self, settings_key):
+        with self._lock:
+            segment_map = self._maps.get(settings_key)
+            if segment_map is not None:
+                self._maps.move_to_end(settings_key)
+            return segment_map
+
+    def _put_map(self, settings_key, segment_map):
+        with self._lock:
+            self._maps[settings_key] = segment_map
+            self._maps.move_to_end(settings_key)
+            while len(self._maps) > self.MAX_DOCUMENTS:
+                self._maps.popitem(last=False)
+
+    def synthesize(self, text, settings_key, output_format, synthesize_segment, cancel_check=None):
+        """Synthesize text with synthesize_segment(text) -> bytes for each segment.
+        The first document for a settings_key (voice, engine, format...) goes through the chunked
+        path with segment-sized requests and records each segment's audio; later documents reuse
+        the audio of segments that are unchanged. Returns (audio_data, stats) counting reused and
+        synthesized segments/characters."""
+        previous = self._get_map(settings_key)
+        if previous is None:
+            return self._synthesize_chunked(text, settings_key, output_format, synthesize_segment, cancel_check)
+
+        segments = self.split(text, previous)
+        if not segments:
+            raise ValueError("No text to synthesize")
+        audio_segments = [previous.get(segment) for segment in segments]
+        # A segment that appears more than once is synthesized once
+        missing = list(dict.fromkeys(s for s, audio in zip(segments, audio_segments) if audio is None))
+
+        def run(segment):
+            if cancel_check:
+                cancel_check()
+            return synthesize_segment(segment)
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(missing))) as executor:
+                futures = [executor.submit(run, segment) for segment in missing]
+                try:
+                    synthesized = dict(zip(missing, [future.result() for future in futures]))
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+            audio_segments = [audio if audio is not None else synthesized[segment]
+                              for segment, audio in zip(segments, audio_segments)]
+
+        self._put_map(settings_key, SegmentMap(segments, audio_segments))
+        if len(segments) == 1:
+            audio_data = audio_segments[0]
+        else:
+            audio_data = assemble_audio(output_format, audio_segments)
+        return audio_data, self._stats(segments, missing)
+
+    def _synthesize_chunked(self, text, settings_key, output_format, synthesize_segment, cancel_check):
+        """Plain ChunkedSynthesizer run that also records each segment's audio for the next save"""
+        recorded = {}
+
+        def record(segment):
+            audio_data = synthesize_segment(segment)
+            recorded[segment] = audio_data
+            return audio_data
+
+        audio_data = self.chunked_synthesizer.synthesize(text, record, output_format, cancel_check)
+        segments = self.chunked_synthesizer.split(text)
+        self._put_map(settings_key, SegmentMap(segments, [recorded[segment] for segment in segments]))
+        return audio_data, self._stats(segments, segments)
+
+    @staticmethod
+    def _stats(segments, synthesized):
+        return {
+            'segments': len(segments),
+            'synthesized_segments': len(synthesized),
+            'total_chars': sum(len(s) for s in segments),
+            'synthesized_chars': sum(len(s) for s in synthesized)
+        }
+
+    @staticmethod
+    def format_stats(stats):
+        """Status text such as "re-synthesized 1 of 40 segments (480 of 19,250 characters)\""""
+        if stats['synthesized_segments'] == stats['segments']:
+            return f"synthesized {stats['segments']} segments"
+        return (f"re-synthesized {stats['synthesized_segments']} of {stats['segments']} segments "
+                f"({stats['synthesized_chars']:,} of {stats['total_chars']:,} characters)")
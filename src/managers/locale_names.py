@@ -0,0 +1,31 @@
+from functools import lru_cache
+
+try:
+    # Generated at build time by scripts/build_locale_table.py
+    from managers.locale_table import LOCALE_DISPLAY_NAMES
+except ImportError:
+    LOCALE_DISPLAY_NAMES = {}
+
+@lru_cache(maxsize=None)
+def get_locale_display_name(locale):
+    """Display name for a locale such as 'en-US', importing Babel only for locales missing from the table"""
+    if not locale:
+        return "Unknown"
+
+    display_name = LOCALE_DISPLAY_NAMES.get(locale)
+    if display_name:
+        return display_name
+
+    from babel import Locale as BabelLocale
+    from babel.core import UnknownLocaleError
+
+    try:
+        # Convert locale format (en-US to en_US)
+        loc = BabelLocale.parse(locale.replace('-', '_'))
+        display_name = loc.display_name
+        # Ensure display_name is not None
+        return display_name if display_name else locale
+    except (UnknownLocaleError, ValueError):
+        pass
+
+    return str(locale)
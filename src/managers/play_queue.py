@@ -0,0 +1,183 @@
+import itertools
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, TimeoutError
+
+from managers.synthesis_job_queue import JobCancelledError, SynthesisJob
+
+class PlayQueueItem:
+    """One prompt in the play queue and the state of its synthesis"""
+    PENDING = "pending"
+    SYNTHESIZING = "synthesizing"
+    READY = "ready"
+    PLAYING = "playing"
+    PLAYED = "played"
+    FAILED = "failed"
+
+    def __init__(self, item_id, label, synthesize, sample_rate=None):
+        self.item_id = item_id
+        self.label = label
+        # synthesize(job) -> raw PCM or RIFF WAV bytes; sample_rate is needed for raw PCM
+        self.synthesize = synthesize
+        self.sample_rate = sample_rate
+        self.state = self.PENDING
+        self.error = None
+        self.job = None
+        self.future = None
+
+class PlayQueue:
+    """Plays prompts back to back through the playback engine while the next `lookahead`
+    items are synthesized in the background, so clips follow each other without a gap"""
+    DEFAULT_LOOKAHEAD = 2
+    MAX_LOOKAHEAD = 8
+    RESULT_POLL_SECONDS = 0.1
+
+    def __init__(self, playback_engine, lookahead=DEFAULT_LOOKAHEAD):
+        self.playback_engine = playback_engine
+        self.lookahead = lookahead
+        self.current_index = None
+        self._items = []
+        self._ids = itertools.count(1)
+        self._executor = None
+        self._runner = None
+        self._stop_event = threading.Event()
+        self._clip_id = None
+        self._lock = threading.Lock()
+
+    def add(self, label, synthesize, sample_rate=None):
+        with self._lock:
+            item = PlayQueueItem(next(self._ids), label, synthesize, sample_rate)
+            self._items.append(item)
+            return item
+
+    def __len__(self):
+        return len(self._items)
+
+    def get_items(self):
+        """Snapshot of (label, state, error) for each item, for display"""
+        with self._lock:
+            return [(item.label, item.state, item.error) for item in self._items]
+
+    def is_playing(self):
+        return self._runner is not None and self._runner.is_alive()
+
+    def set_lookahead(self, lookahead):
+        self.lookahead = max(0, min(int(lookahead), self.MAX_LOOKAHEAD))
+
+    def play(self, start_index=0):
+        """Play from start_index to the end of the queue on a background thread;
+        prompts that failed to synthesize last time are retried"""
+        self.stop()
+        with self._lock:
+            for item in self._items:
+                if item.state == PlayQueueItem.FAILED:
+                    item.job = item.future = None
+                    item.state = PlayQueueItem.PENDING
+                    item.error = None
+        stop_event = threading.Event()
+        self._stop_event = stop_event
+        self._runner = threading.Thread(target=self._run, args=(start_index, stop_event), daemon=True,
+                                        name="play-queue")
+        self._runner.start()
+
+    def stop(self):
+        """Stop playback and cancel synthesis that has not finished; finished audio is kept.
+        Returns the number of prompts whose synthesis was cancelled."""
+        self._stop_event.set()
+        if self._clip_id is not None:
+            self.playback_engine.stop(self._clip_id)
+        cancelled = 0
+        with self._lock:
+            for item in self._items:
+                if item.future is not None and not item.future.done():
+                    item.job.cancel()
+                    item.future.cancel()
+                    # A prefetch still running for the old job must not overwrite this state
+                    item.job = item.future = None
+                    item.state = PlayQueueItem.PENDING
+                    cancelled += 1
+        return cancelled
+
+    def clear(self):
+        self.stop()
+        with self._lock:
+            self._items = []
+
+    def _prefetch_locked(self, index):
+        """Start synthesis of the item at index and the `lookahead` items after it"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.MAX_LOOKAHEAD, thread_name_prefix="play-queue-prefetch")
+        for item in self._items[index:index + 1 + self.lookahead]:
+            if item.future is None:
+                item.job = SynthesisJob(item.item_id, item.synthesize, (), {}, description=item.label)
+                item.future = self._executor.submit(self._synthesize, item, item.job)
+
+    def _set_state(self, item, job, state, error=None):
+        """Record a prefetch outcome unless stop() has since detached job from the item"""
+        with self._lock:
+            if item.job is job:
+                item.state = state
+                item.error = error
+
+    def _synthesize(self, item, job):
+        job.check_cancelled()
+        self._set_state(item, job, PlayQueueItem.SYNTHESIZING)
+        try:
+            audio_data = item.synthesize(job)
+        except JobCancelledError:
+            raise
+        except Exception as e:
+            self._set_state(item, job, PlayQueueItem.FAILED, str(e))
+            raise
+        self._set_state(item, job, PlayQueueItem.READY)
+        return audio_data
+
+    def _wait_for_audio(self, item, stop_event):
+        """Audio for item, or None when the queue was stopped"""
+        while not stop_event.is_set():
+            future = item.future
+            if future is None:
+                return None
+            try:
+                return future.result(timeout=self.RESULT_POLL_SECONDS)
+            except TimeoutError:
+                continue
+            except (CancelledError, JobCancelledError):
+                return None
+        return None
+
+    def _run(self, index, stop_event):
+        try:
+            while not stop_event.is_set():
+                with self._lock:
+                    if index >= len(self._items):
+                        return
+                    item = self._items[index]
+                    self.current_index = index
+                    self._prefetch_locked(index)
+
+                try:
+                    audio_data = self._wait_for_audio(item, stop_event)
+                except Exception as e:
+                    # Skip a prompt that failed to synthesize and carry on with the next
+                    print(f"Error synthesizing queued prompt {item.label}: {e}")
+                    index += 1
+                    continue
+                if audio_data is None or stop_event.is_set():
+                    return
+
+                item.state = PlayQueueItem.PLAYING
+                clip_id = self.playback_engine.play(audio_data, item.sample_rate)
+                self._clip_id = clip_id
+                if stop_event.is_set():
+                    # stop() ran before the clip id was known
+                    self.playback_engine.stop(clip_id)
+                self.playback_engine.wait(clip_id)
+                # Stop, or a clip started elsewhere, ends the queue
+                finished = self.playback_engine.is_current(clip_id)
+                item.state = PlayQueueItem.PLAYED if finished else PlayQueueItem.READY
+                if not finished:
+                    return
+                index += 1
+        finally:
+            self.current_index = None
+            self._clip_id = None
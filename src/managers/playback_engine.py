@@ -0,0 +1,446 @@
+import platform
+import shutil
+import struct
+import subprocess
+import threading
+import time
+import wave
+
+from managers.audio_assembler import parse_wav
+
+# All providers are asked for 16-bit signed little-endian PCM
+SAMPLE_WIDTH = 2
+
+class PCMRingBuffer:
+    """Fixed-size circular byte buffer addressed by absolute stream offsets.
+    Audio that has been played stays available for seeking back until it is overwritten."""
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self._data = bytearray(capacity)
+        self.reset()
+
+    def reset(self):
+        self.write_pos = 0
+        self.read_pos = 0
+        self.finished = False
+
+    def free_space(self):
+        return self.capacity - (self.write_pos - self.read_pos)
+
+    def available(self):
+        return self.write_pos - self.read_pos
+
+    def oldest_pos(self):
+        return max(0, self.write_pos - self.capacity)
+
+    def write(self, data):
+        """Append data; the caller makes sure it fits in free_space()"""
+        start = self.write_pos % self.capacity
+        first = min(len(data), self.capacity - start)
+        self._data[start:start + first] = data[:first]
+        self._data[:len(data) - first] = data[first:]
+        self.write_pos += len(data)
+
+    def read(self, size):
+        size = min(size, self.available())
+        start = self.read_pos % self.capacity
+        first = min(size, self.capacity - start)
+        data = bytes(self._data[start:start + first]) + bytes(self._data[:size - first])
+        self.read_pos += size
+        return data
+
+    def seek(self, pos):
+        self.read_pos = min(max(pos, self.oldest_pos()), self.write_pos)
+
+class NullSink:
+    """Discards audio so the engine can run headless"""
+    paced = False
+
+    def __init__(self):
+        self.bytes_written = 0
+
+    def open(self, sample_rate, channels):
+        pass
+
+    def write(self, data):
+        self.bytes_written += len(data)
+
+    def close(self):
+        pass
+
+class WavFileSink:
+    """Writes everything the engine plays to a WAV file"""
+    paced = False
+
+    def __init__(self, path):
+        self.path = path
+        self._file = None
+
+    def open(self, sample_rate, channels):
+        self.close()
+        self._file = wave.open(self.path, 'wb')
+        self._file.setnchannels(channels)
+        self._file.setsampwidth(SAMPLE_WIDTH)
+        self._file.setframerate(sample_rate)
+
+    def write(self, data):
+        self._file.writeframes(data)
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+class PipeSink:
+    """Long-lived player process reading raw PCM from stdin; restarted only when the format changes"""
+    paced = False
+
+    def __init__(self, build_command):
+        self.build_command = build_command
+        self._process = None
+
+    def open(self, sample_rate, channels):
+        self.close()
+        self._process = subprocess.Popen(
+            self.build_command(sample_rate, channels),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+
+    def write(self, data):
+        try:
+            self._process.stdin.write(data)
+            self._process.stdin.flush()
+        except (BrokenPipeError, ValueError, OSError) as e:
+            # The engine stops the clip and reopens the sink, starting a new player, on the next one
+            raise OSError(f"Audio player exited: {e}") from e
+
+    def close(self):
+        if self._process is None:
+            return
+        try:
+            self._process.stdin.close()
+            self._process.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+        self._process = None
+
+class SoundDeviceSink:
+    """In-process output through the optional sounddevice package"""
+    # stream.write() blocks at the device rate
+    paced = True
+
+    def __init__(self):
+        self._stream = None
+
+    def open(self, sample_rate, channels):
+        import sounddevice
+
+        self.close()
+        self._stream = sounddevice.RawOutputStream(samplerate=sample_rate, channels=channels, dtype='int16')
+        self._stream.start()
+
+    def write(self, data):
+        self._stream.write(data)
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+def _aplay_command(sample_rate, channels):
+    # A short device buffer keeps pause and stop responsive
+    return ["aplay", "-q", "-t", "raw", "-f", "S16_LE", "-c", str(channels), "-r", str(sample_rate),
+            "--buffer-time=100000"]
+
+def _ffplay_command(sample_rate, channels):
+    return ["ffplay", "-nodisp", "-loglevel", "quiet", "-f", "s16le", "-ar", str(sample_rate),
+            "-ac", str(channels), "-i", "pipe:0"]
+
+def create_default_sink():
+    """Best available output: sounddevice, then a persistent aplay/ffplay process; None if none"""
+    try:
+        import sounddevice
+        sounddevice.query_devices(kind='output')
+        return SoundDeviceSink()
+    except Exception:
+        # Not installed, or no PortAudio/output device
+        pass
+    if platform.system() == "Linux" and shutil.which("aplay"):
+        return PipeSink(_aplay_command)
+    if shutil.which("ffplay"):
+        return PipeSink(_ffplay_command)
+    return None
+
+class PlaybackEngine:
+    """Long-lived player: providers feed PCM clips into a ring buffer that one output thread
+    drains into a sink, with pause, resume, stop and seek"""
+    STOPPED = "stopped"
+    PLAYING = "playing"
+    PAUSED = "paused"
+
+    DEFAULT_BUFFER_SECONDS = 300
+    BLOCK_SECONDS = 0.05
+    # How far ahead of the listener unpaced sinks are fed
+    LEAD_SECONDS = 0.2
+    # Release the audio device after this long without playback
+    IDLE_CLOSE_SECONDS = 30
+
+    def __init__(self, sink=None, sink_factory=create_default_sink, buffer_seconds=DEFAULT_BUFFER_SECONDS,
+                 realtime=True):
+        self._sink = sink
+        self._sink_factory = sink_factory if sink is None else None
+        self._sink_resolved = sink is not None
+        self._sink_format = None
+        self.buffer_seconds = buffer_seconds
+        self.realtime = realtime
+
+        self.state = self.STOPPED
+        self.sample_rate = None
+        self.channels = 1
+        self._ring = None
+        self._clip = 0
+        self._paced_until = 0.0
+        self._idle_since = time.monotonic()
+        self._thread = None
+        self._shutdown = False
+        self._cond = threading.Condition()
+
+    def _get_sink(self):
+        with self._cond:
+            if not self._sink_resolved:
+                self._sink = self._sink_factory()
+                self._sink_resolved = True
+            return self._sink
+
+    def is_available(self):
+        """Whether an output sink exists; the sink is probed on first call"""
+        return self._get_sink() is not None
+
+    def _bytes_per_second(self):
+        return self.sample_rate * self.channels * SAMPLE_WIDTH
+
+    def _frame_size(self):
+        return self.channels * SAMPLE_WIDTH
+
+    def start_clip(self, sample_rate, channels=1):
+        """Stop whatever is playing and start a new clip; returns its id for write()/finish()"""
+        if self._get_sink() is None:
+            raise RuntimeError("No audio output available")
+        with self._cond:
+            self._clip += 1
+            self.sample_rate = sample_rate
+            self.channels = channels
+            capacity = self.buffer_seconds * self._bytes_per_second()
+            if self._ring is None or self._ring.capacity != capacity:
+                self._ring = PCMRingBuffer(capacity)
+            else:
+                self._ring.reset()
+            self.state = self.PLAYING
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True, name="playback-engine")
+                self._thread.start()
+            self._cond.notify_all()
+            return self._clip
+
+    def write(self, clip_id, data):
+        """Queue PCM for a clip, blocking while the buffer is full.
+        Returns False once the clip has been stopped or replaced."""
+        view = memoryview(data)
+        with self._cond:
+            while view:
+                if clip_id != self._clip:
+                    return False
+                free = self._ring.free_space()
+                if not free:
+                    self._cond.wait()
+                    continue
+                self._ring.write(view[:free])
+                view = view[free:]
+                self._cond.notify_all()
+            return clip_id == self._clip
+
+    def finish(self, clip_id):
+        """Mark the end of a clip's audio"""
+        with self._cond:
+            if clip_id == self._clip:
+                self._ring.finished = True
+                self._cond.notify_all()
+
+    def play(self, audio_data, sample_rate=None, channels=1):
+        """Play a complete clip of raw PCM or RIFF WAV; returns once it is buffered"""
+        if audio_data[:4] == b'RIFF':
+            fmt, audio_data = parse_wav(audio_data)
+            channels, sample_rate = struct.unpack('<HI', fmt[2:8])
+        clip_id = self.start_clip(sample_rate, channels)
+        self.write(clip_id, audio_data)
+        self.finish(clip_id)
+        return clip_id
+
+    def open_stream(self, sample_rate=None, channels=1):
+        """Sink-style object (write/close/terminate) that feeds one streamed clip"""
+        return EngineStreamSink(self, sample_rate, channels)
+
+    def wait(self, clip_id, timeout=None):
+        """Block until a clip has played out or been stopped; returns False on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while clip_id == self._clip and self.state != self.STOPPED:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return True
+
+    def is_current(self, clip_id):
+        """Whether clip_id is still the current clip, i.e. it was not stopped or replaced"""
+        return clip_id == self._clip
+
+    def pause(self):
+        with self._cond:
+            if self.state == self.PLAYING:
+                self.state = self.PAUSED
+                self._cond.notify_all()
+
+    def resume(self):
+        with self._cond:
+            if self.state == self.PAUSED:
+                self.state = self.PLAYING
+                self._cond.notify_all()
+
+    def toggle_pause(self):
+        if self.state == self.PAUSED:
+            self.resume()
+        else:
+            self.pause()
+
+    def stop(self, clip_id=None):
+        """Stop playback and drop buffered audio; with clip_id, only if that clip is current"""
+        with self._cond:
+            if clip_id is not None and clip_id != self._clip:
+                return
+            self._clip += 1
+            self.state = self.STOPPED
+            if self._ring:
+                self._ring.reset()
+            self._cond.notify_all()
+
+    def seek(self, seconds):
+        """Jump to a position in the current clip, within what is still buffered"""
+        with self._cond:
+            if self._ring is None or self.sample_rate is None:
+                return
+            frame = self._frame_size()
+            pos = int(seconds * self._bytes_per_second()) // frame * frame
+            self._ring.seek(pos)
+            if self.state == self.STOPPED and self._ring.available():
+                self.state = self.PAUSED
+            self._cond.notify_all()
+
+    def get_status(self):
+        """Snapshot of state, position and duration (seconds) for progress displays"""
+        with self._cond:
+            if self._ring is None or self.sample_rate is None:
+                return {'state': self.state, 'position': 0.0, 'duration': 0.0, 'complete': False}
+            bytes_per_second = self._bytes_per_second()
+            return {
+                'state': self.state,
+                'position': self._ring.read_pos / bytes_per_second,
+                'duration': self._ring.write_pos / bytes_per_second,
+                'complete': self._ring.finished
+            }
+
+    def shutdown(self):
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=2)
+        if self._sink:
+            self._sink.close()
+
+    def _next_block(self):
+        """Wait for audio to play; returns (block, format) or None on shutdown.
+        Caller holds the lock."""
+        while not self._shutdown:
+            if self.state == self.PLAYING:
+                ring = self._ring
+                frame = self._frame_size()
+                block_size = max(frame, int(self.BLOCK_SECONDS * self._bytes_per_second()) // frame * frame)
+                available = ring.available()
+                if not ring.finished:
+                    # Never split a sample while more data may follow
+                    available = available // frame * frame
+                if available:
+                    return ring.read(min(block_size, available)), (self.sample_rate, self.channels)
+                if ring.finished:
+                    self.state = self.STOPPED
+                    self._idle_since = time.monotonic()
+                    self._cond.notify_all()
+                    continue
+            elif self._sink_format and time.monotonic() - self._idle_since > self.IDLE_CLOSE_SECONDS:
+                self._sink.close()
+                self._sink_format = None
+            self._cond.wait(timeout=1.0 if self._sink_format else None)
+        return None
+
+    def _run(self):
+        while True:
+            with self._cond:
+                next_block = self._next_block()
+                if next_block is None:
+                    return
+                block, sink_format = next_block
+                # Space for a blocked writer
+                self._cond.notify_all()
+
+            try:
+                if sink_format != self._sink_format:
+                    self._sink.open(*sink_format)
+                    self._sink_format = sink_format
+                self._pace(len(block) / (sink_format[0] * sink_format[1] * SAMPLE_WIDTH))
+                self._sink.write(block)
+            except Exception as e:
+                print(f"Error playing audio: {e}")
+                self._sink_format = None
+                self.stop()
+            with self._cond:
+                self._idle_since = time.monotonic()
+
+    def _pace(self, block_seconds):
+        """Keep unpaced sinks at most LEAD_SECONDS ahead of real time"""
+        if not self.realtime or self._sink.paced:
+            return
+        now = time.monotonic()
+        self._paced_until = max(self._paced_until, now)
+        ahead = self._paced_until - now
+        if ahead > self.LEAD_SECONDS:
+            time.sleep(ahead - self.LEAD_SECONDS)
+        self._paced_until += block_seconds
+
+class EngineStreamSink:
+    """Feeds one streamed clip into a PlaybackEngine through the write/close/terminate sink interface.
+    A RIFF WAV header at the start of the stream supplies the sample rate."""
+    def __init__(self, engine, sample_rate=None, channels=1):
+        self.engine = engine
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.clip_id = None
+
+    def write(self, chunk):
+        if self.clip_id is None:
+            if chunk[:4] == b'RIFF':
+                fmt, chunk = parse_wav(chunk)
+                self.channels, self.sample_rate = struct.unpack('<HI', fmt[2:8])
+            self.clip_id = self.engine.start_clip(self.sample_rate, self.channels)
+        if chunk:
+            self.engine.write(self.clip_id, chunk)
+
+    def close(self):
+        if self.clip_id is not None:
+            self.engine.finish(self.clip_id)
+
+    def terminate(self):
+        if self.clip_id is not None:
+            self.engine.stop(self.clip_id)
@@ -0,0 +1,71 @@
+import threading
+
+class PollyVoiceCatalog:
+    """In-memory cache of Polly describe_voices results keyed by (region, engine)"""
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(self, region, engine, loader):
+        """Return cached voices for region/engine, calling loader() on a miss"""
+        key = (region, engine)
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        voices = loader()
+        with self._lock:
+            self._entries[key] = voices
+        return voices
+
+    def put(self, region, engine, voices):
+        """Store voices for region/engine, e.g. from a persisted snapshot or a refresh"""
+        with self._lock:
+            self._entries[(region, engine)] = voices
+
+    def is_loaded(self, region, engine):
+        """Check whether voices for region/engine are cached"""
+        with self._lock:
+            return (region, engine) in self._entries
+
+    def get_loaded(self, region, engine):
+        """Return cached voices for region/engine, or None, without loading or touching the counters"""
+        with self._lock:
+            return self._entries.get((region, engine))
+
+    def get_language_map(self, region, engine):
+        """Get {language_code: language_name} for region/engine"""
+        voices = self.get_loaded(region, engine) or []
+        return {v['LanguageCode']: v['LanguageName'] for v in voices}
+
+    def get_voices(self, region, engine, language_code, gender_filter="All"):
+        """Get voice records for a language with optional gender filter"""
+        voices = self.get_loaded(region, engine) or []
+        return [
+            v for v in voices
+            if v['LanguageCode'] == language_code
+            and (gender_filter == "All" or v['Gender'] == gender_filter)
+        ]
+
+    def get_genders(self, region, engine, language_code):
+        """Get the sorted set of genders available for a language"""
+        return sorted({v['Gender'] for v in self.get_voices(region, engine, language_code)})
+
+    def invalidate(self, region=None):
+        """Drop cached voices for a region, or everything when region is None"""
+        with self._lock:
+            if region is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == region]:
+                    del self._entries[key]
+
+    def get_stats(self):
+        """Return hit/miss counters"""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
@@ -0,0 +1,87 @@
+import threading
+
+class SpeculativeSynthesizer:
+    """Synthesizes the current text in the background once text and voice settings have stopped
+    changing, so a later Generate & Play is served from the synthesis cache"""
+    DEFAULT_DEBOUNCE_MS = 1500
+    # Extra characters a session may bill for audio nobody asked to play yet
+    DEFAULT_CHAR_BUDGET = 20000
+
+    def __init__(self, tk_widget, job_queue, synthesis_cache, char_budget=DEFAULT_CHAR_BUDGET,
+                 debounce_ms=DEFAULT_DEBOUNCE_MS):
+        self.tk_widget = tk_widget
+        self.job_queue = job_queue
+        self.synthesis_cache = synthesis_cache
+        self.char_budget = char_budget
+        self.debounce_ms = debounce_ms
+        self.enabled = False
+        self.chars_used = 0
+        self._after_id = None
+        self._job = None
+        self._key = None
+        self._done = None
+        self._lock = threading.Lock()
+
+    def remaining_budget(self):
+        return max(0, self.char_budget - self.chars_used)
+
+    def schedule(self, get_request):
+        """Call on every text or settings change: cancels stale work and restarts the debounce timer.
+        get_request() -> (cache_key, billed_chars, synthesize(job)) or None when nothing can be synthesized"""
+        self.cancel()
+        if self.enabled:
+            self._after_id = self.tk_widget.after(self.debounce_ms, self._start, get_request)
+
+    def cancel(self):
+        """Drop the pending timer and cancel the in-flight speculative job"""
+        if self._after_id:
+            self.tk_widget.after_cancel(self._after_id)
+            self._after_id = None
+        with self._lock:
+            job = self._job
+            self._job = self._key = self._done = None
+        if job:
+            job.cancel()
+
+    def _start(self, get_request):
+        self._after_id = None
+        request = get_request()
+        if request is None:
+            return
+        key, chars, synthesize = request
+        if chars > self.remaining_budget() or self.synthesis_cache.contains(key):
+            return
+
+        done = threading.Event()
+        job = self.job_queue.submit(
+            self._run_job,
+            synthesize,
+            chars,
+            done,
+            on_error=lambda e: print(f"Speculative synthesis failed: {e}"),
+            description="Speculative synthesis"
+        )
+        with self._lock:
+            self._job, self._key, self._done = job, key, done
+
+    def _run_job(self, job, synthesize, chars, done):
+        try:
+            job.check_cancelled()
+            # Charged once the request is actually sent; a job cancelled while queued costs nothing
+            with self._lock:
+                self.chars_used += chars
+            return synthesize(job)
+        finally:
+            done.set()
+
+    def wait_for(self, key, job):
+        """From a worker: if a speculative job for key is in flight, wait for it to fill the cache
+        rather than synthesizing (and billing) the same text twice"""
+        with self._lock:
+            if key != self._key or job is self._job:
+                return
+            speculative_job, done = self._job, self._done
+        while not done.wait(0.05):
+            job.check_cancelled()
+            if speculative_job.cancelled:
+                return
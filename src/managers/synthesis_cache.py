@@ -0,0 +1,151 @@
+import hashlib
+import json
+import os
+import platform
+import tempfile
+import threading
+
+class SynthesisCache:
+    """Content-addressed on-disk cache of synthesized audio with LRU eviction"""
+    DEFAULT_MAX_BYTES = 500 * 1024 * 1024
+    APP_DIR_NAME = "python_tts"
+
+    def __init__(self, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir or os.path.join(self.default_cache_root(), "audio")
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._approx_bytes = None
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @classmethod
+    def default_cache_root(cls):
+        """Per-user cache directory for the app"""
+        system = platform.system()
+        if system == "Windows":
+            base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+        elif system == "Darwin":
+            base = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+        else:
+            base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+        return os.path.join(base, cls.APP_DIR_NAME)
+
+    @staticmethod
+    def normalize_text(text):
+        """Collapse whitespace so trivially different inputs share an entry"""
+        return " ".join(text.split())
+
+    @classmethod
+    def make_key(cls, provider, voice, engine, output_format, sample_rate, text):
+        """Hash the synthesis parameters into a cache key"""
+        payload = json.dumps(
+            [provider, voice, engine or "", output_format, str(sample_rate or ""), cls.normalize_text(text)],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path_for(self, key):
+        return os.path.join(self.cache_dir, key[:2], key)
+
+    def contains(self, key):
+        """Whether an entry exists, without reading it or counting a hit/miss"""
+        return os.path.exists(self._path_for(key))
+
+    def get(self, key):
+        """Return cached audio bytes, or None on a miss"""
+        path = self._path_for(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # Refresh mtime so eviction treats the entry as recently used
+            os.utime(path, None)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """Store audio bytes atomically so concurrent app instances can share the directory"""
+        path = self._path_for(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error writing synthesis cache entry: {e}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._approx_bytes is not None:
+                self._approx_bytes += len(data)
+            over_budget = self._approx_bytes is None or self._approx_bytes > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def _scan(self):
+        """List (mtime, size, path) for every cache entry"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits in max_bytes"""
+        entries = self._scan()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+            except OSError:
+                pass
+        with self._lock:
+            self._approx_bytes = total
+
+    def clear(self):
+        """Remove every cached entry"""
+        for _, _, path in self._scan():
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        with self._lock:
+            self._approx_bytes = 0
+
+    def get_stats(self):
+        """Return hit/miss counters and the hit rate"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def format_stats(self):
+        """Short hit-rate summary for the status bar"""
+        stats = self.get_stats()
+        return f"Cache: {stats['hits']}/{stats['hits'] + stats['misses']} hits ({stats['hit_rate']:.0%})"
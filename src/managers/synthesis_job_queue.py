@@ -0,0 +1,160 @@
+import itertools
+import queue
+import threading
+
+class JobCancelledError(Exception):
+    """Raised inside a job when it notices it has been cancelled"""
+
+class SynthesisJob:
+    """A unit of background work submitted to SynthesisJobQueue"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, job_id, func, args, kwargs, on_success=None, on_error=None, description=""):
+        self.job_id = job_id
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.on_success = on_success
+        self.on_error = on_error
+        self.description = description
+        self.state = self.QUEUED
+        self._cancel_event = threading.Event()
+        self._cancel_callbacks = []
+        self._lock = threading.Lock()
+
+    @property
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        """Raise JobCancelledError if the job was cancelled; call between work steps"""
+        if self.cancelled:
+            raise JobCancelledError(self.description or f"Job {self.job_id}")
+
+    def add_cancel_callback(self, callback):
+        """Register callback to abort in-flight work (e.g. terminate a player process)"""
+        with self._lock:
+            if not self.cancelled:
+                self._cancel_callbacks.append(callback)
+                return
+        callback()
+
+    def cancel(self):
+        """Cancel the job whether it is still queued or already running"""
+        with self._lock:
+            if self.state in (self.DONE, self.FAILED) or self.cancelled:
+                return False
+            self._cancel_event.set()
+            callbacks = list(self._cancel_callbacks)
+            self._cancel_callbacks.clear()
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                print(f"Error cancelling job {self.job_id}: {e}")
+        return True
+
+class SynthesisJobQueue:
+    """Background worker pool that reports job results back on the Tk main thread"""
+    POLL_INTERVAL_MS = 50
+
+    def __init__(self, tk_widget, max_workers=4):
+        self.tk_widget = tk_widget
+        self.max_workers = max_workers
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._active = {}
+        self._active_lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._polling = False
+        self._workers = []
+        for i in range(max_workers):
+            worker = threading.Thread(target=self._worker_loop, name=f"synthesis-worker-{i}", daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, func, *args, on_success=None, on_error=None, description="", **kwargs):
+        """Queue func(job, *args, **kwargs); callbacks run on the Tk thread. Call from the Tk thread."""
+        job = SynthesisJob(next(self._ids), func, args, kwargs, on_success, on_error, description)
+        with self._active_lock:
+            self._active[job.job_id] = job
+        self._jobs.put(job)
+        self._ensure_polling()
+        return job
+
+    def cancel(self, job):
+        """Cancel a single job"""
+        return job.cancel()
+
+    def cancel_all(self):
+        """Cancel every queued and in-flight job, returning how many were cancelled"""
+        with self._active_lock:
+            jobs = list(self._active.values())
+        return sum(1 for job in jobs if job.cancel())
+
+    def active_jobs(self):
+        """Jobs that are queued or running"""
+        with self._active_lock:
+            return [job for job in self._active.values() if not job.cancelled]
+
+    def _worker_loop(self):
+        while True:
+            job = self._jobs.get()
+            if job.cancelled:
+                self._finish(job, SynthesisJob.CANCELLED, None)
+                continue
+
+            job.state = SynthesisJob.RUNNING
+            try:
+                result = job.func(job, *job.args, **job.kwargs)
+            except JobCancelledError:
+                self._finish(job, SynthesisJob.CANCELLED, None)
+            except Exception as e:
+                if job.cancelled:
+                    self._finish(job, SynthesisJob.CANCELLED, None)
+                else:
+                    self._finish(job, SynthesisJob.FAILED, e)
+            else:
+                state = SynthesisJob.CANCELLED if job.cancelled else SynthesisJob.DONE
+                self._finish(job, state, result)
+
+    def _finish(self, job, state, payload):
+        with job._lock:
+            job.state = state
+        self._results.put((job, payload))
+
+    def _ensure_polling(self):
+        if not self._polling:
+            self._polling = True
+            self.tk_widget.after(self.POLL_INTERVAL_MS, self._poll_results)
+
+    def _poll_results(self):
+        """Deliver finished jobs to their callbacks on the Tk thread"""
+        while True:
+            try:
+                job, payload = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            with self._active_lock:
+                self._active.pop(job.job_id, None)
+
+            try:
+                if job.state == SynthesisJob.DONE and job.on_success:
+                    job.on_success(payload)
+                elif job.state == SynthesisJob.FAILED and job.on_error:
+                    job.on_error(payload)
+            except Exception as e:
+                print(f"Error in job callback: {e}")
+
+        with self._active_lock:
+            pending = bool(self._active)
+        if pending or not self._results.empty():
+            self.tk_widget.after(self.POLL_INTERVAL_MS, self._poll_results)
+        else:
+            self._polling = False
@@ -0,0 +1,118 @@
+import json
+import math
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Stage names shared by the managers, controllers and the metrics panel
+STAGE_CLIENT_SETUP = "client_setup"
+STAGE_FIRST_BYTE = "first_byte"
+STAGE_DOWNLOAD = "download"
+STAGE_FILE_WRITE = "file_write"
+STAGE_PLAYER_LAUNCH = "player_launch"
+STAGE_FIRST_AUDIO = "first_audio"
+STAGE_TOTAL = "total"
+
+# client_setup: client/synthesizer construction (near zero when pooled)
+# first_byte: request sent to first audio byte received
+# download: request sent to last audio byte received
+# first_audio: Play pressed to audio handed to the player
+# total: Save pressed to file written
+STAGES = (
+    STAGE_CLIENT_SETUP, STAGE_FIRST_BYTE, STAGE_DOWNLOAD, STAGE_FILE_WRITE,
+    STAGE_PLAYER_LAUNCH, STAGE_FIRST_AUDIO, STAGE_TOTAL
+)
+
+class StageHistogram:
+    """Latency distribution of one stage in fixed millisecond buckets, plus recent samples"""
+    BUCKET_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    MAX_SAMPLES = 1000
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = None
+        # One bucket per bound plus an overflow bucket
+        self.buckets = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self.samples = deque(maxlen=self.MAX_SAMPLES)
+
+    def add(self, ms):
+        self.count += 1
+        self.total_ms += ms
+        self.min_ms = ms if self.min_ms is None else min(self.min_ms, ms)
+        self.max_ms = ms if self.max_ms is None else max(self.max_ms, ms)
+        index = next((i for i, bound in enumerate(self.BUCKET_BOUNDS_MS) if ms <= bound), len(self.BUCKET_BOUNDS_MS))
+        self.buckets[index] += 1
+        self.samples.append(ms)
+
+    def percentile(self, pct):
+        """Nearest-rank percentile over the recent samples"""
+        ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean_ms': self.total_ms / self.count if self.count else None,
+            'min_ms': self.min_ms,
+            'max_ms': self.max_ms,
+            'p50_ms': self.percentile(50),
+            'p95_ms': self.percentile(95),
+            'bucket_bounds_ms': list(self.BUCKET_BOUNDS_MS),
+            'buckets': list(self.buckets)
+        }
+
+class SynthesisMetrics:
+    """Thread-safe per-provider, per-voice, per-stage latency histograms"""
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, provider, voice, stage, seconds):
+        key = (provider, voice or "", stage)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = StageHistogram()
+            histogram.add(seconds * 1000)
+
+    @contextmanager
+    def stage(self, provider, voice, stage):
+        """Time the body of a with-block; failed attempts are not recorded"""
+        start = time.perf_counter()
+        yield
+        self.record(provider, voice, stage, time.perf_counter() - start)
+
+    def get_rows(self):
+        """Summaries sorted by provider, voice and pipeline stage order"""
+        with self._lock:
+            rows = [
+                dict(provider=provider, voice=voice, stage=stage, **histogram.to_dict())
+                for (provider, voice, stage), histogram in self._histograms.items()
+            ]
+        stage_order = {stage: i for i, stage in enumerate(STAGES)}
+        rows.sort(key=lambda r: (r['provider'], r['voice'], stage_order.get(r['stage'], len(STAGES)), r['stage']))
+        return rows
+
+    def export_json(self, path):
+        """Write every histogram to a JSON file for offline analysis"""
+        payload = {
+            'started_at': self.started_at,
+            'exported_at': time.time(),
+            'stages': list(STAGES),
+            'metrics': self.get_rows()
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(payload, f, indent=2)
+        return path
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+        self.started_at = time.time()
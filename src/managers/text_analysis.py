@@ -0,0 +1,34 @@
+import math
+
+# Typical neural voice speaking rate (~150 words per minute)
+CHARS_PER_SECOND = 15.0
+
+def analyze_text_length(billed_chars, max_request_chars, price_per_million_chars):
+    """Estimate requests, audio duration and cost from a billed character count"""
+    return {
+        'characters': billed_chars,
+        'requests': math.ceil(billed_chars / max_request_chars) if billed_chars else 0,
+        'duration_seconds': billed_chars / CHARS_PER_SECOND,
+        'cost': billed_chars * price_per_million_chars / 1_000_000
+    }
+
+def format_duration(seconds):
+    """Format seconds as m:ss, or h:mm:ss for long texts"""
+    seconds = int(round(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+def format_text_analysis(analysis):
+    """One-line summary for the character count label"""
+    requests = analysis['requests']
+    return (
+        f"{analysis['characters']:,} characters | "
+        f"{requests} request{'s' if requests != 1 else ''} | "
+        f"~{format_duration(analysis['duration_seconds'])} audio | "
+        f"~${analysis['cost']:.4f}"
+    )
+
+EMPTY_TEXT_ANALYSIS = format_text_analysis(analyze_text_length(0, 1, 0))
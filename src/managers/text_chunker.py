@@ -0,0 +1,48 @@
+import re
+
+# Sentence ends at terminal punctuation (optionally followed by closing quotes/brackets)
+# and whitespace, or at a blank line
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。！？])["\'”’)\]]*\s+|\n\s*\n')
+
+def split_sentences(text):
+    """Split text into sentences, keeping each sentence's trailing whitespace"""
+    sentences = []
+    start = 0
+    for match in SENTENCE_BOUNDARY.finditer(text):
+        end = match.end()
+        if text[start:end].strip():
+            sentences.append(text[start:end])
+        start = end
+    if text[start:].strip():
+        sentences.append(text[start:])
+    return sentences
+
+def _split_long_sentence(sentence, max_chars):
+    """Break a sentence longer than max_chars at clause or word boundaries"""
+    pieces = []
+    while len(sentence) > max_chars:
+        window = sentence[:max_chars]
+        cut = max(window.rfind(', '), window.rfind('; '), window.rfind(': '))
+        if cut <= 0:
+            cut = window.rfind(' ')
+        if cut <= 0:
+            cut = max_chars - 1
+        pieces.append(sentence[:cut + 1])
+        sentence = sentence[cut + 1:]
+    if sentence.strip():
+        pieces.append(sentence)
+    return pieces
+
+def chunk_text(text, max_chars):
+    """Pack whole sentences into chunks of at most max_chars characters"""
+    chunks = []
+    current = ""
+    for sentence in split_sentences(text):
+        for piece in _split_long_sentence(sentence, max_chars):
+            if current and len(current) + len(piece) > max_chars:
+                chunks.append(current.strip())
+                current = ""
+            current += piece
+    if current.strip():
+        chunks.append(current.strip())
+    return chunks
@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from managers.synthesis_cache import SynthesisCache
+from managers.synthesis_job_queue import JobCancelledError
+
+PREVIEW_TEXT = "Hello! This is a short preview of my voice. The quick brown fox jumps over the lazy dog."
+
+class VoicePreviewCache:
+    """Sample-sentence audio per provider/voice/engine, synthesized on first use. Kept in its own
+    directory so long documents in the synthesis cache never evict previews."""
+    MAX_BYTES = 100 * 1024 * 1024
+    DEFAULT_MAX_WORKERS = 8
+
+    def __init__(self, cache=None):
+        self.cache = cache or SynthesisCache(
+            os.path.join(SynthesisCache.default_cache_root(), "previews"), self.MAX_BYTES
+        )
+
+    @staticmethod
+    def make_key(provider, voice, engine=None):
+        return SynthesisCache.make_key(provider, voice, engine, "preview", None, PREVIEW_TEXT)
+
+    def contains(self, provider, voice, engine=None):
+        return self.cache.contains(self.make_key(provider, voice, engine))
+
+    def get(self, provider, voice, engine, synthesize):
+        """Preview audio for a voice; synthesize(text) -> bytes is only called on a miss"""
+        key = self.make_key(provider, voice, engine)
+        audio_data = self.cache.get(key)
+        if audio_data is None:
+            audio_data = synthesize(PREVIEW_TEXT)
+            self.cache.put(key, audio_data)
+        return audio_data
+
+    def prefetch(self, provider, voices, engine, synthesize_for_voice, cancel_check=None,
+                 max_workers=DEFAULT_MAX_WORKERS):
+        """Synthesize missing previews in parallel with synthesize_for_voice(voice, text) -> bytes.
+        Returns (fetched, already_cached, failed) counts."""
+        missing = [voice for voice in voices if not self.contains(provider, voice, engine)]
+        if not missing:
+            return 0, len(voices), 0
+
+        def run(voice):
+            if cancel_check:
+                cancel_check()
+            self.get(provider, voice, engine, lambda text: synthesize_for_voice(voice, text))
+
+        failed = 0
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(missing))) as executor:
+            futures = [executor.submit(run, voice) for voice in missing]
+            for voice, future in zip(missing, futures):
+                try:
+                    future.result()
+                except JobCancelledError:
+                    for pending in futures:
+                        pending.cancel()
+                    raise
+                except Exception as e:
+                    print(f"Error fetching preview for {voice}: {e}")
+                    failed += 1
+        return len(missing) - failed, len(voices) - len(missing), failed
+
+    @staticmethod
+    def format_result(result):
+        fetched, cached, failed = result
+        message = f"Voice previews ready: {fetched} fetched, {cached} already cached"
+        return message + (f", {failed} failed" if failed else "")
@@ -1,5 +1,9 @@
 import tkinter as tk
-from tkinter import scrolledtext, ttk
+from tkinter import ttk
+
+from views.widget.play_queue_panel import PlayQueuePanel
+from views.widget.playback_bar import PlaybackBar
+from views.widget.tracked_text import TrackedText
 
 class AzureMainView(ttk.Frame):
     def __init__(self, parent, controller, *args, **kwargs):
@@ -38,17 +42,17 @@ class AzureMainView(ttk.Frame):
         
         # Text Input
         ttk.Label(text_frame, text="Enter Text:").pack(anchor="w")
-        self.text_input = scrolledtext.ScrolledText(text_frame, width=60, height=5)
+        self.text_input = TrackedText(text_frame, on_change=self.controller.update_char_count,
+                                      width=60, height=5)
         self.text_input.pack(fill="both", expand=True, pady=5)
         
         # Character count display
         count_frame = ttk.Frame(text_frame)
         count_frame.pack(fill="x", pady=5)
-        ttk.Label(count_frame, text="Character Count:").pack(side="left")
+        ttk.Label(count_frame, text="Estimate:").pack(side="left")
         self.char_count_label = ttk.Label(count_frame, 
                                         textvariable=self.controller.char_count_var)
         self.char_count_label.pack(side="left")
-        self.text_input.bind("<KeyRelease>", self.controller.update_char_count)
 
         # Language Selection
         ttk.Label(text_frame, text="Language:").pack(anchor="w")
@@ -75,6 +79,37 @@ class AzureMainView(ttk.Frame):
                                           textvariable=self.controller.voice_var, 
                                           state="readonly")
         self.voice_dropdown.pack(fill="x", pady=5)
+        self.voice_dropdown.bind("<<ComboboxSelected>>", 
+                                self.controller.on_voice_selected)
+        
+        preview_frame = ttk.Frame(text_frame)
+        preview_frame.pack(anchor="w", pady=(0, 5))
+        ttk.Button(preview_frame, text="Preview Voice",
+                   command=self.controller.preview_voice).pack(side="left")
+        ttk.Button(preview_frame, text="Prefetch Language Previews",
+                   command=self.controller.prefetch_voice_previews).pack(side="left", padx=5)
+        
+        # Output Format Selection
+        ttk.Label(text_frame, text="Output Format:").pack(anchor="w", pady=(10, 0))
+        self.format_dropdown = ttk.Combobox(text_frame, 
+                                          textvariable=self.controller.output_format_var, 
+                                          state="readonly")
+        self.format_dropdown.pack(fill="x", pady=5)
+        self.format_dropdown.bind("<<ComboboxSelected>>", 
+                                 self.controller.update_sample_rates)
+        
+        # Sample Rate Selection
+        ttk.Label(text_frame, text="Sample Rate (Hz):").pack(anchor="w")
+        self.sample_rate_dropdown = ttk.Combobox(text_frame, 
+                                               textvariable=self.controller.sample_rate_var, 
+                                               state="readonly")
+        self.sample_rate_dropdown.pack(fill="x", pady=5)
+        
+        # Streaming playback toggle
+        ttk.Checkbutton(text_frame, text="Stream playback while synthesizing", 
+                        variable=self.controller.stream_playback_var).pack(anchor="w", pady=(5, 0))
+        ttk.Checkbutton(text_frame, text="Pre-synthesize while idle (bills extra characters)",
+                        variable=self.controller.presynthesize_var).pack(anchor="w")
         
         # Generate and Play/Save Buttons
         button_frame = ttk.Frame(self)
@@ -91,6 +126,24 @@ class AzureMainView(ttk.Frame):
             text="Generate & Save",
             command=self.controller.generate_and_save
         ).pack(side='left', padx=5)
+        
+        ttk.Button(
+            button_frame,
+            text="Cancel",
+            command=self.controller.cancel_jobs
+        ).pack(side='left', padx=5)
+        
+        ttk.Button(
+            button_frame,
+            text="Refresh Catalog",
+            command=self.controller.refresh_catalog
+        ).pack(side='left', padx=5)
+        
+        # Pause/stop/seek for the shared playback engine, when it has a working output
+        playback_engine = self.controller.playback_engine
+        if playback_engine is not None and playback_engine.is_available():
+            PlaybackBar(self, playback_engine).pack(fill="x", padx=10, pady=(0, 10))
+            PlayQueuePanel(self, self.controller).pack(fill="x", padx=10, pady=(0, 10))
 
     def _on_language_changed(self, event=None):
         """Handle language change event"""
@@ -110,4 +163,4 @@ class AzureMainView(ttk.Frame):
         """Clear all widgets from main frame"""
         for widget in self.winfo_children():
             widget.destroy()
-        self.controller.char_count_var.set("0/3000")
+        self.controller.reset_text_analysis()
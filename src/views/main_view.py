@@ -34,6 +34,14 @@ class MainNavigationView(ttk.Frame):
         )
         self.azure_btn.pack(pady=15)
         
+        # Latency metrics for this session
+        ttk.Button(
+            self,
+            text="Synthesis Metrics",
+            command=self.controller.show_metrics,
+            width=20
+        ).pack(pady=15)
+        
         # Other TTS Button
         ttk.Button(
             self,
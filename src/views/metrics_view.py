@@ -0,0 +1,83 @@
+from tkinter import ttk
+
+class MetricsView(ttk.Frame):
+    """Per-provider, per-voice synthesis latency histograms"""
+    COLUMNS = (
+        ('provider', "Provider", 70),
+        ('voice', "Voice", 170),
+        ('stage', "Stage", 100),
+        ('count', "Count", 55),
+        ('mean', "Mean ms", 70),
+        ('p50', "p50 ms", 65),
+        ('p95', "p95 ms", 65),
+        ('max', "Max ms", 65),
+        ('histogram', "Histogram", 110)
+    )
+    SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+    def __init__(self, parent, controller, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        self.controller = controller
+        self.tree = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Initialize the metrics UI"""
+        self.pack(fill="both", expand=True, padx=20, pady=20)
+
+        ttk.Label(self, text="Synthesis Metrics", font=('Arial', 14, 'bold')).pack(pady=10)
+
+        table_frame = ttk.Frame(self)
+        table_frame.pack(fill="both", expand=True)
+        self.tree = ttk.Treeview(table_frame, columns=[c[0] for c in self.COLUMNS], show="headings")
+        for name, heading, width in self.COLUMNS:
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width, anchor="w" if name in ('provider', 'voice', 'stage') else "e")
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
+        ttk.Label(
+            self,
+            text="Histogram buckets (ms): " + ", ".join(f"≤{b}" for b in self.controller.metrics_bucket_bounds()) + ", more"
+        ).pack(anchor="w", pady=(5, 0))
+
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill="x", pady=10)
+        ttk.Button(button_frame, text="Refresh", command=self.controller.refresh_metrics).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Export JSON", command=self.controller.export_metrics).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Reset", command=self.controller.reset_metrics).pack(side="left", padx=5)
+        ttk.Button(button_frame, text="Back", command=self.controller.show_navigation).pack(side="right", padx=5)
+
+    @classmethod
+    def format_sparkline(cls, buckets):
+        """Render bucket counts as a one-line bar chart"""
+        peak = max(buckets) if buckets else 0
+        if not peak:
+            return ""
+        top = len(cls.SPARK_CHARS) - 1
+        return "".join(
+            " " if not count else cls.SPARK_CHARS[max(0, round(count / peak * top))]
+            for count in buckets
+        )
+
+    @staticmethod
+    def _format_ms(value):
+        return "" if value is None else f"{value:.1f}"
+
+    def show_rows(self, rows):
+        """Replace the table contents with SynthesisMetrics.get_rows() output"""
+        self.tree.delete(*self.tree.get_children())
+        for row in rows:
+            self.tree.insert("", "end", values=(
+                row['provider'],
+                row['voice'],
+                row['stage'],
+                row['count'],
+                self._format_ms(row['mean_ms']),
+                self._format_ms(row['p50_ms']),
+                self._format_ms(row['p95_ms']),
+                self._format_ms(row['max_ms']),
+                self.format_sparkline(row['buckets'])
+            ))
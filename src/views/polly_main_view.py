@@ -1,5 +1,9 @@
 import tkinter as tk
-from tkinter import scrolledtext, ttk
+from tkinter import ttk
+
+from views.widget.play_queue_panel import PlayQueuePanel
+from views.widget.playback_bar import PlaybackBar
+from views.widget.tracked_text import TrackedText
 
 class PollyMainView(ttk.Frame):
     def __init__(self, parent, controller, *args, **kwargs):
@@ -45,14 +49,14 @@ class PollyMainView(ttk.Frame):
         
         # Text Input
         ttk.Label(text_frame, text="Enter Text:").pack(anchor="w")
-        self.text_input = scrolledtext.ScrolledText(text_frame, width=60, height=5)
+        self.text_input = TrackedText(text_frame, on_change=self.controller.update_char_count,
+                                      width=60, height=5)
         self.text_input.pack(fill="both", expand=True, pady=5)
-        self.text_input.bind("<KeyRelease>", self.controller.update_char_count)
         
         # Character count display
         count_frame = ttk.Frame(text_frame)
         count_frame.pack(fill="x", pady=5)
-        ttk.Label(count_frame, text="Character Count:").pack(side="left")
+        ttk.Label(count_frame, text="Estimate:").pack(side="left")
         self.char_count_label = ttk.Label(count_frame, textvariable=self.controller.char_count_var)
         self.char_count_label.pack(side="left")
         
@@ -90,6 +94,13 @@ class PollyMainView(ttk.Frame):
                                           state="readonly")
         self.voice_dropdown.pack(fill="x", pady=5)
         
+        preview_frame = ttk.Frame(text_frame)
+        preview_frame.pack(anchor="w", pady=(0, 5))
+        ttk.Button(preview_frame, text="Preview Voice",
+                   command=self.controller.preview_voice).pack(side="left")
+        ttk.Button(preview_frame, text="Prefetch Language Previews",
+                   command=self.controller.prefetch_voice_previews).pack(side="left", padx=5)
+        
         # Output Format Selection
         ttk.Label(text_frame, text="Output Format:").pack(anchor="w", pady=(10, 0))
         self.format_dropdown = ttk.Combobox(text_frame, 
@@ -104,6 +115,15 @@ class PollyMainView(ttk.Frame):
                                                textvariable=self.controller.sample_rate_var, 
                                                state="readonly")
         self.sample_rate_dropdown.pack(fill="x", pady=5)
+        
+        # Streaming playback toggle
+        ttk.Checkbutton(text_frame, text="Stream playback while downloading", 
+                        variable=self.controller.stream_playback_var).pack(anchor="w", pady=(5, 0))
+        ttk.Checkbutton(text_frame, text="Pre-synthesize while idle (bills extra characters)",
+                        variable=self.controller.presynthesize_var).pack(anchor="w")
+        if self.controller._use_playback_engine():
+            ttk.Checkbutton(text_frame, text="Play through the playback bar (16 kHz PCM, not the selected format)",
+                            variable=self.controller.engine_playback_var).pack(anchor="w")
 
         # Action buttons
         button_frame = ttk.Frame(self)
@@ -114,3 +134,15 @@ class PollyMainView(ttk.Frame):
         
         ttk.Button(button_frame, text="Generate & Save", 
                   command=self.controller.generate).pack(side='left', padx=5)
+        
+        ttk.Button(button_frame, text="Cancel", 
+                  command=self.controller.cancel_jobs).pack(side='left', padx=5)
+        
+        ttk.Button(button_frame, text="Refresh Catalog", 
+                  command=self.controller.refresh_catalog).pack(side='left', padx=5)
+        
+        # Pause/stop/seek for the shared playback engine, when it has a working output
+        playback_engine = self.controller.playback_engine
+        if playback_engine is not None and playback_engine.is_available():
+            PlaybackBar(self, playback_engine).pack(fill="x", padx=10, pady=(0, 10))
+            PlayQueuePanel(self, self.controller).pack(fill="x", padx=10, pady=(0, 10))
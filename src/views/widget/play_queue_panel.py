@@ -0,0 +1,68 @@
+import tkinter as tk
+from tkinter import ttk
+
+from managers.play_queue import PlayQueue
+
+class PlayQueuePanel(ttk.LabelFrame):
+    """List of queued prompts with their synthesis state and the queue controls"""
+    POLL_INTERVAL_MS = 300
+
+    def __init__(self, parent, controller, *args, **kwargs):
+        super().__init__(parent, text="Play Queue", *args, **kwargs)
+        self.controller = controller
+        self._shown = None
+        self._after_id = None
+        self.setup_ui()
+        self._poll()
+
+    def setup_ui(self):
+        """Initialize the queue list and buttons"""
+        button_frame = ttk.Frame(self)
+        button_frame.pack(fill="x", padx=5, pady=5)
+
+        ttk.Button(button_frame, text="Add Text", command=self.controller.add_to_play_queue).pack(side="left", padx=2)
+        ttk.Button(button_frame, text="Play Queue", command=self._on_play).pack(side="left", padx=2)
+        ttk.Button(button_frame, text="Stop", command=self.controller.stop_play_queue).pack(side="left", padx=2)
+        ttk.Button(button_frame, text="Clear", command=self.controller.clear_play_queue).pack(side="left", padx=2)
+
+        ttk.Spinbox(
+            button_frame,
+            from_=0,
+            to=PlayQueue.MAX_LOOKAHEAD,
+            width=3,
+            textvariable=self.controller.lookahead_var,
+            command=self.controller.update_lookahead
+        ).pack(side="right", padx=2)
+        ttk.Label(button_frame, text="Look-ahead:").pack(side="right", padx=2)
+
+        self.item_list = tk.Listbox(self, height=4, activestyle="none")
+        self.item_list.pack(fill="x", padx=5, pady=(0, 5))
+
+    def _on_play(self):
+        """Play from the selected item, or from the start when nothing is selected"""
+        selection = self.item_list.curselection()
+        self.controller.start_play_queue(selection[0] if selection else 0)
+
+    def _poll(self):
+        play_queue = self.controller.play_queue
+        current = play_queue.current_index
+        shown = (current, play_queue.get_items())
+        # Rebuild the list only when something changed so the selection is kept
+        if shown != self._shown:
+            self._shown = shown
+            selection = self.item_list.curselection()
+            self.item_list.delete(0, tk.END)
+            for index, (label, state, error) in enumerate(shown[1]):
+                marker = "▶" if index == current else " "
+                detail = f" ({error})" if error else ""
+                self.item_list.insert(tk.END, f"{marker} {index + 1}. [{state}] {label}{detail}")
+            for index in selection:
+                if index < self.item_list.size():
+                    self.item_list.selection_set(index)
+        self._after_id = self.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def destroy(self):
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
@@ -0,0 +1,59 @@
+import tkinter as tk
+from tkinter import ttk
+
+class PlaybackBar(ttk.Frame):
+    """Pause/stop buttons, a seek slider and elapsed time for the shared playback engine"""
+    POLL_INTERVAL_MS = 200
+
+    def __init__(self, parent, playback_engine, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        self.playback_engine = playback_engine
+        self.position_var = tk.DoubleVar(value=0.0)
+        self._seeking = False
+        self._after_id = None
+        self.setup_ui()
+        self._poll()
+
+    def setup_ui(self):
+        """Initialize the playback controls"""
+        self.pause_btn = ttk.Button(self, text="Pause", width=8, command=self.playback_engine.toggle_pause)
+        self.pause_btn.pack(side="left", padx=5)
+        ttk.Button(self, text="Stop", width=8, command=self.playback_engine.stop).pack(side="left", padx=5)
+
+        self.time_label = ttk.Label(self, text="0:00 / 0:00", width=12, anchor="e")
+        self.time_label.pack(side="right", padx=5)
+
+        self.seek_scale = ttk.Scale(self, from_=0.0, to=1.0, orient="horizontal", variable=self.position_var)
+        self.seek_scale.pack(side="left", fill="x", expand=True, padx=5)
+        # Seek once the slider is released rather than on every motion event
+        self.seek_scale.bind("<ButtonPress-1>", self._on_seek_start)
+        self.seek_scale.bind("<ButtonRelease-1>", self._on_seek_end)
+
+    @staticmethod
+    def _format_time(seconds):
+        minutes, seconds = divmod(int(seconds), 60)
+        return f"{minutes}:{seconds:02d}"
+
+    def _on_seek_start(self, event):
+        self._seeking = True
+
+    def _on_seek_end(self, event):
+        self._seeking = False
+        self.playback_engine.seek(self.position_var.get())
+
+    def _poll(self):
+        status = self.playback_engine.get_status()
+        self.pause_btn.config(text="Resume" if status['state'] == self.playback_engine.PAUSED else "Pause")
+        self.seek_scale.config(to=max(status['duration'], 0.1))
+        if not self._seeking:
+            self.position_var.set(status['position'])
+        self.time_label.config(
+            text=f"{self._format_time(status['position'])} / {self._format_time(status['duration'])}"
+        )
+        self._after_id = self.after(self.POLL_INTERVAL_MS, self._poll)
+
+    def destroy(self):
+        if self._after_id:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
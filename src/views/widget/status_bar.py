@@ -15,6 +15,18 @@ class StatusBar(ttk.Frame):
         # Top border line (subtle separator)
         ttk.Separator(self, orient='horizontal').pack(fill="x")
 
+        # Right-aligned cache statistics
+        self.cache_label = ttk.Label(
+            self,
+            text="",
+            foreground="#aaa",
+            background="#333",
+            padding=(10, 5),
+            anchor="e",
+            font=('Arial', 10)
+        )
+        self.cache_label.pack(side="right", fill="y")
+
         self.status_label = ttk.Label(
             self,
             text="Ready",
@@ -24,7 +36,7 @@ class StatusBar(ttk.Frame):
             anchor="w",
             font=('Arial', 11)
         )
-        self.status_label.pack(fill="x", expand=True)
+        self.status_label.pack(side="left", fill="x", expand=True)
 
     def update_status(self, message, is_error=False):
         """Update status bar with message"""
@@ -32,4 +44,9 @@ class StatusBar(ttk.Frame):
             self.status_label.config(text=message, foreground="red", background="#333")
         else:
             self.status_label.config(text=message, foreground="green", background="#333")
-        self.parent.update_idletasks()
\ No newline at end of file
+        self.parent.update_idletasks()
+
+    def update_cache_stats(self, text):
+        """Update the cache statistics shown on the right of the status bar"""
+        self.cache_label.config(text=text)
+        self.parent.update_idletasks()
@@ -0,0 +1,84 @@
+import tkinter as tk
+from tkinter import scrolledtext
+
+class TrackedText(scrolledtext.ScrolledText):
+    """ScrolledText that keeps a running character count from insert/delete deltas
+    and reports changes after a short pause instead of on every keystroke"""
+    DEBOUNCE_MS = 150
+
+    def __init__(self, parent, on_change=None, *args, **kwargs):
+        super().__init__(parent, *args, **kwargs)
+        self.on_change = on_change
+        self.char_count = 0
+        self._after_id = None
+
+        # Route the widget's Tcl command through _proxy to observe every edit
+        self._orig = self._w + "_orig"
+        self.tk.call("rename", self._w, self._orig)
+        self.tk.createcommand(self._w, self._proxy)
+
+        self.bind("<<Modified>>", self._on_modified)
+
+    def _count_range(self, start, end):
+        """Characters between two indices; only the affected range is measured"""
+        # The trailing newline Tk keeps at "end" can never be deleted
+        if self.tk.getboolean(self.tk.call(self._orig, "compare", end, ">", "end-1c")):
+            end = "end-1c"
+        if self.tk.getboolean(self.tk.call(self._orig, "compare", start, ">=", end)):
+            return 0
+        return int(self.tk.call(self._orig, "count", "-chars", start, end) or 0)
+
+    def _proxy(self, command, *args):
+        delta = 0
+        editable = command in ("insert", "delete", "replace") and \
+            str(self.tk.call(self._orig, "cget", "-state")) == tk.NORMAL
+        if editable:
+            if command == "insert":
+                # insert index chars ?tagList chars tagList ...?
+                delta = sum(len(chars) for chars in args[1::2])
+            elif command == "delete":
+                ranges = list(args) if len(args) % 2 == 0 else list(args) + [args[-1] + "+1c"]
+                delta = -sum(self._count_range(ranges[i], ranges[i + 1]) for i in range(0, len(ranges), 2))
+            else:
+                # replace index1 index2 chars ?tagList chars tagList ...?
+                delta = sum(len(chars) for chars in args[2::2]) - self._count_range(args[0], args[1])
+
+        result = self.tk.call((self._orig, command) + args)
+        self.char_count += delta
+        return result
+
+    def billed_char_count(self):
+        """Character count without leading/trailing whitespace, found by searching the ends only"""
+        if not self.char_count:
+            return 0
+        first = str(self.tk.call(self._orig, "search", "-regexp", r"\S", "1.0", "end"))
+        if not first:
+            return 0
+        last = str(self.tk.call(self._orig, "search", "-backwards", "-regexp", r"\S", "end", "1.0"))
+        leading = self._count_range("1.0", first)
+        trailing = self._count_range(f"{last}+1c", "end-1c")
+        return max(0, self.char_count - leading - trailing)
+
+    def _on_modified(self, event=None):
+        if not self.edit_modified():
+            return
+        # Clearing the flag re-arms <<Modified>> for the next edit
+        self.edit_modified(False)
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+        self._after_id = self.after(self.DEBOUNCE_MS, self._notify)
+
+    def _notify(self):
+        self._after_id = None
+        if self.on_change:
+            self.on_change()
+
+    def destroy(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        super().destroy()
+        try:
+            self.tk.deletecommand(self._w)
+        except tk.TclError:
+            pass
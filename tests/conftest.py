@@ -0,0 +1,5 @@
+"""Shared setup for the offline test suite: run with `python -m pytest -q` from the repo root."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
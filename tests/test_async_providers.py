@@ -0,0 +1,49 @@
+import asyncio
+import importlib
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "benchmarks"))
+
+import fake_providers
+from managers.credentials import AzureCredentials
+
+@pytest.fixture
+def azure_modules(monkeypatch):
+    """Azure managers imported against the offline fake Speech SDK, restored afterwards"""
+    # delitem records whatever was imported before so it is put back after the test
+    for name in ('azure.cognitiveservices', 'azure.cognitiveservices.speech', 'managers.azure_speech_manager',
+                 'managers.azure_synthesizer_pool', 'managers.async_providers'):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    fake_providers.install_fake_speechsdk(latency=0.01, voice_count=10)
+    yield (importlib.import_module('managers.azure_speech_manager'),
+           importlib.import_module('managers.async_providers'))
+    for name in ('managers.azure_speech_manager', 'managers.azure_synthesizer_pool', 'managers.async_providers'):
+        sys.modules.pop(name, None)
+
+def test_azure_synthesizers_are_built_off_the_event_loop(azure_modules):
+    speech_manager, async_providers = azure_modules
+    manager = speech_manager.AzureSpeechManager()
+    provider = async_providers.AsyncAzureProvider(manager, AzureCredentials("key", "https://fake.invalid/"))
+    pool = manager.synthesizer_pool
+    acquire = pool.acquire
+    acquired_on = []
+
+    def recording_acquire(*args, **kwargs):
+        acquired_on.append(threading.current_thread())
+        return acquire(*args, **kwargs)
+
+    pool.acquire = recording_acquire
+
+    async def run():
+        text = " ".join(f"Sentence {i} of the async test." for i in range(300))
+        audio = await provider.synthesize(text, "en-US-Voice001Neural")
+        return threading.current_thread(), audio
+
+    loop_thread, audio = asyncio.run(run())
+    assert audio
+    assert len(acquired_on) > 1
+    assert loop_thread not in acquired_on
@@ -0,0 +1,125 @@
+import struct
+
+import pytest
+
+from managers.audio_assembler import (assemble_audio, build_wav_header, iter_ogg_pages, join_mp3, join_ogg,
+                                      parse_wav)
+
+def wav(pcm, sample_rate=16000, channels=1):
+    return build_wav_header(len(pcm), sample_rate, channels) + pcm
+
+def ogg_page(serial, sequence, body, header_type=0, granule=0):
+    """An Ogg page with a correct CRC, built independently of the code under test"""
+    lacing = bytes([255] * (len(body) // 255) + [len(body) % 255])
+    header = struct.pack('<4sBBqIII', b'OggS', 0, header_type, granule, serial, sequence, 0)
+    page = bytearray(header + bytes([len(lacing)]) + lacing + body)
+    page[22:26] = struct.pack('<I', reference_crc(page))
+    return bytes(page)
+
+def reference_crc(page):
+    """Bit-at-a-time CRC-32 with the Ogg polynomial, no reflection, zero initial value"""
+    crc = 0
+    for byte in page:
+        crc ^= byte << 24
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x04C11DB7) if crc & 0x80000000 else crc << 1
+            crc &= 0xFFFFFFFF
+    return crc
+
+def ogg_stream(serial, bodies):
+    last = len(bodies) - 1
+    return b''.join(
+        ogg_page(serial, i, body, header_type=(0x02 if i == 0 else 0) | (0x04 if i == last else 0), granule=i)
+        for i, body in enumerate(bodies)
+    )
+
+def test_wav_header_sizes():
+    header = build_wav_header(1000, 24000, channels=2)
+    assert len(header) == 44
+    riff_size, = struct.unpack('<I', header[4:8])
+    byte_rate, block_align, bits = struct.unpack('<IHH', header[28:36])
+    data_size, = struct.unpack('<I', header[40:44])
+    assert riff_size == 36 + 1000
+    assert (byte_rate, block_align, bits) == (24000 * 4, 4, 16)
+    assert data_size == 1000
+
+def test_assembled_wav_has_one_header_with_total_sizes():
+    pcm_parts = [b'\x01\x00' * 100, b'\x02\x00' * 50, b'\x03\x00' * 25]
+    audio = assemble_audio('wav', [wav(pcm, 22050) for pcm in pcm_parts])
+    total = sum(len(pcm) for pcm in pcm_parts)
+    assert len(audio) == 44 + total
+    assert struct.unpack('<I', audio[4:8])[0] == 36 + total
+    assert struct.unpack('<I', audio[40:44])[0] == total
+    fmt, pcm = parse_wav(audio)
+    assert struct.unpack('<HI', fmt[2:8]) == (1, 22050)
+    assert pcm == b''.join(pcm_parts)
+
+def test_parse_wav_skips_extra_chunks():
+    pcm = b'\x00\x01' * 10
+    header = build_wav_header(len(pcm), 8000)
+    # Insert an odd-sized LIST chunk (padded to even) between fmt and data
+    extra = b'LIST' + struct.pack('<I', 3) + b'abc\x00'
+    fmt, data = parse_wav(header[:36] + extra + header[36:] + pcm)
+    assert data == pcm
+    assert struct.unpack('<I', fmt[4:8])[0] == 8000
+
+def test_parse_wav_rejects_other_data():
+    with pytest.raises(ValueError):
+        parse_wav(b'ID3' + b'\x00' * 50)
+
+def test_single_chunk_is_returned_unchanged():
+    chunk = b'not even audio'
+    assert assemble_audio('mp3', [chunk]) is chunk
+
+def test_pcm_chunks_are_concatenated():
+    assert assemble_audio('pcm', [b'ab', b'cd', b'ef']) == b'abcdef'
+
+def test_mp3_keeps_only_outer_tags():
+    id3v2 = b'ID3\x04\x00\x00\x00\x00\x00\x02xx'
+    id3v1 = b'TAG' + b'\x00' * 125
+    frames = [b'\xff\xfb' + bytes([i]) * 10 for i in range(3)]
+    chunks = [id3v2 + frame + id3v1 for frame in frames]
+    assert join_mp3(chunks) == id3v2 + b''.join(frames) + id3v1
+
+def test_unsupported_format_raises():
+    with pytest.raises(ValueError):
+        assemble_audio('flac', [b'a', b'b'])
+
+def test_reference_pages_are_valid():
+    page = ogg_page(7, 0, b'x' * 300)
+    pages = list(iter_ogg_pages(page + page))
+    assert pages == [page, page]
+
+def test_assembled_ogg_pages_have_unique_serials_sequences_and_crcs():
+    # Both links use the same serial, as separately synthesized streams often do
+    links = [ogg_stream(1234, [b'head', b'a' * 300, b'tail']), ogg_stream(1234, [b'head', b'b' * 10])]
+    audio = assemble_audio('ogg_vorbis', links)
+
+    pages = list(iter_ogg_pages(audio))
+    assert len(pages) == 5
+    assert b''.join(pages) == audio
+
+    by_serial = {}
+    for page in pages:
+        serial, sequence, crc = struct.unpack('<III', page[14:26])
+        unsigned = page[:22] + b'\x00\x00\x00\x00' + page[26:]
+        assert crc == reference_crc(unsigned)
+        by_serial.setdefault(serial, []).append((sequence, page[5]))
+
+    # Each link becomes its own logical stream with unbroken page sequence numbers
+    assert sorted(by_serial) == [1, 2]
+    assert [sequence for sequence, _ in by_serial[1]] == [0, 1, 2]
+    assert [sequence for sequence, _ in by_serial[2]] == [0, 1]
+    # Each link still starts with a BOS page and ends with an EOS page
+    for pages_for_serial in by_serial.values():
+        assert pages_for_serial[0][1] & 0x02
+        assert pages_for_serial[-1][1] & 0x04
+
+def test_assembled_ogg_keeps_payloads_in_order():
+    links = [ogg_stream(1, [b'first']), ogg_stream(2, [b'second']), ogg_stream(3, [b'third'])]
+    pages = list(iter_ogg_pages(join_ogg(links)))
+    assert [page[28:] for page in pages] == [b'first', b'second', b'third']
+
+def test_garbage_after_ogg_page_is_rejected():
+    with pytest.raises(ValueError):
+        list(iter_ogg_pages(ogg_page(1, 0, b'data') + b'junk' * 10))
@@ -0,0 +1,22 @@
+from managers.aws_client_pool import AWSClientPool
+
+ACCESS_KEY = "AKIDEXAMPLE"
+SECRET_KEY = "secret-key"
+
+def test_clients_are_shared_per_service_region_and_credentials():
+    pool = AWSClientPool()
+    client = pool.get_client('polly', 'us-east-1', ACCESS_KEY, SECRET_KEY)
+    assert pool.get_client('polly', 'us-east-1', ACCESS_KEY, SECRET_KEY) is client
+    assert pool.get_client('polly', 'eu-west-1', ACCESS_KEY, SECRET_KEY) is not client
+    assert pool.get_client('polly', 'us-east-1', ACCESS_KEY, "other-secret") is not client
+
+def test_invalidate_leaves_clients_in_use_open():
+    pool = AWSClientPool()
+    client = pool.get_client('polly', 'us-east-1', ACCESS_KEY, SECRET_KEY)
+    closed = []
+    client.close = lambda: closed.append(client)
+
+    pool.invalidate()
+
+    assert closed == []
+    assert pool.get_client('polly', 'us-east-1', ACCESS_KEY, SECRET_KEY) is not client
@@ -0,0 +1,52 @@
+import threading
+
+import pytest
+
+from managers.chunked_synthesis import ChunkedSynthesizer
+
+TEXT = " ".join(f"Sentence {i} of the long document says something." for i in range(40))
+
+def fake_synthesize(text):
+    return text.encode("utf-8") + b"|"
+
+def test_chunks_are_joined_in_order():
+    requests = []
+    lock = threading.Lock()
+
+    def synthesize(text):
+        with lock:
+            requests.append(text)
+        return fake_synthesize(text)
+
+    synthesizer = ChunkedSynthesizer(200, max_workers=4)
+    audio = synthesizer.synthesize(TEXT, synthesize, 'pcm')
+    chunks = synthesizer.split(TEXT)
+    assert len(requests) == len(chunks) > 1
+    assert sorted(requests) == sorted(chunks)
+    assert audio == b"".join(fake_synthesize(chunk) for chunk in chunks)
+
+def test_single_chunk_is_not_assembled():
+    assert ChunkedSynthesizer(200).synthesize("Short text.", fake_synthesize, 'wav') == b"Short text.|"
+
+def test_empty_text_raises():
+    with pytest.raises(ValueError):
+        ChunkedSynthesizer(200).synthesize("   ", fake_synthesize, 'pcm')
+
+def test_failure_propagates():
+    def synthesize(text):
+        if "Sentence 20 " in text:
+            raise RuntimeError("throttled")
+        return fake_synthesize(text)
+
+    with pytest.raises(RuntimeError, match="throttled"):
+        ChunkedSynthesizer(200).synthesize(TEXT, synthesize, 'pcm')
+
+def test_cancel_check_stops_synthesis():
+    class Cancelled(Exception):
+        pass
+
+    def cancel_check():
+        raise Cancelled()
+
+    with pytest.raises(Cancelled):
+        ChunkedSynthesizer(200).synthesize(TEXT, fake_synthesize, 'pcm', cancel_check)
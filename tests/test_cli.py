@@ -0,0 +1,25 @@
+import json
+
+from cli import load_requests
+
+def write_jsonl(path, records):
+    path.write_text("\n".join(json.dumps(record) for record in records) + "\n", encoding="utf-8")
+    return str(path)
+
+def test_jsonl_ids_become_safe_names(tmp_path):
+    path = write_jsonl(tmp_path / "in.jsonl", [{"id": "intro/part 1", "text": " Hello "}, {"text": "No id"}])
+    assert load_requests(path) == [("intro_part_1", "Hello"), ("00002", "No id")]
+
+def test_duplicate_ids_never_share_an_output_name(tmp_path):
+    ids = ["a", "a", "a_2", "A", "a_2"]
+    path = write_jsonl(tmp_path / "in.jsonl", [{"id": i, "text": f"text {n}"} for n, i in enumerate(ids)])
+    names = [name for name, _ in load_requests(path)]
+    assert names == ["a", "a_2", "a_2_2", "A_3", "a_2_3"]
+    assert len({name.lower() for name in names}) == len(names)
+
+def test_directory_input_skips_empty_files(tmp_path):
+    (tmp_path / "b.txt").write_text("Second", encoding="utf-8")
+    (tmp_path / "a.txt").write_text("First", encoding="utf-8")
+    (tmp_path / "empty.txt").write_text("  ", encoding="utf-8")
+    (tmp_path / "notes.md").write_text("ignored", encoding="utf-8")
+    assert load_requests(str(tmp_path)) == [("a", "First"), ("b", "Second")]
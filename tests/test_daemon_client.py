@@ -0,0 +1,115 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from daemon import SynthesisDaemon, write_token_file
+from managers.daemon_client import DaemonClient, DaemonUnavailableError, get_token_path
+from managers.credentials import AWSCredentials
+
+CREDENTIALS = AWSCredentials("AKIDEXAMPLE", "secret-key")
+
+class FakeService:
+    """Stands in for SynthesisService and records what the daemon was sent"""
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = []
+
+    def synthesize(self, request, authorized=False):
+        self.requests.append((request, authorized))
+        time.sleep(self.delay)
+        return b"audio", "mp3", "synthesized"
+
+    def get_health(self):
+        return {'status': 'ok'}
+
+class ImpostorHandler(BaseHTTPRequestHandler):
+    """Answers like a healthy daemon without knowing the token"""
+    received = []
+
+    def do_GET(self):
+        self._reply(json.dumps({'status': 'ok'}).encode('utf-8'))
+
+    def do_POST(self):
+        self.received.append(self.rfile.read(int(self.headers['Content-Length'])))
+        self._reply(b"audio")
+
+    def _reply(self, body):
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def token(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return write_token_file(get_token_path())
+
+def serve(server):
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return DaemonClient(port=server.server_address[1])
+
+def test_daemon_answers_the_challenge(token):
+    service = FakeService()
+    server = SynthesisDaemon(("127.0.0.1", 0), service, token=token)
+    try:
+        client = serve(server)
+        assert client.is_available()
+        audio, source = client.synthesize('polly', "Hello", "Joanna", 'mp3', credentials=CREDENTIALS)
+        assert (audio, source) == (b"audio", "synthesized")
+        request, authorized = service.requests[0]
+        assert authorized
+        assert request['credentials']['secret_access_key'] == "secret-key"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_credentials_are_not_sent_to_an_impostor(token):
+    ImpostorHandler.received = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), ImpostorHandler)
+    try:
+        client = serve(server)
+        assert not client.is_available()
+        with pytest.raises(DaemonUnavailableError):
+            client.synthesize('polly', "Hello", "Joanna", 'mp3', credentials=CREDENTIALS)
+        assert ImpostorHandler.received == []
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_daemon_with_another_token_is_rejected(token):
+    server = SynthesisDaemon(("127.0.0.1", 0), FakeService(), token="not-the-token-on-disk")
+    try:
+        client = serve(server)
+        with pytest.raises(DaemonUnavailableError):
+            client.synthesize('polly', "Hello", "Joanna", 'mp3', credentials=CREDENTIALS)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+def test_cancel_check_interrupts_a_slow_request(token):
+    server = SynthesisDaemon(("127.0.0.1", 0), FakeService(delay=1.0), token=token)
+    cancelled = threading.Event()
+
+    class Cancelled(Exception):
+        pass
+
+    def cancel_check():
+        if cancelled.is_set():
+            raise Cancelled()
+
+    try:
+        client = serve(server)
+        threading.Timer(0.2, cancelled.set).start()
+        started = time.monotonic()
+        with pytest.raises(Cancelled):
+            client.synthesize('polly', "Hello", "Joanna", 'mp3', credentials=CREDENTIALS, cancel_check=cancel_check)
+        assert time.monotonic() - started < 0.8
+    finally:
+        server.shutdown()
+        server.server_close()
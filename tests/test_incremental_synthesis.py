@@ -0,0 +1,85 @@
+import threading
+
+from managers.incremental_synthesis import IncrementalSynthesizer
+from managers.text_chunker import chunk_text
+
+MAX_CHARS = 3000
+PARAGRAPHS = [" ".join(f"Paragraph {p} sentence {s} says something about the topic." for s in range(20))
+              for p in range(8)]
+TEXT = "\n\n".join(PARAGRAPHS)
+
+class FakeProvider:
+    """Synthesizes text to its own bytes and counts the requests"""
+    def __init__(self):
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, text):
+        with self._lock:
+            self.requests.append(text)
+        return text.encode("utf-8") + b"|"
+
+def expected_audio(segments):
+    return b"".join(segment.encode("utf-8") + b"|" for segment in segments)
+
+def saved_synthesizer():
+    synthesizer = IncrementalSynthesizer(MAX_CHARS)
+    synthesizer.synthesize(TEXT, "voice-a", 'pcm', FakeProvider())
+    return synthesizer
+
+def test_first_document_is_sent_as_sentence_groups():
+    provider = FakeProvider()
+    synthesizer = IncrementalSynthesizer(MAX_CHARS)
+    audio, stats = synthesizer.synthesize(TEXT, "voice-a", 'pcm', provider)
+    segments = chunk_text(TEXT, IncrementalSynthesizer.DEFAULT_SEGMENT_CHARS)
+    assert sorted(provider.requests) == sorted(segments)
+    assert all(len(request) <= IncrementalSynthesizer.DEFAULT_SEGMENT_CHARS for request in provider.requests)
+    # Every word is billed exactly once, as with full-size requests
+    assert " ".join(segments).split() == TEXT.split()
+    assert stats['segments'] == stats['synthesized_segments'] == len(segments)
+    assert IncrementalSynthesizer.format_stats(stats) == f"synthesized {len(segments)} segments"
+    assert audio == expected_audio(segments)
+
+def test_short_document_is_one_request():
+    provider = FakeProvider()
+    audio, _ = IncrementalSynthesizer(MAX_CHARS).synthesize("Just one sentence.", "voice-a", 'wav', provider)
+    assert provider.requests == ["Just one sentence."]
+    assert audio == b"Just one sentence.|"
+
+def test_one_word_edit_rebills_only_its_sentence_group():
+    synthesizer = saved_synthesizer()
+    edited = TEXT.replace("Paragraph 3 sentence 7 says", "Paragraph 3 sentence 7 claims")
+    provider = FakeProvider()
+    audio, stats = synthesizer.synthesize(edited, "voice-a", 'pcm', provider)
+
+    assert len(provider.requests) <= 2
+    assert any("sentence 7 claims" in request for request in provider.requests)
+    assert stats['synthesized_chars'] <= 2 * IncrementalSynthesizer.DEFAULT_SEGMENT_CHARS
+    assert stats['synthesized_chars'] < stats['total_chars'] / 10
+    segments = synthesizer.split(edited, synthesizer._get_map("voice-a"))
+    assert audio == expected_audio(segments)
+    assert b" ".join(audio.split(b"|")).decode("utf-8").split() == edited.split()
+
+def test_unchanged_document_makes_no_requests():
+    synthesizer = IncrementalSynthesizer(MAX_CHARS)
+    first, _ = synthesizer.synthesize(TEXT, "voice-a", 'pcm', FakeProvider())
+    provider = FakeProvider()
+    second, stats = synthesizer.synthesize(TEXT, "voice-a", 'pcm', provider)
+    assert provider.requests == []
+    assert second == first
+    assert stats['synthesized_chars'] == 0
+
+def test_settings_keys_do_not_share_audio():
+    synthesizer = saved_synthesizer()
+    provider = FakeProvider()
+    _, stats = synthesizer.synthesize(TEXT, "voice-b", 'pcm', provider)
+    assert stats['synthesized_segments'] == stats['segments'] == len(provider.requests)
+
+def test_split_keeps_previous_segments_as_anchors():
+    synthesizer = saved_synthesizer()
+    previous = synthesizer._get_map("voice-a")
+
+    inserted = "A brand new opening sentence. " + TEXT
+    segments = synthesizer.split(inserted, previous)
+    assert segments[0] == "A brand new opening sentence."
+    assert segments[1:] == previous.segments
@@ -0,0 +1,100 @@
+import threading
+
+from managers.play_queue import PlayQueue, PlayQueueItem
+from managers.playback_engine import NullSink, PlaybackEngine
+
+def make_engine(sink=None):
+    return PlaybackEngine(sink=sink or NullSink(), buffer_seconds=1, realtime=False)
+
+def test_play_queue_plays_in_order_and_skips_failures():
+    sink = NullSink()
+    engine = make_engine(sink)
+    queue = PlayQueue(engine, lookahead=2)
+    try:
+        def clip(size):
+            return lambda job: bytes(size)
+
+        def fail(job):
+            raise RuntimeError("synthesis failed")
+
+        queue.add("one", clip(3200), 16000)
+        queue.add("two", fail, 16000)
+        queue.add("three", clip(1600), 16000)
+        queue.play()
+        queue._runner.join(timeout=5)
+
+        states = [(label, state) for label, state, _ in queue.get_items()]
+        assert states == [("one", PlayQueueItem.PLAYED), ("two", PlayQueueItem.FAILED),
+                          ("three", PlayQueueItem.PLAYED)]
+        assert sink.bytes_written == 3200 + 1600
+    finally:
+        engine.shutdown()
+
+def test_play_queue_stop_ignores_synthesis_that_finishes_later():
+    engine = make_engine()
+    queue = PlayQueue(engine)
+    started = threading.Event()
+    release = threading.Event()
+    try:
+        def slow(job):
+            started.set()
+            release.wait(5)
+            return bytes(100)
+
+        queue.add("slow", slow, 16000)
+        queue.play()
+        assert started.wait(5)
+        queue.stop()
+        queue._runner.join(timeout=5)
+        release.set()
+        # Let the abandoned prefetch finish
+        queue._executor.shutdown(wait=True)
+        assert queue.get_items() == [("slow", PlayQueueItem.PENDING, None)]
+    finally:
+        engine.shutdown()
+
+def test_replay_retries_failed_prompts():
+    sink = NullSink()
+    engine = make_engine(sink)
+    queue = PlayQueue(engine)
+    attempts = []
+    try:
+        def flaky(job):
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("throttled")
+            return bytes(320)
+
+        queue.add("flaky", flaky, 16000)
+        queue.play()
+        queue._runner.join(timeout=5)
+        assert queue.get_items() == [("flaky", PlayQueueItem.FAILED, "throttled")]
+
+        queue.play()
+        queue._runner.join(timeout=5)
+        assert queue.get_items() == [("flaky", PlayQueueItem.PLAYED, None)]
+        assert len(attempts) == 2
+        assert sink.bytes_written == 320
+    finally:
+        engine.shutdown()
+
+def test_stop_counts_cancelled_prefetches():
+    engine = make_engine()
+    queue = PlayQueue(engine, lookahead=2)
+    started = threading.Event()
+    release = threading.Event()
+    try:
+        def slow(job):
+            started.set()
+            release.wait(5)
+            return bytes(100)
+
+        for n in range(3):
+            queue.add(f"slow {n}", slow, 16000)
+        queue.play()
+        assert started.wait(5)
+        assert queue.stop() == 3
+        assert queue.stop() == 0
+    finally:
+        release.set()
+        engine.shutdown()
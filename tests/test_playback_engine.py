@@ -0,0 +1,104 @@
+import sys
+
+import pytest
+
+from managers.audio_assembler import build_wav_header
+from managers.playback_engine import NullSink, PCMRingBuffer, PipeSink, PlaybackEngine
+
+def test_ring_buffer_wraps_around():
+    ring = PCMRingBuffer(8)
+    ring.write(b"abcdef")
+    assert ring.read(4) == b"abcd"
+    ring.write(b"ghijkl")
+    assert ring.available() == 8
+    assert ring.free_space() == 0
+    assert ring.read(8) == b"efghijkl"
+
+def test_ring_buffer_seek_is_clamped_to_retained_audio():
+    ring = PCMRingBuffer(8)
+    ring.write(b"abcdefgh")
+    ring.read(8)
+    ring.write(b"ijkl")
+    ring.seek(0)
+    # The first four bytes were overwritten
+    assert ring.read_pos == ring.oldest_pos() == 4
+    assert ring.read(8) == b"efghijkl"
+    ring.seek(100)
+    assert ring.available() == 0
+
+def make_engine(sink=None):
+    return PlaybackEngine(sink=sink or NullSink(), buffer_seconds=1, realtime=False)
+
+def test_engine_plays_pcm_through_sink():
+    sink = NullSink()
+    engine = make_engine(sink)
+    try:
+        # Longer than the one-second buffer, so play() has to wait for the output thread
+        pcm = bytes(3 * 16000 * 2)
+        clip_id = engine.play(pcm, 16000)
+        assert engine.wait(clip_id, timeout=5)
+        assert engine.is_current(clip_id)
+        assert sink.bytes_written == len(pcm)
+        status = engine.get_status()
+        assert status['state'] == PlaybackEngine.STOPPED
+        assert status['complete']
+        assert status['position'] == status['duration'] == pytest.approx(3.0)
+    finally:
+        engine.shutdown()
+
+def test_engine_reads_format_from_wav():
+    engine = make_engine()
+    try:
+        pcm = bytes(2 * 8000)
+        clip_id = engine.play(build_wav_header(len(pcm), 8000, channels=2) + pcm)
+        assert engine.wait(clip_id, timeout=5)
+        assert (engine.sample_rate, engine.channels) == (8000, 2)
+        assert engine.get_status()['duration'] == pytest.approx(0.5)
+    finally:
+        engine.shutdown()
+
+def test_stop_ends_clip_and_rejects_further_writes():
+    engine = make_engine()
+    try:
+        clip_id = engine.start_clip(16000)
+        engine.pause()
+        assert engine.write(clip_id, bytes(1000))
+        engine.stop(clip_id)
+        assert engine.wait(clip_id, timeout=1)
+        assert not engine.is_current(clip_id)
+        assert not engine.write(clip_id, bytes(1000))
+    finally:
+        engine.shutdown()
+
+def test_engine_without_sink_is_unavailable():
+    engine = PlaybackEngine(sink_factory=lambda: None)
+    assert not engine.is_available()
+    with pytest.raises(RuntimeError):
+        engine.start_clip(16000)
+
+class CountingPipeSink(PipeSink):
+    """Player process that dies after reading a little audio the first time it is started"""
+    def __init__(self):
+        super().__init__(self._command)
+        self.opened = 0
+
+    def _command(self, sample_rate, channels):
+        self.opened += 1
+        script = "import sys; sys.stdin.buffer.read(100)" if self.opened == 1 else "import sys; sys.stdin.buffer.read()"
+        return [sys.executable, "-c", script]
+
+def test_dead_player_is_restarted_for_the_next_clip():
+    sink = CountingPipeSink()
+    engine = make_engine(sink)
+    try:
+        # Far more than a pipe buffer, so writes fail once the first player exits
+        first = engine.play(bytes(4 * 1024 * 1024), 16000)
+        assert engine.wait(first, timeout=10)
+        assert not engine.is_current(first)
+
+        second = engine.play(bytes(32000), 16000)
+        assert engine.wait(second, timeout=10)
+        assert engine.is_current(second)
+        assert sink.opened == 2
+    finally:
+        engine.shutdown()
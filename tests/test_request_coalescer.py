@@ -0,0 +1,73 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from managers.request_coalescer import RequestCoalescer
+
+def wait_until(condition, timeout=5.0):
+    """Poll condition without spinning forever, so a regression fails instead of hanging"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+def test_concurrent_identical_calls_run_once():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def synthesize():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return b"audio"
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        leader = executor.submit(coalescer.run, "key", synthesize)
+        assert started.wait(5)
+        followers = [executor.submit(coalescer.run, "key", synthesize) for _ in range(4)]
+        assert wait_until(lambda: coalescer.get_stats()['coalesced'] == 4)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert results[0] == (b"audio", False)
+    assert results[1:] == [(b"audio", True)] * 4
+    assert coalescer.get_stats() == {'executed': 1, 'coalesced': 4, 'in_flight': 0}
+
+def test_different_keys_do_not_share():
+    coalescer = RequestCoalescer()
+    assert coalescer.run("a", lambda: 1) == (1, False)
+    assert coalescer.run("b", lambda: 2) == (2, False)
+
+def test_finished_call_is_not_reused():
+    coalescer = RequestCoalescer()
+    coalescer.run("key", lambda: 1)
+    assert coalescer.run("key", lambda: 2) == (2, False)
+    assert coalescer.in_flight() == 0
+
+def test_error_reaches_every_waiter():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+
+    def fail():
+        started.set()
+        release.wait(5)
+        raise RuntimeError("throttled")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(coalescer.run, "key", fail)
+        assert started.wait(5)
+        follower = executor.submit(coalescer.run, "key", fail)
+        assert wait_until(lambda: coalescer.get_stats()['coalesced'] == 1)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match="throttled"):
+                future.result()
+    assert coalescer.in_flight() == 0
@@ -0,0 +1,66 @@
+import os
+
+from managers.synthesis_cache import SynthesisCache
+
+def make_cache(tmp_path, max_bytes=1000):
+    return SynthesisCache(str(tmp_path / "audio"), max_bytes)
+
+def age(cache, key, seconds_ago):
+    """Backdate an entry so eviction order does not depend on filesystem timestamp resolution"""
+    path = cache._path_for(key)
+    mtime = os.path.getmtime(path) - seconds_ago
+    os.utime(path, (mtime, mtime))
+
+def test_key_ignores_whitespace_differences_only():
+    key = SynthesisCache.make_key('polly', 'Joanna', 'neural', 'mp3', 24000, "Hello   world\n")
+    assert key == SynthesisCache.make_key('polly', 'Joanna', 'neural', 'mp3', '24000', "Hello world")
+    assert key != SynthesisCache.make_key('polly', 'Joanna', 'standard', 'mp3', 24000, "Hello world")
+    assert key != SynthesisCache.make_key('polly', 'Joanna', 'neural', 'mp3', 24000, "hello world")
+
+def test_put_get_and_stats(tmp_path):
+    cache = make_cache(tmp_path)
+    assert cache.get("a" * 64) is None
+    cache.put("a" * 64, b"audio")
+    assert cache.contains("a" * 64)
+    assert cache.get("a" * 64) == b"audio"
+    assert cache.get_stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+
+def test_eviction_removes_least_recently_used_first(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=300)
+    keys = [c * 64 for c in "abc"]
+    for i, key in enumerate(keys):
+        cache.put(key, bytes(100))
+        age(cache, key, 100 - i * 10)
+
+    # Reading "a" makes "b" the least recently used entry
+    assert cache.get(keys[0]) is not None
+    cache.put("d" * 64, bytes(100))
+
+    assert not cache.contains(keys[1])
+    assert all(cache.contains(key) for key in (keys[0], keys[2], "d" * 64))
+
+def test_eviction_brings_cache_under_budget(tmp_path):
+    cache = make_cache(tmp_path, max_bytes=250)
+    for i in range(10):
+        key = f"{i:02d}" * 32
+        cache.put(key, bytes(100))
+        age(cache, key, 100 - i)
+    remaining = [f"{i:02d}" * 32 for i in range(10) if cache.contains(f"{i:02d}" * 32)]
+    assert remaining == ["08" * 32, "09" * 32]
+
+def test_existing_entries_count_toward_budget(tmp_path):
+    make_cache(tmp_path, max_bytes=1000).put("a" * 64, bytes(600))
+    # A new instance over the same directory scans it on its first write
+    cache = make_cache(tmp_path, max_bytes=1000)
+    age(cache, "a" * 64, 100)
+    cache.put("b" * 64, bytes(600))
+    assert not cache.contains("a" * 64)
+    assert cache.contains("b" * 64)
+
+def test_clear_removes_everything(tmp_path):
+    cache = make_cache(tmp_path)
+    cache.put("a" * 64, b"x")
+    cache.put("b" * 64, b"y")
+    cache.clear()
+    assert not cache.contains("a" * 64)
+    assert not cache.contains("b" * 64)
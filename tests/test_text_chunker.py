@@ -0,0 +1,38 @@
+from managers.text_chunker import chunk_text, split_sentences
+
+def test_split_sentences_keeps_every_character():
+    text = 'One. Two! "Three?" Four\n\nFive'
+    sentences = split_sentences(text)
+    assert sentences == ['One. ', 'Two! ', '"Three?" ', 'Four\n\n', 'Five']
+    assert "".join(sentences) == text
+
+def test_short_text_is_one_chunk():
+    assert chunk_text("Hello there. General Kenobi.", 100) == ["Hello there. General Kenobi."]
+
+def test_blank_text_has_no_chunks():
+    assert chunk_text("  \n\n ", 100) == []
+
+def test_chunks_respect_max_chars_and_sentence_boundaries():
+    text = " ".join(f"Sentence number {i} is here." for i in range(50))
+    chunks = chunk_text(text, 100)
+    assert len(chunks) > 1
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert all(chunk.endswith(".") for chunk in chunks)
+    assert " ".join(chunks) == text
+
+def test_sentence_exactly_max_chars_fills_a_chunk():
+    sentence = "a" * 19 + "."
+    chunks = chunk_text(f"{sentence} {sentence}", 20)
+    assert chunks == [sentence, sentence]
+
+def test_long_sentence_breaks_at_clause_then_word():
+    text = "alpha beta, gamma delta epsilon zeta eta theta iota kappa."
+    chunks = chunk_text(text, 20)
+    assert chunks[0] == "alpha beta,"
+    assert all(len(chunk) <= 20 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
+
+def test_word_longer_than_max_chars_is_hard_split():
+    chunks = chunk_text("x" * 25, 10)
+    assert all(len(chunk) <= 10 for chunk in chunks)
+    assert "".join(chunks) == "x" * 25